@@ -0,0 +1,342 @@
+"""
+Lightweight ABI Codec
+
+REDEEMABLE_AIRDROP_ABI(와 ERC-20 decimals)의 함수/이벤트만 처리하는 작은 ABI codec입니다.
+selector와 event topic을 import 시점에 한 번 계산해 두고, web3 Contract 객체 없이
+eth_call 데이터 인코딩, 반환값 디코딩, 이벤트 로그 디코딩을 수행합니다.
+
+web3 전체를 import하지 않으므로 CLI 시작 시간이 짧고, web3가 eth_call마다 보내는
+eth_chainId 요청도 발생하지 않습니다. 지원 타입: uintN, intN, address, bool, bytes32 등
+고정 길이 bytesN, string, bytes, 그리고 이들의 동적 배열(T[]).
+
+고정 레이아웃(정적 타입만) 반환값과 이벤트는 여러 개를 하나의 버퍼로 이어 붙여
+필드별 column으로 한 번에 디코딩할 수 있습니다 (decode_output_batch, decode_logs_batch).
+"""
+
+from typing import Any, NamedTuple
+
+from eth_hash.auto import keccak
+
+from settings import ERC20_ABI, REDEEMABLE_AIRDROP_ABI
+
+WORD = 32
+
+
+class AbiDecodeError(ValueError):
+    """반환 데이터가 ABI 타입과 맞지 않음 (빈 응답, 길이 부족 등)"""
+
+
+class AbiFunction(NamedTuple):
+    """컴파일된 함수 (selector, 입력/출력 타입)"""
+
+    name: str
+    selector: bytes  # 4 bytes
+    input_types: tuple[str, ...]
+    output_types: tuple[str, ...]
+
+
+class AbiEvent(NamedTuple):
+    """컴파일된 이벤트 (topic0, indexed/data 필드)"""
+
+    name: str
+    topic0: str  # 0x + 64자리 소문자 hex
+    indexed: tuple[tuple[str, str], ...]  # (이름, 타입), topics[1:] 순서
+    data: tuple[tuple[str, str], ...]  # (이름, 타입), data 순서
+
+
+# =============================================================================
+# Hashing / Address
+# =============================================================================
+
+
+def keccak_text(text: str) -> bytes:
+    """문자열의 keccak256 해시 (캠페인 이름 → 캠페인 해시)"""
+    return keccak(text.encode("utf-8"))
+
+
+def to_checksum_address(address: str | bytes) -> str:
+    """EIP-55 checksum 주소로 변환
+
+    Raises:
+        ValueError: 20바이트 주소가 아닌 경우
+    """
+    if isinstance(address, bytes):
+        hex_address = address.hex()
+    else:
+        hex_address = address.lower().removeprefix("0x")
+    if len(hex_address) != 40:
+        raise ValueError(f"Invalid address: {address!r}")
+    int(hex_address, 16)
+    digest = keccak(hex_address.encode("ascii")).hex()
+    return "0x" + "".join(
+        c.upper() if int(d, 16) >= 8 else c for c, d in zip(hex_address, digest)
+    )
+
+
+# =============================================================================
+# Compile
+# =============================================================================
+
+
+def _signature(item: dict) -> str:
+    return f"{item['name']}({','.join(i['type'] for i in item['inputs'])})"
+
+
+def compile_abi(abi: list[dict]) -> tuple[dict[str, AbiFunction], dict[str, AbiEvent]]:
+    """ABI에서 함수 selector와 이벤트 topic0을 미리 계산"""
+    functions, events = {}, {}
+    for item in abi:
+        if item.get("type") == "function":
+            functions[item["name"]] = AbiFunction(
+                item["name"],
+                keccak(_signature(item).encode("ascii"))[:4],
+                tuple(i["type"] for i in item["inputs"]),
+                tuple(o["type"] for o in item.get("outputs", [])),
+            )
+        elif item.get("type") == "event":
+            events[item["name"]] = AbiEvent(
+                item["name"],
+                "0x" + keccak(_signature(item).encode("ascii")).hex(),
+                tuple((i["name"], i["type"]) for i in item["inputs"] if i.get("indexed")),
+                tuple((i["name"], i["type"]) for i in item["inputs"] if not i.get("indexed")),
+            )
+    return functions, events
+
+
+FUNCTIONS, EVENTS = compile_abi(REDEEMABLE_AIRDROP_ABI)
+ERC20_FUNCTIONS, _ = compile_abi(ERC20_ABI)
+
+# eth_call selector(0x + 8자리 hex) → 함수 이름 (RPC 측정 라벨용)
+SELECTOR_LABELS = {
+    "0x" + fn.selector.hex(): name for name, fn in (ERC20_FUNCTIONS | FUNCTIONS).items()
+}
+
+
+# =============================================================================
+# Encoding
+# =============================================================================
+
+
+def _is_dynamic(abi_type: str) -> bool:
+    return abi_type.endswith("[]") or abi_type in ("string", "bytes")
+
+
+def _encode_static(abi_type: str, value: Any) -> bytes:
+    if abi_type == "address":
+        return bytes.fromhex(to_checksum_address(value)[2:]).rjust(WORD, b"\0")
+    if abi_type == "bool":
+        return (1 if value else 0).to_bytes(WORD, "big")
+    if abi_type.startswith("uint"):
+        return int(value).to_bytes(WORD, "big")
+    if abi_type.startswith("int"):
+        return int(value).to_bytes(WORD, "big", signed=True)
+    if abi_type.startswith("bytes"):
+        raw = bytes.fromhex(value.removeprefix("0x")) if isinstance(value, str) else bytes(value)
+        size = int(abi_type[5:])
+        if len(raw) > size:
+            raise ValueError(f"{abi_type} value is {len(raw)} bytes")
+        return raw.ljust(WORD, b"\0")
+    raise ValueError(f"Unsupported ABI type: {abi_type}")
+
+
+def _encode_dynamic(abi_type: str, value: Any) -> bytes:
+    if abi_type.endswith("[]"):
+        return len(value).to_bytes(WORD, "big") + encode_values((abi_type[:-2],) * len(value), value)
+    raw = value.encode("utf-8") if isinstance(value, str) else bytes(value)
+    padded = raw.ljust((len(raw) + WORD - 1) // WORD * WORD, b"\0")
+    return len(raw).to_bytes(WORD, "big") + padded
+
+
+def encode_values(types: tuple[str, ...], values: tuple | list) -> bytes:
+    """값 목록을 ABI head/tail 형식으로 인코딩"""
+    if len(types) != len(values):
+        raise ValueError(f"Expected {len(types)} argument(s), got {len(values)}")
+    heads, tails = [], []
+    offset = WORD * len(types)
+    for abi_type, value in zip(types, values):
+        if _is_dynamic(abi_type):
+            tail = _encode_dynamic(abi_type, value)
+            heads.append(offset.to_bytes(WORD, "big"))
+            tails.append(tail)
+            offset += len(tail)
+        else:
+            heads.append(_encode_static(abi_type, value))
+    return b"".join(heads) + b"".join(tails)
+
+
+def encode_call(fn: AbiFunction, *args: Any) -> str:
+    """eth_call data (0x hex) 생성"""
+    return "0x" + (fn.selector + encode_values(fn.input_types, args)).hex()
+
+
+# =============================================================================
+# Decoding
+# =============================================================================
+
+
+def _word(data: bytes, offset: int) -> bytes:
+    if offset + WORD > len(data):
+        raise AbiDecodeError(f"Insufficient data: need {offset + WORD} bytes, got {len(data)}")
+    return data[offset:offset + WORD]
+
+
+def _decode_static(abi_type: str, word: bytes) -> Any:
+    if abi_type == "address":
+        return to_checksum_address(word[12:])
+    if abi_type == "bool":
+        return word[-1] != 0
+    if abi_type.startswith("uint"):
+        return int.from_bytes(word, "big")
+    if abi_type.startswith("int"):
+        return int.from_bytes(word, "big", signed=True)
+    if abi_type.startswith("bytes"):
+        return word[:int(abi_type[5:])]
+    raise AbiDecodeError(f"Unsupported ABI type: {abi_type}")
+
+
+def _decode_at(abi_type: str, data: bytes, offset: int) -> Any:
+    """offset 위치의 head word에서 값 하나 디코딩 (동적 타입은 offset을 따라감)"""
+    word = _word(data, offset)
+    if not _is_dynamic(abi_type):
+        return _decode_static(abi_type, word)
+
+    start = int.from_bytes(word, "big")
+    length = int.from_bytes(_word(data, start), "big")
+    body = data[start + WORD:]
+    if abi_type.endswith("[]"):
+        return decode_values((abi_type[:-2],) * length, body)
+    if len(body) < length:
+        raise AbiDecodeError(f"Insufficient data for {abi_type}")
+    raw = body[:length]
+    return raw.decode("utf-8") if abi_type == "string" else raw
+
+
+def decode_values(types: tuple[str, ...], data: bytes) -> tuple:
+    """ABI 인코딩된 데이터를 값 tuple로 디코딩
+
+    Raises:
+        AbiDecodeError: 데이터가 타입보다 짧은 경우 (예: 컨트랙트가 없는 주소의 빈 응답)
+    """
+    return tuple(_decode_at(abi_type, data, i * WORD) for i, abi_type in enumerate(types))
+
+
+def decode_output(fn: AbiFunction, data: bytes | str) -> tuple:
+    """eth_call 반환값 디코딩"""
+    if isinstance(data, str):
+        data = bytes.fromhex(data.removeprefix("0x"))
+    return decode_values(fn.output_types, data)
+
+
+def decode_log(event: AbiEvent, log: dict) -> dict[str, Any]:
+    """eth_getLogs 로그 하나의 인자 디코딩 ({인자 이름: 값})"""
+    topics = log["topics"]
+    if len(topics) != len(event.indexed) + 1:
+        raise AbiDecodeError(f"{event.name}: expected {len(event.indexed) + 1} topics, got {len(topics)}")
+    args = {
+        name: _decode_static(abi_type, bytes.fromhex(topic.removeprefix("0x")))
+        for (name, abi_type), topic in zip(event.indexed, topics[1:])
+    }
+    data = bytes.fromhex(log["data"].removeprefix("0x"))
+    args.update(zip((name for name, _ in event.data), decode_values(tuple(t for _, t in event.data), data)))
+    return args
+
+
+def encode_topic(abi_type: str, value: Any) -> str:
+    """indexed 인자 값을 topic 필터(0x + 64자리 hex)로 인코딩"""
+    return "0x" + _encode_static(abi_type, value).hex()
+
+
+# =============================================================================
+# Batch Decoding (columnar)
+# =============================================================================
+
+
+def _decode_column(abi_type: str, view: memoryview, offset: int, stride: int) -> list:
+    """연속 버퍼에서 stride 간격으로 놓인 word들을 하나의 column으로 디코딩"""
+    end = len(view)
+    if abi_type == "bool":
+        # 각 word의 마지막 바이트만 stride 간격으로 잘라냄
+        return [b != 0 for b in view[offset + WORD - 1:end:stride]]
+    if abi_type.startswith("uint"):
+        return [int.from_bytes(view[i:i + WORD], "big") for i in range(offset, end, stride)]
+    if abi_type.startswith("int"):
+        return [int.from_bytes(view[i:i + WORD], "big", signed=True) for i in range(offset, end, stride)]
+    if abi_type == "address":
+        # 같은 주소가 반복되므로 checksum 계산(keccak)은 주소당 한 번만
+        checksums: dict[bytes, str] = {}
+        column = []
+        for i in range(offset, end, stride):
+            raw = view[i + 12:i + WORD].tobytes()
+            address = checksums.get(raw)
+            if address is None:
+                address = checksums[raw] = to_checksum_address(raw)
+            column.append(address)
+        return column
+    if abi_type.startswith("bytes"):
+        size = int(abi_type[5:])
+        return [view[i:i + size].tobytes() for i in range(offset, end, stride)]
+    raise AbiDecodeError(f"Unsupported ABI type: {abi_type}")
+
+
+def decode_columns(types: tuple[str, ...], data: bytes) -> tuple[list, ...]:
+    """고정 길이 레코드를 이어 붙인 버퍼를 필드별 column으로 디코딩
+
+    data는 len(types) word짜리 레코드를 여러 개 이어 붙인 것이며,
+    결과는 필드마다 레코드 수만큼의 값을 담은 list입니다.
+
+    Raises:
+        AbiDecodeError: 동적 타입이 있거나 버퍼 길이가 레코드 크기의 배수가 아닌 경우
+    """
+    if any(_is_dynamic(abi_type) for abi_type in types):
+        raise AbiDecodeError(f"Batch decoding needs a fixed layout: {types}")
+    stride = WORD * len(types)
+    if len(data) % stride:
+        raise AbiDecodeError(f"Buffer of {len(data)} bytes is not a multiple of {stride}-byte records")
+    view = memoryview(data)
+    return tuple(_decode_column(abi_type, view, i * WORD, stride) for i, abi_type in enumerate(types))
+
+
+def decode_output_batch(fn: AbiFunction, results: list[str]) -> tuple[list, ...]:
+    """같은 함수의 eth_call 반환값(0x hex) 여러 개를 한 번에 디코딩
+
+    Raises:
+        AbiDecodeError: 반환값 길이가 출력 레이아웃과 다른 경우
+    """
+    size = 2 + 2 * WORD * len(fn.output_types)
+    for result in results:
+        if len(result) != size:
+            raise AbiDecodeError(f"{fn.name}: expected {size - 2} hex digits, got {len(result) - 2}")
+    return decode_columns(fn.output_types, bytes.fromhex("".join(result[2:] for result in results)))
+
+
+def log_matches(event: AbiEvent, topics: list[str], data: str) -> bool:
+    """topics/data가 event의 고정 레이아웃과 맞는지 (decode_logs_batch 입력 검사용)"""
+    return (
+        len(topics) == len(event.indexed) + 1
+        and topics[0].lower() == event.topic0
+        and len(data) == 2 + 2 * WORD * len(event.data)
+    )
+
+
+def decode_logs_batch(event: AbiEvent, logs: list[dict]) -> dict[str, list]:
+    """같은 이벤트의 로그 여러 개를 한 번에 디코딩 ({인자 이름: column})
+
+    모든 로그의 indexed topic과 data를 각각 하나의 버퍼로 이어 붙여 column 단위로 디코딩합니다.
+
+    Raises:
+        AbiDecodeError: topics/data가 이벤트 레이아웃과 맞지 않는 로그가 있는 경우
+    """
+    for log in logs:
+        if not log_matches(event, log["topics"], log["data"]):
+            raise AbiDecodeError(f"{event.name}: log does not match the event layout")
+
+    columns: dict[str, list] = {}
+    if event.indexed:
+        topics = bytes.fromhex("".join(topic[2:] for log in logs for topic in log["topics"][1:]))
+        values = decode_columns(tuple(t for _, t in event.indexed), topics)
+        columns.update(zip((name for name, _ in event.indexed), values))
+    if event.data:
+        data = bytes.fromhex("".join(log["data"][2:] for log in logs))
+        values = decode_columns(tuple(t for _, t in event.data), data)
+        columns.update(zip((name for name, _ in event.data), values))
+    return columns
@@ -0,0 +1,86 @@
+"""
+Token Amounts
+
+토큰 금액은 조회와 집계 동안 최소 단위 정수(wei 등) 그대로 다루고, 출력할 때만
+토큰의 소수 자릿수(decimals)로 Decimal 변환해 정확하게 포맷합니다 (float 변환 없음).
+토큰별 decimals는 ERC-20 decimals()로 토큰마다 한 번만 조회해 TOKEN_DECIMALS에 캐시합니다.
+"""
+
+import threading
+from collections.abc import Callable
+from decimal import Decimal
+from typing import NamedTuple
+
+from settings import AMOUNT_DISPLAY_PLACES, AMOUNT_TOTAL_DECIMALS, DEFAULT_TOKEN_DECIMALS
+
+
+class TokenAmount(NamedTuple):
+    """최소 단위 정수 금액과 토큰 decimals"""
+
+    raw: int
+    decimals: int = DEFAULT_TOKEN_DECIMALS
+
+    def to_decimal(self) -> Decimal:
+        """토큰 단위 Decimal (정밀도 손실 없음)"""
+        return Decimal(f"{self.raw}e-{self.decimals}")
+
+    def format(self, places: int = AMOUNT_DISPLAY_PLACES, grouping: bool = False) -> str:
+        """소수점 places자리 문자열 (grouping이면 천 단위 구분 기호)"""
+        return f"{self.to_decimal():{',' if grouping else ''}.{places}f}"
+
+    def __str__(self) -> str:
+        return self.format()
+
+
+def format_amount(
+    raw: int,
+    decimals: int = DEFAULT_TOKEN_DECIMALS,
+    places: int = AMOUNT_DISPLAY_PLACES,
+    grouping: bool = False,
+) -> str:
+    """최소 단위 정수 금액을 토큰 단위 문자열로 포맷"""
+    return TokenAmount(raw, decimals).format(places, grouping)
+
+
+def total_scale(decimals: int) -> int:
+    """decimals 토큰 금액을 합계 단위(AMOUNT_TOTAL_DECIMALS)로 맞추는 배수
+
+    decimals가 다른 토큰의 리워드도 정수 그대로 합산할 수 있게 합니다.
+    AMOUNT_TOTAL_DECIMALS보다 decimals가 큰 토큰은 지원하지 않습니다 (배수 1).
+    """
+    return 10 ** max(AMOUNT_TOTAL_DECIMALS - decimals, 0)
+
+
+class TokenDecimals:
+    """토큰 주소별 decimals 캐시 (토큰마다 한 번만 조회, 여러 스레드에서 공유)"""
+
+    def __init__(self):
+        self._decimals: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token: str, fetch: Callable[[str], int | None] | None = None) -> int:
+        """토큰 decimals (캐시에 없으면 fetch로 조회)
+
+        Args:
+            fetch: 토큰 주소를 받아 decimals를 반환하는 함수. None을 반환하면
+                (일시적 오류) 캐시하지 않고 DEFAULT_TOKEN_DECIMALS를 사용합니다.
+                fetch가 없으면 조회하지 않습니다 (출력 시점).
+        """
+        key = token.lower()
+        decimals = self._decimals.get(key)
+        if decimals is not None or fetch is None:
+            return decimals if decimals is not None else DEFAULT_TOKEN_DECIMALS
+        with self._lock:
+            decimals = self._decimals.get(key)
+            if decimals is None:
+                decimals = fetch(token)
+                if decimals is None:
+                    return DEFAULT_TOKEN_DECIMALS
+                self._decimals[key] = decimals
+            return decimals
+
+    def set(self, token: str, decimals: int) -> None:
+        self._decimals[token.lower()] = decimals
+
+
+TOKEN_DECIMALS = TokenDecimals()
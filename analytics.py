@@ -0,0 +1,392 @@
+"""
+Claim Analytics
+
+로컬 이벤트 저장소(event_store.py)에 수집된 RewardsAdded/Claimed 이벤트로 수령 통계를 계산합니다.
+체인을 다시 조회하지 않으며, column을 한 번 순회해 캠페인/지갑별 행 인덱스로 group-by 한 뒤
+그룹마다 필요한 column만 모아서 집계합니다. --ingest를 주면 계산 전에 새 이벤트만 증분 수집합니다.
+
+- 캠페인별: 수령 건수, 고유 수령 지갑 수, 수령 수량, 수수료 합계, 기간별 수령 추이
+- 캠페인별 수령까지 걸린 시간 분포 (캠페인 시작 → Claimed 블록 시각)
+- 상위 수령 지갑
+
+Usage:
+    python analytics.py --network mainnet --ingest      # 새 이벤트 수집 후 통계
+    python analytics.py --network mainnet               # 저장된 이벤트로만 통계
+    python analytics.py --bucket week --top 20          # 주별 추이, 상위 20개 지갑
+    python analytics.py --format json > stats.json
+"""
+
+import argparse
+import heapq
+import json
+import math
+import sys
+import time
+from datetime import datetime, timezone
+from functools import partial
+from operator import itemgetter
+from pathlib import Path
+from typing import NamedTuple
+
+from amounts import format_amount, total_scale
+from event_store import EventStore, event_store_path
+from main import AirdropMonitor, get_campaign_name
+from settings import (
+    AMOUNT_TOTAL_DECIMALS,
+    ANALYTICS_TOP_CLAIMANTS,
+    DEFAULT_NETWORK,
+    DEFAULT_TOKEN_DECIMALS,
+    EVENT_STORE_DIR,
+    RPC_URLS,
+)
+
+BUCKETS = {"day": 86400, "week": 7 * 86400}
+
+
+class Distribution(NamedTuple):
+    """값 분포 요약 (초)"""
+
+    count: int
+    min: int
+    p50: int
+    p90: int
+    max: int
+    mean: float
+
+
+class CampaignStats(NamedTuple):
+    """캠페인 하나의 수령 통계 (금액은 캠페인 토큰 최소 단위)"""
+
+    contract_address: str
+    campaign_hash: str  # 0x 없는 소문자 hex
+    token: str  # RewardsAdded가 저장소에 없으면 빈 문자열
+    decimals: int
+    start_date: int | None
+    deadline: int | None
+    claims: int
+    unique_claimants: int
+    total_claimed: int
+    total_fee: int
+    claims_over_time: list[tuple[int, int, int]]  # (구간 시작 timestamp, 건수, 수량)
+    time_to_claim: Distribution | None
+
+
+class ClaimantStats(NamedTuple):
+    """지갑 하나의 수령 통계 (금액은 AMOUNT_TOTAL_DECIMALS 단위)"""
+
+    user: str
+    claims: int
+    campaigns: int
+    total_claimed: int
+    total_fee: int
+
+
+class ClaimAnalytics(NamedTuple):
+    """네트워크 하나의 수령 통계 (전체 금액은 AMOUNT_TOTAL_DECIMALS 단위)"""
+
+    network: str
+    rewards_added_events: int
+    claimed_events: int
+    claims: int
+    unique_claimants: int
+    total_claimed: int
+    total_fee: int
+    campaigns: list[CampaignStats]
+    top_claimants: list[ClaimantStats]
+
+
+# =============================================================================
+# Column Operations
+# =============================================================================
+
+
+def group_rows(keys: list) -> dict:
+    """key column을 한 번 순회해 {key: 행 인덱스 목록} 생성 (등장 순서 유지)"""
+    groups: dict = {}
+    for i, key in enumerate(keys):
+        rows = groups.get(key)
+        if rows is None:
+            groups[key] = [i]
+        else:
+            rows.append(i)
+    return groups
+
+
+def take(column: list, rows: list[int]) -> list:
+    """column에서 rows 위치의 값만 모음"""
+    if len(rows) == 1:
+        return [column[rows[0]]]
+    return list(itemgetter(*rows)(column))
+
+
+def distribution(values: list[int]) -> Distribution | None:
+    """값 목록의 분포 (nearest-rank 백분위수, 값이 없으면 None)"""
+    if not values:
+        return None
+    values = sorted(values)
+    n = len(values)
+
+    def rank(q: float) -> int:
+        return values[max(0, math.ceil(n * q) - 1)]
+
+    return Distribution(n, values[0], rank(0.5), rank(0.9), values[-1], sum(values) / n)
+
+
+# =============================================================================
+# Analytics
+# =============================================================================
+
+
+def analyze(
+    store: EventStore,
+    bucket: int = BUCKETS["day"],
+    top: int = ANALYTICS_TOP_CLAIMANTS,
+    campaign_hash: str | None = None,
+) -> ClaimAnalytics:
+    """저장된 이벤트로 캠페인별 통계와 상위 수령 지갑 계산
+
+    Args:
+        bucket: 수령 추이 구간 길이 (초)
+        top: 상위 수령 지갑 수
+        campaign_hash: 지정하면 해당 캠페인만 집계
+    """
+    added = store.columns["RewardsAdded"]
+    claimed = store.columns["Claimed"]
+
+    # 캠페인 정보: 같은 캠페인에 RewardsAdded가 여러 번 있으면 마지막 이벤트 기준
+    campaign_info = {
+        key: (token, start_date, deadline)
+        for key, token, start_date, deadline in zip(
+            zip(added["contract_address"], added["campaign_hash"]),
+            added["token"],
+            added["start_date"],
+            added["deadline"],
+        )
+    }
+
+    claim_keys = list(zip(claimed["contract_address"], claimed["campaign_hash"]))
+    groups = group_rows(claim_keys)
+    if campaign_hash is not None:
+        wanted = campaign_hash.lower().removeprefix("0x")
+        groups = {key: rows for key, rows in groups.items() if key[1] == wanted}
+
+    users, amounts, fees = claimed["user"], claimed["total_reward"], claimed["fee"]
+    block_times = store.block_times
+    claim_times = [block_times.get(block) for block in claimed["block_number"]]
+    row_scale = [1] * len(claim_keys)  # 행별 AMOUNT_TOTAL_DECIMALS 배수
+
+    campaigns = []
+    for key, rows in groups.items():
+        token, start_date, deadline = campaign_info.get(key, ("", None, None))
+        decimals = store.token_decimals.get(token.lower(), DEFAULT_TOKEN_DECIMALS)
+        scale = total_scale(decimals)
+        for i in rows:
+            row_scale[i] = scale
+
+        times = take(claim_times, rows)
+        claim_amounts = take(amounts, rows)
+        over_time: dict[int, list[int]] = {}
+        for t, amount in zip(times, claim_amounts):
+            if t is None:
+                continue
+            entry = over_time.setdefault(t - t % bucket, [0, 0])
+            entry[0] += 1
+            entry[1] += amount
+
+        to_claim = (
+            [t - start_date for t in times if t is not None and t >= start_date]
+            if start_date else []
+        )
+        campaigns.append(CampaignStats(
+            contract_address=key[0],
+            campaign_hash=key[1],
+            token=token,
+            decimals=decimals,
+            start_date=start_date,
+            deadline=deadline,
+            claims=len(rows),
+            unique_claimants=len({u.lower() for u in take(users, rows)}),
+            total_claimed=sum(claim_amounts),
+            total_fee=sum(take(fees, rows)),
+            claims_over_time=[(start, count, amount) for start, (count, amount) in sorted(over_time.items())],
+            time_to_claim=distribution(to_claim),
+        ))
+
+    # 지갑별 집계 (선택한 캠페인의 행만)
+    selected = sorted(i for rows in groups.values() for i in rows)
+    by_user = group_rows([users[i].lower() for i in selected])
+    claimants = []
+    for user, positions in by_user.items():
+        rows = take(selected, positions)
+        claimants.append(ClaimantStats(
+            user=users[rows[0]],
+            claims=len(rows),
+            campaigns=len(set(take(claim_keys, rows))),
+            total_claimed=sum(amounts[i] * row_scale[i] for i in rows),
+            total_fee=sum(fees[i] * row_scale[i] for i in rows),
+        ))
+
+    campaigns.sort(key=lambda c: (c.start_date or 0, c.contract_address, c.campaign_hash))
+    return ClaimAnalytics(
+        network=store.network,
+        rewards_added_events=store.count("RewardsAdded"),
+        claimed_events=store.count("Claimed"),
+        claims=len(selected),
+        unique_claimants=len(by_user),
+        total_claimed=sum(c.total_claimed for c in claimants),
+        total_fee=sum(c.total_fee for c in claimants),
+        campaigns=campaigns,
+        top_claimants=heapq.nlargest(top, claimants, key=lambda c: c.total_claimed),
+    )
+
+
+# =============================================================================
+# Rendering
+# =============================================================================
+
+
+def format_duration(seconds: float) -> str:
+    """초를 '2d 3h' 같은 짧은 형식으로 변환"""
+    seconds = int(seconds)
+    days, rest = divmod(seconds, 86400)
+    hours, rest = divmod(rest, 3600)
+    minutes, secs = divmod(rest, 60)
+    if days:
+        return f"{days}d {hours}h"
+    if hours:
+        return f"{hours}h {minutes}m"
+    if minutes:
+        return f"{minutes}m"
+    return f"{secs}s"
+
+
+def format_date(timestamp: int) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%d")
+
+
+def print_analytics(stats: ClaimAnalytics, bucket_name: str) -> None:
+    """통계를 사람이 읽는 형식으로 출력"""
+
+    def total(amount: int) -> str:
+        return format_amount(amount, AMOUNT_TOTAL_DECIMALS, grouping=True)
+
+    print("=" * 60)
+    print(f"Claim Analytics ({stats.network})")
+    print("=" * 60)
+    print(f"Events: {stats.rewards_added_events} RewardsAdded, {stats.claimed_events} Claimed")
+    print(f"Claims: {stats.claims} by {stats.unique_claimants} wallet(s)")
+    print(f"Claimed: {total(stats.total_claimed)}")
+    print(f"Fees: {total(stats.total_fee)}")
+
+    for c in stats.campaigns:
+        amount = partial(format_amount, decimals=c.decimals, grouping=True)
+        print(f"\n--- Campaign: {get_campaign_name(c.campaign_hash)} ---")
+        print(f"Hash: 0x{c.campaign_hash}")
+        print(f"Contract: {c.contract_address}")
+        if c.token:
+            print(f"Token: {c.token}")
+        print(f"Claims: {c.claims} ({c.unique_claimants} wallet(s))")
+        print(f"Claimed: {amount(c.total_claimed)}")
+        print(f"Fees: {amount(c.total_fee)}")
+        if c.time_to_claim:
+            d = c.time_to_claim
+            print(
+                f"Time to claim: p50 {format_duration(d.p50)}, p90 {format_duration(d.p90)}, "
+                f"min {format_duration(d.min)}, max {format_duration(d.max)}"
+            )
+        if c.claims_over_time:
+            print(f"Claims per {bucket_name}:")
+            for start, count, claimed_amount in c.claims_over_time:
+                print(f"  {format_date(start)}  {count:>6}  {amount(claimed_amount)}")
+
+    if stats.top_claimants:
+        print(f"\nTop {len(stats.top_claimants)} Claimants:")
+        print("-" * 60)
+        for rank, c in enumerate(stats.top_claimants, 1):
+            print(f"  {rank:>2}. {c.user}  {total(c.total_claimed)} ({c.claims} claim(s), {c.campaigns} campaign(s))")
+
+
+def analytics_to_dict(stats: ClaimAnalytics) -> dict:
+    """JSON 출력용 dict (금액은 정수 그대로)"""
+    data = stats._asdict()
+    data["amount_decimals"] = AMOUNT_TOTAL_DECIMALS
+    data["campaigns"] = []
+    for c in stats.campaigns:
+        campaign = c._asdict()
+        campaign["claims_over_time"] = [
+            {"start": start, "claims": count, "amount": amount} for start, count, amount in c.claims_over_time
+        ]
+        campaign["time_to_claim"] = c.time_to_claim._asdict() if c.time_to_claim else None
+        data["campaigns"].append(campaign)
+    data["top_claimants"] = [c._asdict() for c in stats.top_claimants]
+    return data
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+
+def parse_args():
+    """커맨드라인 인자 파싱"""
+    parser = argparse.ArgumentParser(description="Claim statistics from the local RewardsAdded/Claimed event store")
+    parser.add_argument(
+        "--network", "-n", choices=list(RPC_URLS), default=DEFAULT_NETWORK,
+        help=f"Network (default: {DEFAULT_NETWORK})",
+    )
+    parser.add_argument(
+        "--store-file", metavar="PATH",
+        help=f"Event store path (default: {EVENT_STORE_DIR}/<network>.json)",
+    )
+    parser.add_argument(
+        "--ingest", action="store_true",
+        help="Fetch new events from the chain into the store before computing (default: local only)",
+    )
+    parser.add_argument("--rpc-url", action="append", dest="rpc_urls", metavar="URL", help="RPC URL for --ingest")
+    parser.add_argument("--bucket", choices=list(BUCKETS), default="day", help="Claims-over-time bucket (default: day)")
+    parser.add_argument(
+        "--top", type=int, default=ANALYTICS_TOP_CLAIMANTS,
+        help=f"Number of top claimants (default: {ANALYTICS_TOP_CLAIMANTS})",
+    )
+    parser.add_argument("--campaign", metavar="HASH", help="Only this campaign hash")
+    parser.add_argument("--format", choices=("text", "json"), default="text", help="Output format (default: text)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    store_path = Path(args.store_file) if args.store_file else event_store_path(args.network)
+    store = EventStore.load(store_path) or EventStore(args.network)
+
+    if args.ingest:
+        monitor = AirdropMonitor(network=args.network, rpc_urls=args.rpc_urls)
+        try:
+            ingested = monitor.ingest_events(store)
+            if ingested.reorg_block is not None:
+                print(
+                    f"Reorg detected: rolled back {ingested.removed} event(s) from block {ingested.reorg_block}",
+                    file=sys.stderr,
+                )
+            print(f"Ingested {ingested.added} new event(s) into {store_path}", file=sys.stderr)
+        except Exception as e:
+            print(f"Event ingestion failed: {e}", file=sys.stderr)
+        finally:
+            store.save(store_path)
+    elif not store_path.exists():
+        print(f"No event store at {store_path}; run with --ingest first", file=sys.stderr)
+        sys.exit(1)
+
+    started = time.perf_counter()
+    stats = analyze(store, BUCKETS[args.bucket], args.top, args.campaign)
+    elapsed = time.perf_counter() - started
+
+    if args.format == "json":
+        json.dump(analytics_to_dict(stats), sys.stdout, indent=2)
+        print()
+    else:
+        print_analytics(stats, args.bucket)
+        print(f"\nAnalyzed {stats.rewards_added_events + stats.claimed_events} event(s) in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+"""
+Offline Scan Benchmark
+
+실제 엔드포인트 없이 시뮬레이션 체인(simulated_chain.py)을 상대로 AirdropMonitor를 실행하여
+스캔 전략별 소요 시간, 요청 수, 최대 메모리를 측정합니다.
+--startup은 CLI 시작 시간(python -X importtime)과 무거운 모듈(web3 등)이 시작 시 로드되는지 측정합니다.
+
+Usage:
+    python benchmark.py                                     # 기본 규모
+    python benchmark.py --wallets 200 --campaigns 20        # 규모 지정
+    python benchmark.py --rpc-latency 0.02                  # 요청당 20ms 지연 주입
+    python benchmark.py --save bench.json                   # 결과 저장
+    python benchmark.py --compare bench.json                # 저장된 결과와 비교 (회귀 시 exit 1)
+    python benchmark.py --startup --save startup.json       # 시작 시간 측정 (cron 실행 비용)
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from main import AirdropMonitor, TextReport, get_campaign_name, run_scan
+from request_scheduler import endpoint_key
+from simulated_chain import SimConfig, SimulatedChainProcess
+
+# 작은 규모에서 측정 잡음을 회귀로 보지 않기 위한 절대 허용치
+MIN_WALL_TIME_DELTA = 0.1  # 초
+MIN_MEMORY_DELTA_MB = 1.0
+MIN_STARTUP_DELTA = 0.05  # 초
+
+# 시작 시 로드되면 안 되는 무거운 모듈 (네트워크 조회 경로에서만 필요)
+HEAVY_MODULES = ("web3", "eth_abi", "eth_account", "eth_utils")
+
+# 측정할 시작 명령 (benchmark.py와 같은 디렉터리에서 실행)
+STARTUP_COMMANDS = {
+    "import_main": ["-X", "importtime", "-c", "import main"],
+    "cli_help": ["-X", "importtime", "main.py", "--help"],
+}
+
+# =============================================================================
+# Scan Strategies
+# =============================================================================
+
+
+def _check_campaigns(monitor: AirdropMonitor, campaigns: list[dict], wallets: dict[str, str]) -> int:
+    found = 0
+    for campaign in campaigns:
+        campaign_hash = bytes.fromhex(campaign["campaign_hash"].removeprefix("0x"))
+        found += len(monitor.check_wallets_on_all_contracts(campaign_hash, wallets))
+    return found
+
+
+def strategy_full_scan(monitor: AirdropMonitor, wallets: dict[str, str]) -> int:
+    """CLI와 동일한 전체 스캔 (run_scan + TextReport, 출력은 버림)"""
+    result, _ = run_scan(monitor, wallets, TextReport())
+    return result.reward_count
+
+
+def strategy_scan_engine(monitor: AirdropMonitor, wallets: dict[str, str]) -> int:
+    """출력 없이 AirdropMonitor.scan만 실행 (라이브러리/watch 사용 경로)"""
+    return monitor.scan(wallets).reward_count
+
+
+def strategy_blockscout_by_hash(monitor: AirdropMonitor, wallets: dict[str, str]) -> int:
+    """Blockscout 로그로 캠페인 발견 후 rewardInfoByHash 조회"""
+    return _check_campaigns(monitor, monitor.discover_campaigns_from_blockscout(), wallets)
+
+
+def strategy_rpc_logs_by_hash(monitor: AirdropMonitor, wallets: dict[str, str]) -> int:
+    """RPC eth_getLogs로 캠페인 발견 후 rewardInfoByHash 조회"""
+    return _check_campaigns(monitor, monitor.discover_all_campaigns(from_block=0), wallets)
+
+
+def strategy_hybrid_by_hash(monitor: AirdropMonitor, wallets: dict[str, str]) -> int:
+    """Blockscout와 RPC 로그를 함께 조회해 캠페인 발견 후 rewardInfoByHash 조회"""
+    return _check_campaigns(monitor, monitor.discover_campaigns(source="hybrid"), wallets)
+
+
+STRATEGIES: dict[str, Callable[[AirdropMonitor, dict[str, str]], int]] = {
+    "full_scan": strategy_full_scan,
+    "scan_engine": strategy_scan_engine,
+    "blockscout_by_hash": strategy_blockscout_by_hash,
+    "rpc_logs_by_hash": strategy_rpc_logs_by_hash,
+    "hybrid_by_hash": strategy_hybrid_by_hash,
+}
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+
+def run_strategy(name: str, sim: SimulatedChainProcess, rate_limit: bool = False) -> dict:
+    """전략 하나를 새 AirdropMonitor로 실행하고 측정값 반환"""
+    get_campaign_name.cache_clear()
+    monitor = AirdropMonitor(
+        network="testnet",
+        rpc_urls=[sim.url],
+        contract_addresses=sim.chain.contract_addresses,
+        blockscout_api_url=sim.blockscout_api_url,
+    )
+    if not rate_limit:
+        # 시뮬레이터 요청은 throttling 없이 측정 (RATE_LIMIT_DEFAULT가 결과를 지배하지 않도록)
+        for url in (sim.url, sim.blockscout_api_url):
+            monitor.scheduler.rate_limits[endpoint_key(url)] = (1e9, 1_000_000)
+    wallets = sim.chain.wallets
+    sim.reset_counts()
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        rewards = STRATEGIES[name](monitor, wallets)
+    wall_time = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    counts = sim.request_counts()
+    return {
+        "strategy": name,
+        "wall_time": wall_time,
+        "rpc_requests": sum(v for k, v in counts.items() if k.startswith("rpc.") and k != "rpc.batch"),
+        "http_requests": counts.get("http", 0),
+        "blockscout_pages": counts.get("blockscout.logs_page", 0),
+        "peak_memory_mb": peak / 1024 / 1024,
+        "rewards": rewards,
+        "request_counts": counts,
+    }
+
+
+def print_results(results: list[dict]) -> None:
+    """전략별 측정 결과 표 출력"""
+    print(
+        f"\n{'Strategy':<22} {'Wall(s)':>9} {'RPC':>7} {'HTTP':>7} {'BS pages':>9} "
+        f"{'Peak MB':>8} {'Rewards':>8}"
+    )
+    print("-" * 76)
+    for r in results:
+        print(
+            f"{r['strategy']:<22} {r['wall_time']:>9.3f} {r['rpc_requests']:>7} {r['http_requests']:>7} "
+            f"{r['blockscout_pages']:>9} {r['peak_memory_mb']:>8.1f} {r['rewards']:>8}"
+        )
+
+
+def compare_results(results: list[dict], baseline: list[dict], tolerance: float) -> list[str]:
+    """저장된 결과 대비 회귀 목록 (요청 수 증가, 소요 시간/메모리가 tolerance 이상 증가)"""
+    regressions = []
+    previous = {r["strategy"]: r for r in baseline}
+    for r in results:
+        base = previous.get(r["strategy"])
+        if base is None:
+            continue
+        name = r["strategy"]
+        if r["http_requests"] > base["http_requests"]:
+            regressions.append(f"{name}: HTTP requests {base['http_requests']} -> {r['http_requests']}")
+        if r["wall_time"] > base["wall_time"] * (1 + tolerance) + MIN_WALL_TIME_DELTA:
+            regressions.append(f"{name}: wall time {base['wall_time']:.3f}s -> {r['wall_time']:.3f}s")
+        if r["peak_memory_mb"] > base["peak_memory_mb"] * (1 + tolerance) + MIN_MEMORY_DELTA_MB:
+            regressions.append(
+                f"{name}: peak memory {base['peak_memory_mb']:.1f}MB -> {r['peak_memory_mb']:.1f}MB"
+            )
+    return regressions
+
+
+# =============================================================================
+# Startup
+# =============================================================================
+
+
+def parse_importtime(stderr: str) -> list[tuple[int, str, int]]:
+    """-X importtime 출력을 (중첩 깊이, 모듈 이름, 누적 import 시간 us) 목록으로 변환"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # 헤더
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((depth, name.strip(), int(cumulative)))
+    return entries
+
+
+def run_startup(name: str, repeat: int) -> dict:
+    """시작 명령을 repeat번 실행해 중앙값 wall time과 import 통계 반환"""
+    cwd = Path(__file__).resolve().parent
+    wall_times = []
+    entries: list[tuple[int, str, int]] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, *STARTUP_COMMANDS[name]], cwd=cwd, capture_output=True, text=True
+        )
+        wall_times.append(time.perf_counter() - started)
+        entries = parse_importtime(proc.stderr)
+
+    loaded = {module.split(".")[0] for _, module, _ in entries}
+    # main의 직접 import 중 무거운 순서 (import main이면 깊이 1, 스크립트 실행이면 깊이 0)
+    direct_depth = 1 if any(module == "main" for _, module, _ in entries) else 0
+    direct = [(module, us) for depth, module, us in entries if depth == direct_depth]
+    return {
+        "command": name,
+        "wall_time": statistics.median(wall_times),
+        "import_time": sum(us for depth, _, us in entries if depth == 0) / 1e6,
+        "heavy_modules": [m for m in HEAVY_MODULES if m in loaded],
+        "top_imports": [[module, us / 1e6] for module, us in sorted(direct, key=lambda e: e[1], reverse=True)[:5]],
+    }
+
+
+def print_startup(results: list[dict]) -> None:
+    """시작 시간 측정 결과 표 출력"""
+    print(f"\n{'Command':<14} {'Wall(s)':>9} {'Import(s)':>10}  Heavy modules / top imports")
+    print("-" * 76)
+    for r in results:
+        heavy = ", ".join(r["heavy_modules"]) or "none"
+        top = ", ".join(f"{m} {t:.3f}s" for m, t in r["top_imports"][:3])
+        print(f"{r['command']:<14} {r['wall_time']:>9.3f} {r['import_time']:>10.3f}  {heavy} / {top}")
+
+
+def compare_startup(results: list[dict], baseline: list[dict], tolerance: float) -> list[str]:
+    """저장된 시작 시간 대비 회귀 목록 (wall time 증가, 새로 로드된 무거운 모듈)"""
+    regressions = []
+    previous = {r["command"]: r for r in baseline}
+    for r in results:
+        base = previous.get(r["command"])
+        if base is None:
+            continue
+        name = r["command"]
+        if r["wall_time"] > base["wall_time"] * (1 + tolerance) + MIN_STARTUP_DELTA:
+            regressions.append(f"{name}: wall time {base['wall_time']:.3f}s -> {r['wall_time']:.3f}s")
+        added = set(r["heavy_modules"]) - set(base["heavy_modules"])
+        if added:
+            regressions.append(f"{name}: now imports {', '.join(sorted(added))} at startup")
+    return regressions
+
+
+def parse_args():
+    """커맨드라인 인자 파싱"""
+    parser = argparse.ArgumentParser(description="Offline AirdropMonitor scan benchmark")
+    parser.add_argument("--contracts", type=int, default=3, help="Number of contracts (default: 3)")
+    parser.add_argument("--campaigns", type=int, default=5, help="Campaigns per contract (default: 5)")
+    parser.add_argument("--wallets", type=int, default=10, help="Number of wallets (default: 10)")
+    parser.add_argument(
+        "--filler-logs", type=int, default=0, help="Extra unrelated logs per contract (default: 0)"
+    )
+    parser.add_argument("--rpc-latency", type=float, default=0.0, help="Injected RPC latency in seconds")
+    parser.add_argument(
+        "--blockscout-latency", type=float, default=0.0, help="Injected Blockscout latency in seconds"
+    )
+    parser.add_argument(
+        "--blockscout-lag", type=int, default=0, help="Blocks the simulated Blockscout index trails the chain head"
+    )
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Probability of HTTP 503")
+    parser.add_argument(
+        "--strategy",
+        action="append",
+        choices=list(STRATEGIES),
+        help="Strategy to run (repeatable; default: all)",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        action="store_true",
+        help="Apply the default per-host rate limit to the simulator (default: unthrottled)",
+    )
+    parser.add_argument(
+        "--startup",
+        action="store_true",
+        help="Measure CLI startup (python -X importtime) instead of scan strategies",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Runs per startup command; the median is reported (default: 5)"
+    )
+    parser.add_argument("--save", type=str, metavar="PATH", help="Write results as JSON")
+    parser.add_argument("--compare", type=str, metavar="PATH", help="Compare with saved results")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative increase in wall time/memory for --compare (default: 0.25)",
+    )
+    return parser.parse_args()
+
+
+def main_startup(args) -> None:
+    """--startup: 시작 시간 측정, 저장, 비교"""
+    results = [run_startup(name, args.repeat) for name in STARTUP_COMMANDS]
+    print_startup(results)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"startup": results}, f, indent=2)
+        print(f"\nResults written to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_startup(results, baseline.get("startup", []), args.tolerance)
+        if regressions:
+            print("\nREGRESSIONS:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print("\nNo regressions against baseline.")
+
+
+def main():
+    args = parse_args()
+    if args.startup:
+        main_startup(args)
+        return
+    config = SimConfig(
+        contracts=args.contracts,
+        campaigns=args.campaigns,
+        wallets=args.wallets,
+        filler_logs=args.filler_logs,
+        rpc_latency=args.rpc_latency,
+        blockscout_latency=args.blockscout_latency,
+        failure_rate=args.failure_rate,
+        blockscout_lag=args.blockscout_lag,
+    )
+    print(
+        f"Simulated chain: {config.contracts} contracts x {config.campaigns} campaigns, "
+        f"{config.wallets} wallets, {config.filler_logs} filler logs/contract, "
+        f"rpc latency {config.rpc_latency * 1000:.0f}ms, blockscout latency "
+        f"{config.blockscout_latency * 1000:.0f}ms, failure rate {config.failure_rate:.0%}"
+    )
+
+    sim = SimulatedChainProcess(config)
+    try:
+        results = [run_strategy(name, sim, args.rate_limit) for name in args.strategy or STRATEGIES]
+    finally:
+        sim.stop()
+
+    print_results(results)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"config": config._asdict(), "results": results}, f, indent=2)
+        print(f"\nResults written to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("config") != config._asdict():
+            print("\nWarning: baseline was recorded with a different configuration")
+        regressions = compare_results(results, baseline["results"], args.tolerance)
+        if regressions:
+            print("\nREGRESSIONS:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print("\nNo regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
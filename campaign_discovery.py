@@ -0,0 +1,148 @@
+"""
+Campaign Discovery Sources
+
+캠페인(RewardsAdded 이벤트)은 Blockscout API와 RPC eth_getLogs 두 곳에서 찾을 수 있습니다.
+hybrid 발견은 두 소스를 동시에 조회해 각각의 소요 시간과 범위를 기록하고 결과를 합칩니다.
+
+- Blockscout는 인덱싱한 블록까지만 알고 있으므로, 그 이후 블록의 캠페인은 RPC 로그로 채웁니다.
+- RPC 로그는 최신 블록부터 과거로 조회하므로 Blockscout가 먼저 끝나면 최신 구간부터 확보됩니다.
+  나머지 과거 구간은 교차 검증용이며, 필요한 구간을 확보하면 (기본값은 기다리지 않고) 중단합니다.
+- 두 소스가 함께 조회한 블록 구간에서 한쪽에만 있는 캠페인은 개수를 보고하고 결과에 포함합니다.
+"""
+
+import threading
+from typing import NamedTuple
+
+from scan_result import normalize_campaign_hash
+
+DISCOVERY_SOURCES = ("hybrid", "blockscout", "rpc")
+DISCOVERY_SOURCE_LABELS = {
+    "hybrid": "Blockscout API + RPC logs",
+    "blockscout": "Blockscout API",
+    "rpc": "RPC logs",
+}
+
+
+class DiscoveryStats(NamedTuple):
+    """캠페인 발견 1회의 소스별 결과"""
+
+    source: str  # hybrid, blockscout, rpc
+    blockscout_campaigns: int | None  # None: 조회하지 않았거나 실패
+    blockscout_seconds: float | None
+    blockscout_block: int | None  # Blockscout가 인덱싱한 마지막 블록
+    rpc_campaigns: int | None
+    rpc_seconds: float | None  # 과거 구간 조회를 중단했으면 중단까지의 시간
+    rpc_from_block: int | None  # RPC 로그로 조회를 마친 가장 낮은 블록 (latest_block까지)
+    latest_block: int | None
+    tail: int = 0  # Blockscout 인덱싱 이후 블록에서 RPC 로그로만 찾은 캠페인 수
+    blockscout_only: int = 0  # 두 소스가 함께 조회한 구간에서 Blockscout에만 있는 캠페인 수
+    rpc_only: int = 0  # 두 소스가 함께 조회한 구간에서 RPC 로그에만 있는 캠페인 수
+    blockscout_failed: int = 0  # Blockscout 로그 조회에 실패한 컨트랙트 수
+
+
+def campaign_key(campaign: dict) -> tuple[str, str]:
+    """(소문자 컨트랙트 주소, 0x 없는 소문자 캠페인 해시)"""
+    return campaign["contract_address"].lower(), normalize_campaign_hash(campaign["campaign_hash"])
+
+
+class LogProgress:
+    """최신 블록부터 과거로 진행하는 RPC 로그 발견의 진행 상태 (스레드 간 공유)"""
+
+    def __init__(self, latest_block: int):
+        self.campaigns: list[dict] = []
+        self.from_block = latest_block + 1  # 이 블록부터 latest_block까지 조회 완료
+        self.done = False
+        self.error: BaseException | None = None
+        self._cond = threading.Condition()
+
+    def add(self, from_block: int, campaigns: list[dict]) -> None:
+        with self._cond:
+            self.campaigns.extend(campaigns)
+            self.from_block = from_block
+            self._cond.notify_all()
+
+    def finish(self, error: BaseException | None = None) -> None:
+        with self._cond:
+            self.done = True
+            self.error = error
+            self._cond.notify_all()
+
+    def snapshot(self) -> tuple[list[dict], int]:
+        """(지금까지 찾은 캠페인, 조회를 마친 가장 낮은 블록)"""
+        with self._cond:
+            return list(self.campaigns), self.from_block
+
+    def wait_until(self, block: int, timeout: float | None = None) -> bool:
+        """block까지 조회되거나 끝날 때까지 대기 (block까지 조회되었으면 True)"""
+        with self._cond:
+            self._cond.wait_for(lambda: self.done or self.from_block <= block, timeout)
+            return self.from_block <= block
+
+    def wait_done(self, timeout: float | None = None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: self.done, timeout)
+
+
+def merge_campaigns(
+    blockscout: list[dict] | None,
+    blockscout_block: int | None,
+    logs: list[dict] | None,
+    logs_from_block: int,
+) -> tuple[list[dict], int, int, int]:
+    """두 소스의 캠페인 합치기: (캠페인 목록, tail, blockscout_only, rpc_only)
+
+    Blockscout 결과의 순서를 유지하고, RPC 로그에만 있는 캠페인을 뒤에 붙입니다.
+    blockscout_only/rpc_only는 두 소스가 모두 조회한 블록 구간
+    (logs_from_block ~ blockscout_block)만 비교합니다.
+    """
+    if blockscout is None or logs is None:
+        return list(blockscout if blockscout is not None else logs or []), 0, 0, 0
+
+    found = {campaign_key(c) for c in blockscout}
+    found_logs = {campaign_key(c) for c in logs}
+    indexed = blockscout_block if blockscout_block is not None else -1
+
+    blockscout_only = sum(
+        1 for c in blockscout
+        if logs_from_block <= c["block_number"] <= indexed and campaign_key(c) not in found_logs
+    )
+    merged = list(blockscout)
+    tail = rpc_only = 0
+    for campaign in logs:
+        key = campaign_key(campaign)
+        if key in found:
+            continue
+        found.add(key)
+        merged.append(campaign)
+        if campaign["block_number"] > indexed:
+            tail += 1
+        else:
+            rpc_only += 1
+    return merged, tail, blockscout_only, rpc_only
+
+
+def describe_discovery(stats: DiscoveryStats) -> list[str]:
+    """hybrid 발견 결과 요약 (상태 출력용)"""
+    lines = []
+    if stats.blockscout_campaigns is None:
+        lines.append("  Blockscout: not waited for (RPC logs finished first)")
+    else:
+        failed = f", failed for {stats.blockscout_failed} contract(s)" if stats.blockscout_failed else ""
+        lines.append(
+            f"  Blockscout: {stats.blockscout_campaigns} campaign(s) in {stats.blockscout_seconds:.2f}s "
+            f"(indexed to block {stats.blockscout_block}{failed})"
+        )
+    if stats.rpc_campaigns is None:
+        lines.append("  RPC logs: failed")
+    else:
+        blocks = f"blocks {stats.rpc_from_block}-{stats.latest_block}"
+        elapsed = f"in {stats.rpc_seconds:.2f}s" if stats.rpc_seconds is not None else "stopped early"
+        lines.append(f"  RPC logs: {stats.rpc_campaigns} campaign(s) {elapsed} ({blocks})")
+    if stats.tail:
+        lines.append(f"  {stats.tail} campaign(s) after Blockscout's indexed block added from RPC logs")
+    if stats.blockscout_only or stats.rpc_only:
+        lines.append(
+            f"  Cross-check mismatch: {stats.rpc_only} campaign(s) only in RPC logs, "
+            f"{stats.blockscout_only} only in Blockscout (all included)"
+        )
+    return lines
@@ -0,0 +1,128 @@
+"""
+Scan Checkpoint
+
+긴 스캔 도중 프로세스가 종료되어도 완료한 작업을 잃지 않도록, 발견한 캠페인과 완료한
+리워드 조회(작업 단위)를 네트워크별 JSON lines 파일에 append-only로 기록합니다.
+
+- 기록은 메모리에 모았다가 CHECKPOINT_BATCH_SIZE개 또는 CHECKPOINT_INTERVAL초마다 한 번에 씁니다.
+- --resume으로 다시 시작하면 기록된 캠페인과 조회 결과를 그대로 사용하고 나머지만 조회합니다.
+  지갑별/컨트랙트별 합계는 재사용한 결과로 다시 계산되므로 따로 저장하지 않습니다.
+- 스캔이 끝나면 파일을 지웁니다. 마지막 줄이 중간에 끊겨 있어도 읽을 때 무시합니다.
+"""
+
+import json
+import time
+from pathlib import Path
+
+from settings import CHECKPOINT_BATCH_SIZE, CHECKPOINT_DIR, CHECKPOINT_INTERVAL
+
+CHECKPOINT_VERSION = 1
+
+
+def checkpoint_path(network: str) -> Path:
+    return Path(CHECKPOINT_DIR) / f"{network}.jsonl"
+
+
+def unit_key(contract_address: str, campaign: str, by_name: bool, wallet_address: str) -> tuple:
+    """작업 단위 key (캠페인 해시는 0x 없는 소문자, 주소는 소문자)"""
+    campaign_key = campaign if by_name else campaign.lower().removeprefix("0x")
+    return (contract_address.lower(), campaign_key, by_name, wallet_address.lower())
+
+
+class ScanCheckpoint:
+    """스캔 1회의 checkpoint 파일 (append-only JSON lines)"""
+
+    def __init__(self, path: str | Path, network: str):
+        self.path = Path(path)
+        self.network = network
+        self.campaigns: list[dict] | None = None  # 기록된 캠페인 발견 결과
+        self.rewards: dict[tuple, tuple | None] = {}  # 작업 단위 key -> 리워드 (None: 리워드 없음)
+        self.resumed = 0  # 이번 스캔에서 checkpoint로 건너뛴 조회 수
+        self._buffer: list[str] = []
+        self._last_flush = time.monotonic()
+        self._file = None
+
+    @classmethod
+    def open(cls, network: str, resume: bool = False, path: str | Path | None = None) -> "ScanCheckpoint":
+        """checkpoint 열기 (resume이면 기존 기록을 읽고 이어서 기록, 아니면 새로 시작)"""
+        checkpoint = cls(path if path is not None else checkpoint_path(network), network)
+        if resume and checkpoint._load():
+            checkpoint._file = open(checkpoint.path, "a", encoding="utf-8")
+        else:
+            checkpoint.path.parent.mkdir(parents=True, exist_ok=True)
+            checkpoint._file = open(checkpoint.path, "w", encoding="utf-8")
+            checkpoint._write({"type": "header", "version": CHECKPOINT_VERSION, "network": network})
+            checkpoint.flush()
+        return checkpoint
+
+    def _load(self) -> bool:
+        """기존 파일 읽기 (없거나 다른 네트워크/형식이면 False)"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return False
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue  # 종료 중 끊긴 마지막 줄
+        if not records or records[0] != {"type": "header", "version": CHECKPOINT_VERSION, "network": self.network}:
+            return False
+        for record in records[1:]:
+            if record["type"] == "campaigns":
+                self.campaigns = record["campaigns"]
+            elif record["type"] == "reward":
+                reward = record["reward"]
+                self.rewards[unit_key(*record["unit"])] = tuple(reward) if reward is not None else None
+        return True
+
+    def __len__(self) -> int:
+        return len(self.rewards)
+
+    def lookup(self, contract_address: str, campaign: str, by_name: bool, wallet_address: str) -> tuple[bool, tuple | None]:
+        """(기록 여부, 리워드) - 기록된 작업 단위면 resumed를 늘림"""
+        key = unit_key(contract_address, campaign, by_name, wallet_address)
+        if key not in self.rewards:
+            return False, None
+        self.resumed += 1
+        return True, self.rewards[key]
+
+    def record_campaigns(self, campaigns: list[dict]) -> None:
+        self.campaigns = campaigns
+        self._write({"type": "campaigns", "campaigns": campaigns})
+        self.flush()
+
+    def record(self, contract_address: str, campaign: str, by_name: bool, wallet_address: str, reward: tuple | None) -> None:
+        """완료한 작업 단위 기록 (batch로 모아서 씀)"""
+        self.rewards[unit_key(contract_address, campaign, by_name, wallet_address)] = reward
+        self._write({
+            "type": "reward",
+            "unit": [contract_address, campaign, by_name, wallet_address],
+            "reward": list(reward) if reward is not None else None,
+        })
+        if len(self._buffer) >= CHECKPOINT_BATCH_SIZE or time.monotonic() - self._last_flush >= CHECKPOINT_INTERVAL:
+            self.flush()
+
+    def _write(self, record: dict) -> None:
+        self._buffer.append(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def flush(self) -> None:
+        if self._buffer and self._file is not None:
+            self._file.write("".join(self._buffer))
+            self._file.flush()
+            self._buffer.clear()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """남은 기록을 쓰고 파일 닫기 (중단된 스캔은 다음 --resume에서 이어서 실행)"""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def discard(self) -> None:
+        """스캔 완료: 파일 닫고 삭제"""
+        self.close()
+        self.path.unlink(missing_ok=True)
@@ -0,0 +1,81 @@
+"""
+Contract Registry
+
+자동 발견한 RedeemableAirdrop 컨트랙트를 네트워크별로 저장하는 registry입니다.
+AirdropMonitor.discover_contracts()가 주소 필터 없이 RewardsAdded/Claimed topic0 로그를 조회해
+새 컨트랙트 후보를 찾고, ABI 조회로 확인한 컨트랙트만 등록합니다.
+
+- 마지막으로 조회한 블록(checkpoint)을 기록하므로 다음 발견은 그 이후 블록만 조회합니다.
+- 확인에 실패한 후보도 기록해 같은 주소를 다시 확인하지 않습니다.
+- AirdropMonitor는 생성 시 registry를 로드해 settings의 컨트랙트 목록에 더합니다.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from settings import CONTRACT_REGISTRY_DIR
+
+CONTRACT_REGISTRY_VERSION = 1
+
+
+def registry_path(network: str) -> Path:
+    return Path(CONTRACT_REGISTRY_DIR) / f"{network}.json"
+
+
+class ContractRegistry:
+    """네트워크 하나에서 발견한 컨트랙트와 발견 checkpoint"""
+
+    def __init__(self, network: str):
+        self.network = network
+        self.contracts: dict[str, int] = {}  # checksum 주소 -> 처음 발견한 블록
+        self.rejected: set[str] = set()  # ABI 확인에 실패한 주소 (소문자)
+        self.last_block = -1  # 이 블록까지 발견 완료
+
+    def known(self, address: str) -> bool:
+        """등록되었거나 확인에 실패한 주소인지"""
+        lower = address.lower()
+        return lower in self.rejected or any(lower == addr.lower() for addr in self.contracts)
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def to_dict(self) -> dict:
+        return {
+            "version": CONTRACT_REGISTRY_VERSION,
+            "network": self.network,
+            "last_block": self.last_block,
+            "contracts": self.contracts,
+            "rejected": sorted(self.rejected),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ContractRegistry":
+        registry = cls(data["network"])
+        registry.last_block = data["last_block"]
+        registry.contracts = data["contracts"]
+        registry.rejected = set(data["rejected"])
+        return registry
+
+    def save(self, path: str | Path | None = None) -> None:
+        """registry 저장 (임시 파일에 쓴 뒤 교체, 기본 경로는 CONTRACT_REGISTRY_DIR/<network>.json)"""
+        path = Path(path) if path is not None else registry_path(self.network)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, network: str, path: str | Path | None = None) -> "ContractRegistry":
+        """저장된 registry 로드 (없거나 형식이 다르면 빈 registry)"""
+        path = Path(path) if path is not None else registry_path(network)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(network)
+        if data.get("version") != CONTRACT_REGISTRY_VERSION or data.get("network") != network:
+            return cls(network)
+        return cls.from_dict(data)
@@ -0,0 +1,216 @@
+"""
+Event Store
+
+RewardsAdded / Claimed 이벤트를 네트워크별로 로컬에 저장하는 columnar 저장소입니다.
+이벤트 필드마다 list 하나(column)로 보관하므로 분석(analytics.py)은 체인을 다시 조회하지 않고
+column 단위로 집계합니다.
+
+- 컨트랙트별로 마지막으로 수집한 블록을 기록해 다음 수집은 그 이후 블록만 조회합니다 (증분 수집).
+- 이벤트가 있는 블록의 timestamp와 캠페인 토큰의 decimals도 함께 저장합니다.
+- 아직 확정되지 않은 블록(EVENT_CONFIRMATIONS 이내)은 블록 해시를 보관해 reorg를 감지하고,
+  reorg된 구간의 이벤트만 되돌린 뒤 다시 수집합니다 (rollback).
+- 파일은 반복되는 문자열 column(컨트랙트, 캠페인, 지갑)을 목록 + 인덱스로 저장하는 compact JSON입니다.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+from settings import EVENT_STORE_DIR
+
+EVENT_STORE_VERSION = 2
+
+# 이벤트별 column (get_logs 결과의 args + 로그 위치)
+EVENT_COLUMNS: dict[str, tuple[str, ...]] = {
+    "RewardsAdded": (
+        "contract_address", "campaign_hash", "token", "start_date", "deadline",
+        "block_number", "log_index", "tx_hash",
+    ),
+    "Claimed": (
+        "contract_address", "user", "campaign_hash", "total_reward", "fee",
+        "block_number", "log_index", "tx_hash",
+    ),
+}
+
+# 이벤트 인자 이름 -> column 이름
+_ARG_COLUMNS = {
+    "campaignNameHash": "campaign_hash",
+    "startDate": "start_date",
+    "totalReward": "total_reward",
+}
+
+# 값이 반복되는 문자열 column (파일에 목록 + 인덱스로 저장)
+_DICTIONARY_COLUMNS = frozenset({"contract_address", "campaign_hash", "token", "user"})
+
+
+def event_store_path(network: str) -> Path:
+    return Path(EVENT_STORE_DIR) / f"{network}.json"
+
+
+class IngestResult(NamedTuple):
+    """수집 1회 결과"""
+
+    added: int  # 새로 수집한 로그 수
+    removed: int = 0  # reorg로 되돌린 로그 수
+    reorg_block: int | None = None  # reorg로 되돌린 첫 블록
+
+
+class EventStore:
+    """네트워크 하나의 RewardsAdded/Claimed 이벤트 column과 수집 상태"""
+
+    def __init__(self, network: str):
+        self.network = network
+        self.columns: dict[str, dict[str, list]] = {
+            event: {column: [] for column in columns} for event, columns in EVENT_COLUMNS.items()
+        }
+        self.last_block: dict[str, int] = {}  # 컨트랙트 -> 마지막으로 수집한 블록
+        self.block_times: dict[int, int] = {}  # 블록 번호 -> timestamp
+        self.token_decimals: dict[str, int] = {}  # 소문자 토큰 주소 -> decimals
+        self.block_hashes: dict[int, str] = {}  # 미확정 블록 번호 -> 수집 당시 블록 해시
+        self.confirmed_block = -1  # 이 블록까지는 확정으로 간주 (해시 보관 안 함)
+
+    def count(self, event_name: str) -> int:
+        return len(self.columns[event_name]["block_number"])
+
+    def append(self, event_name: str, contract_address: str, logs: list[dict]) -> None:
+        """AirdropMonitor.get_logs 결과를 column에 추가
+
+        캠페인 해시는 0x 없는 소문자 hex, 트랜잭션 해시는 0x hex로 저장합니다.
+        미확정 블록의 로그는 블록 해시도 기록합니다 (reorg 감지용).
+        """
+        columns = self.columns[event_name]
+        for log in logs:
+            args = log["args"]
+            for name, value in args.items():
+                column = _ARG_COLUMNS.get(name, name)
+                if column == "campaign_hash":
+                    value = value.hex()
+                columns[column].append(value)
+            columns["contract_address"].append(contract_address)
+            columns["block_number"].append(log["blockNumber"])
+            columns["log_index"].append(log["logIndex"])
+            columns["tx_hash"].append("0x" + log["transactionHash"].hex())
+            if log["blockNumber"] > self.confirmed_block:
+                self.block_hashes[log["blockNumber"]] = "0x" + log["blockHash"].hex()
+
+    def claims(self, wallets: set[str], to_block: int) -> dict[str, list[dict]]:
+        """to_block까지의 Claimed 이벤트 중 wallets(소문자 주소)의 수령 목록 (소문자 지갑 주소 -> 수령 목록)
+
+        AirdropMonitor.get_claimed_events_for_wallets와 같은 형식입니다.
+        """
+        columns = self.columns["Claimed"]
+        claims: dict[str, list[dict]] = {wallet: [] for wallet in wallets}
+        for i, (user, block) in enumerate(zip(columns["user"], columns["block_number"])):
+            found = claims.get(user.lower())
+            if found is None or block > to_block:
+                continue
+            found.append({
+                "contract_address": columns["contract_address"][i],
+                "campaign_hash": columns["campaign_hash"][i],
+                "total_reward": columns["total_reward"][i],
+                "fee": columns["fee"][i],
+                "block_number": block,
+                "tx_hash": columns["tx_hash"][i].removeprefix("0x"),
+            })
+        return claims
+
+    def missing_block_times(self) -> list[int]:
+        """timestamp를 아직 모르는 이벤트 블록 목록 (오름차순)"""
+        blocks = set()
+        for columns in self.columns.values():
+            blocks.update(columns["block_number"])
+        return sorted(blocks - self.block_times.keys())
+
+    def confirm(self, block: int) -> None:
+        """block까지를 확정으로 표시하고 그 이하 블록 해시는 버림"""
+        if block <= self.confirmed_block:
+            return
+        self.confirmed_block = block
+        self.block_hashes = {b: h for b, h in self.block_hashes.items() if b > block}
+
+    def rollback(self, from_block: int) -> int:
+        """from_block 이후 블록의 이벤트와 수집 상태를 되돌림 (삭제한 이벤트 수 반환)
+
+        컨트랙트별 last_block은 from_block - 1 이하로 내려가므로 다음 수집이 그 구간을 다시 조회합니다.
+        """
+        removed = 0
+        for columns in self.columns.values():
+            blocks = columns["block_number"]
+            keep = [i for i, block in enumerate(blocks) if block < from_block]
+            if len(keep) == len(blocks):
+                continue
+            removed += len(blocks) - len(keep)
+            for name, values in columns.items():
+                columns[name] = [values[i] for i in keep]
+        self.last_block = {
+            contract: min(block, from_block - 1) for contract, block in self.last_block.items()
+        }
+        self.block_times = {b: ts for b, ts in self.block_times.items() if b < from_block}
+        self.block_hashes = {b: h for b, h in self.block_hashes.items() if b < from_block}
+        return removed
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def to_dict(self) -> dict:
+        events = {}
+        for event, columns in self.columns.items():
+            encoded = {}
+            for name, values in columns.items():
+                if name in _DICTIONARY_COLUMNS:
+                    table = sorted(set(values))
+                    index = {value: i for i, value in enumerate(table)}
+                    encoded[name] = {"values": table, "codes": [index[v] for v in values]}
+                else:
+                    encoded[name] = values
+            events[event] = encoded
+        return {
+            "version": EVENT_STORE_VERSION,
+            "network": self.network,
+            "last_block": self.last_block,
+            "block_times": [[block, ts] for block, ts in sorted(self.block_times.items())],
+            "token_decimals": self.token_decimals,
+            "confirmed_block": self.confirmed_block,
+            "block_hashes": [[block, block_hash] for block, block_hash in sorted(self.block_hashes.items())],
+            "events": events,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "EventStore":
+        store = cls(data["network"])
+        store.last_block = data["last_block"]
+        store.block_times = {block: ts for block, ts in data["block_times"]}
+        store.token_decimals = data["token_decimals"]
+        store.confirmed_block = data["confirmed_block"]
+        store.block_hashes = {block: block_hash for block, block_hash in data["block_hashes"]}
+        for event, encoded in data["events"].items():
+            columns = store.columns[event]
+            for name, values in encoded.items():
+                if name in _DICTIONARY_COLUMNS:
+                    table = values["values"]
+                    values = [table[code] for code in values["codes"]]
+                columns[name] = values
+        return store
+
+    def save(self, path: str | Path) -> None:
+        """저장소 저장 (임시 파일에 쓴 뒤 교체)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "EventStore | None":
+        """저장된 저장소 로드 (없거나 형식이 다르면 None)"""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if data.get("version") != EVENT_STORE_VERSION:
+            return None
+        return cls.from_dict(data)
@@ -6,31 +6,94 @@ Spacecoin Airdrop Monitor for Creditcoin Chain
 Usage:
     python main.py                              # testnet, wallets.json 사용
     python main.py --network mainnet            # mainnet
+    python main.py --network all                # mainnet + testnet 동시 스캔
     python main.py --wallets my_wallets.json    # 지갑 파일 지정
     python main.py --address 0x1234...          # 단일 주소 조회
     python main.py --address 0x1234... --name "my_wallet"  # 단일 주소 + 이름
+    python main.py --format jsonl > rewards.jsonl   # 구조화된 출력
 """
 
 import argparse
+import contextlib
+import io
 import json
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime
+from functools import cached_property, lru_cache, partial
 from pathlib import Path
 from typing import NamedTuple
 
 import httpx
-from web3 import Web3
 
+from abi_codec import (
+    ERC20_FUNCTIONS,
+    EVENTS,
+    FUNCTIONS,
+    SELECTOR_LABELS,
+    WORD,
+    decode_logs_batch,
+    decode_output,
+    decode_output_batch,
+    encode_call,
+    encode_topic,
+    keccak_text,
+    log_matches,
+    to_checksum_address,
+)
+from amounts import TOKEN_DECIMALS, format_amount
 from settings import (
+    ALL_NETWORKS,
+    AMOUNT_TOTAL_DECIMALS,
     BLOCKSCOUT_API_URLS,
+    CAMPAIGN_CROSSCHECK_WAIT,
+    CAMPAIGN_DISCOVERY_SOURCE,
     CAMPAIGN_HASH_TO_NAME,
+    CAMPAIGN_LOG_START_BLOCK,
+    CHECKPOINT_DIR,
+    CONTRACT_REGISTRY_DIR,
+    DEFAULT_TOKEN_DECIMALS,
     DEFAULT_WALLETS_FILE,
+    DIFF_DEADLINE_WINDOW,
+    DISCOVERY_BLOCK_RANGE,
+    DISCOVERY_START_BLOCK,
+    DISCOVERY_WORKERS,
+    EVENT_CONFIRMATIONS,
+    EVENT_LOG_BLOCK_RANGE,
+    EVENT_START_BLOCK,
     KNOWN_CAMPAIGN_NAMES,
     KNOWN_TOKENS,
     MAINNET_CONTRACTS,
     REDEEMABLE_AIRDROP_ABI,
+    RPC_BATCH_SIZE,
+    RPC_TOPIC_FILTER_SIZE,
+    RPC_POOL_URLS,
     RPC_URLS,
     TESTNET_CONTRACTS,
 )
+from campaign_discovery import (
+    DISCOVERY_SOURCE_LABELS,
+    DISCOVERY_SOURCES,
+    DiscoveryStats,
+    LogProgress,
+    describe_discovery,
+    merge_campaigns,
+)
+from checkpoint import ScanCheckpoint
+from contract_registry import ContractRegistry
+from event_store import EVENT_COLUMNS, EventStore, IngestResult, event_store_path
+from metrics import MetricsExporter
+from output_writers import OUTPUT_FORMATS, RecordWriter, create_writer
+from profiling import Profiler, instrumented_codec
+from reconciliation import ISSUE_LABELS, Reconciliation, ReconcileIssue, balance_pairs, reconcile_claims
+from refresh_scheduler import RefreshScheduler
+from request_scheduler import DeadLetter, RequestScheduler, is_retryable
+from rpc_pool import RpcPool, RpcResponseError, is_revert, web3_provider
+from scan_result import NetworkScanResults, ScanResult, normalize_campaign_hash
+from snapshot import DEADLINE_CHANGE_KINDS, Change, Snapshot, default_snapshot_path
 
 # =============================================================================
 # Wallet Loading Functions
@@ -110,6 +173,16 @@ class WalletReward(NamedTuple):
     required_additional_verification: bool
 
 
+class RewardLookup(NamedTuple):
+    """재시도 가능한 리워드 조회 작업 단위 (contract, campaign, wallet)"""
+
+    contract_address: str
+    campaign: str  # 캠페인 해시 (hex) 또는 캠페인 이름
+    by_name: bool  # True면 rewardInfo(이름), False면 rewardInfoByHash(해시)
+    wallet_name: str
+    wallet_address: str
+
+
 # =============================================================================
 # AirdropMonitor Class
 # =============================================================================
@@ -118,53 +191,168 @@ class WalletReward(NamedTuple):
 class AirdropMonitor:
     """Spacecoin 에어드랍 모니터"""
 
-    def __init__(self, network: str = "testnet"):
+    def __init__(
+        self,
+        network: str = "testnet",
+        rpc_urls: list[str] | None = None,
+        profiler: Profiler | None = None,
+        contract_addresses: list[str] | None = None,
+        blockscout_api_url: str | None = None,
+    ):
         """
         Args:
             network: 'mainnet', 'mainnet_remote', 또는 'testnet'
+            rpc_urls: RPC 엔드포인트 목록 (None이면 RPC_POOL_URLS 사용)
+            profiler: 호출별 지연시간을 기록할 profiler (None이면 새로 생성)
+            contract_addresses: 모니터링할 컨트랙트 목록 (None이면 네트워크 기본값 + registry에 저장된 발견 컨트랙트)
+            blockscout_api_url: Blockscout API URL (None이면 네트워크 기본값)
         """
         if network not in RPC_URLS:
             raise ValueError(f"Unknown network: {network}. Use: {list(RPC_URLS.keys())}")
 
         self.network = network
-        self.rpc_url = RPC_URLS[network]
-        self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
+        self.rpc_urls = rpc_urls or RPC_POOL_URLS.get(network, [RPC_URLS[network]])
+        self.rpc_url = self.rpc_urls[0]
+        self.profiler = profiler or Profiler()
+        self.scheduler = RequestScheduler(profiler=self.profiler)
+        self.rpc_pool = RpcPool(
+            self.rpc_urls,
+            scheduler=self.scheduler,
+            profiler=self.profiler,
+            call_labels=SELECTOR_LABELS,
+        )
+        self.reused_rewards = 0  # 스냅샷에서 재사용한 (조회를 건너뛴) 리워드 수
+        self.refresh: RefreshScheduler | None = None  # 설정하면 마감 기반 재조회 주기 적용 (--watch)
+        self.checkpoint: ScanCheckpoint | None = None  # 설정하면 완료한 조회를 기록하고 기록된 조회는 건너뜀
+        self.discovery_source = CAMPAIGN_DISCOVERY_SOURCE  # 캠페인 발견 소스 (hybrid, blockscout, rpc)
+        self.crosscheck_wait = CAMPAIGN_CROSSCHECK_WAIT  # hybrid: 필요한 구간 확보 후 느린 소스를 더 기다리는 시간 (초)
+        self.discovery_stats: DiscoveryStats | None = None  # 마지막 캠페인 발견의 소스별 결과
+        self.reward_block: int | None = None  # 리워드 조회 eth_call의 기준 블록 (None이면 latest, scan에서 설정)
+        self.event_store: EventStore | None = None  # 설정하면 reconcile이 Claimed 이벤트를 증분 수집해 사용
 
         # 네트워크별 컨트랙트 주소 목록
-        if network in ("mainnet", "mainnet_remote"):
-            self.contract_addresses = [
-                Web3.to_checksum_address(addr) for addr in MAINNET_CONTRACTS
-            ]
+        if contract_addresses:
+            self.contract_addresses = [to_checksum_address(addr) for addr in contract_addresses]
+        elif network in ("mainnet", "mainnet_remote"):
+            self.contract_addresses = [to_checksum_address(addr) for addr in MAINNET_CONTRACTS]
         else:
-            self.contract_addresses = [
-                Web3.to_checksum_address(addr) for addr in TESTNET_CONTRACTS
-            ]
+            self.contract_addresses = [to_checksum_address(addr) for addr in TESTNET_CONTRACTS]
+
+        # 자동 발견한 컨트랙트 (discover_contracts)
+        self.registry = ContractRegistry.load(network)
+        if not contract_addresses:
+            self.contract_addresses.extend(
+                addr for addr in self.registry.contracts if addr not in self.contract_addresses
+            )
 
         # 기본 컨트랙트 (첫 번째)
         self.contract_address = self.contract_addresses[0]
-        self.contract = self.w3.eth.contract(
-            address=self.contract_address, abi=REDEEMABLE_AIRDROP_ABI
-        )
-
-        # 모든 컨트랙트 인스턴스
-        self.contracts = [
-            self.w3.eth.contract(address=addr, abi=REDEEMABLE_AIRDROP_ABI)
-            for addr in self.contract_addresses
-        ]
 
         # Blockscout API URL
-        self.blockscout_api_url = BLOCKSCOUT_API_URLS.get(network, BLOCKSCOUT_API_URLS["testnet"])
+        self.blockscout_api_url = blockscout_api_url or BLOCKSCOUT_API_URLS.get(
+            network, BLOCKSCOUT_API_URLS["testnet"]
+        )
 
     def is_connected(self) -> bool:
         """RPC 연결 확인"""
-        return self.w3.is_connected()
+        return self.rpc_pool.is_connected()
+
+    # =========================================================================
+    # Contract Calls (미리 컴파일된 selector/decoder, web3 Contract 미사용)
+    # =========================================================================
+
+    def call_function(self, contract_address: str, name: str, *args) -> tuple:
+        """컨트랙트 함수 eth_call 후 반환값 디코딩"""
+        return self.call_function_at("latest", contract_address, name, *args)
+
+    def call_function_at(self, block: int | str, contract_address: str, name: str, *args) -> tuple:
+        """block 기준 컨트랙트 함수 eth_call 후 반환값 디코딩"""
+        fn = FUNCTIONS[name]
+        data = self.rpc_pool.eth_call(contract_address, encode_call(fn, *args), block)
+        with self.profiler.span("abi.decode") as span:
+            span.bytes = len(data)
+            return decode_output(fn, data)
+
+    def get_logs(
+        self,
+        contract_address: str | list[str],
+        event_name: str,
+        from_block: int | str,
+        to_block: int | str = "latest",
+        topics: list[str | None] | None = None,
+    ) -> list[dict]:
+        """eth_getLogs로 이벤트 조회 후 디코딩 (args, address, blockNumber, blockHash, logIndex, transactionHash)
+
+        Args:
+            contract_address: 컨트랙트 주소 또는 주소 목록 (목록이면 한 요청으로 모두 조회)
+            topics: topic0 다음의 indexed 인자 필터 (encode_topic으로 인코딩, None은 전체,
+                목록은 OR 조건)
+        """
+        event = EVENTS[event_name]
+        logs = self.rpc_pool.request("eth_getLogs", [{
+            "address": contract_address,
+            "fromBlock": hex(from_block) if isinstance(from_block, int) else from_block,
+            "toBlock": hex(to_block) if isinstance(to_block, int) else to_block,
+            "topics": [event.topic0, *(topics or [])],
+        }])
+        with self.profiler.span("abi.decode_logs", event=event_name) as span:
+            span.bytes = sum(len(log["data"]) // 2 for log in logs)
+            columns = decode_logs_batch(event, logs)
+            names = list(columns)
+            return [
+                {
+                    "args": dict(zip(names, values)),
+                    "blockNumber": int(log["blockNumber"], 16),
+                    "address": log["address"],
+                    "blockHash": bytes.fromhex(log["blockHash"].removeprefix("0x")),
+                    "logIndex": int(log["logIndex"], 16),
+                    "transactionHash": bytes.fromhex(log["transactionHash"].removeprefix("0x")),
+                }
+                for log, values in zip(logs, zip(*columns.values()))
+            ]
+
+    def block_number(self) -> int:
+        """최신 블록 번호"""
+        return self.rpc_pool.block_number()
+
+    def token_decimals(self, token: str) -> int:
+        """토큰 decimals (ERC-20 decimals(), 토큰마다 한 번만 조회해 TOKEN_DECIMALS에 캐시)"""
+        return TOKEN_DECIMALS.get(token, self._fetch_token_decimals)
+
+    def _fetch_token_decimals(self, token: str) -> int | None:
+        """decimals() 조회 (revert 등 decimals가 없는 토큰은 기본값, 일시적 오류는 None)"""
+        fn = ERC20_FUNCTIONS["decimals"]
+        try:
+            data = self.scheduler.call(self.rpc_pool.eth_call, token, encode_call(fn))
+            return decode_output(fn, data)[0]
+        except Exception as e:
+            return None if is_retryable(e) else DEFAULT_TOKEN_DECIMALS
+
+    @cached_property
+    def w3(self):
+        """web3 인스턴스 (처음 사용할 때 web3를 import하고 RpcPool을 provider로 연결)"""
+        from web3 import Web3
+
+        w3 = Web3(web3_provider(self.rpc_pool))
+        w3.codec = instrumented_codec(w3.codec, self.profiler)
+        return w3
+
+    @cached_property
+    def contracts(self) -> list:
+        """web3 Contract 인스턴스 목록 (처음 사용할 때 생성, 스캔 경로에서는 사용하지 않음)"""
+        return [self.w3.eth.contract(address=addr, abi=REDEEMABLE_AIRDROP_ABI) for addr in self.contract_addresses]
+
+    @property
+    def contract(self):
+        """기본 컨트랙트의 web3 Contract 인스턴스"""
+        return self.contracts[0]
 
     # =========================================================================
     # Blockscout API Methods
     # =========================================================================
 
-    def fetch_logs_from_blockscout(self, contract_address: str) -> list[dict]:
-        """Blockscout API를 통해 컨트랙트의 이벤트 로그 조회"""
+    def fetch_logs_from_blockscout(self, contract_address: str, failed: list[str] | None = None) -> list[dict]:
+        """Blockscout API를 통해 컨트랙트의 이벤트 로그 조회 (실패하면 빈 목록, failed가 주어지면 주소를 추가)"""
         logs = []
         next_page_params = None
 
@@ -174,9 +362,9 @@ class AirdropMonitor:
                     url = f"{self.blockscout_api_url}/addresses/{contract_address}/logs"
                     params = next_page_params if next_page_params else {}
 
-                    response = client.get(url, params=params)
-                    response.raise_for_status()
-                    data = response.json()
+                    data = self.scheduler.call(
+                        self._get_json, client, url, params, contract_address, url=url
+                    )
 
                     items = data.get("items", [])
                     logs.extend(items)
@@ -189,40 +377,51 @@ class AirdropMonitor:
             return logs
         except Exception as e:
             print(f"Error fetching logs from Blockscout for {contract_address}: {e}")
+            if failed is not None:
+                failed.append(contract_address)
+            if is_retryable(e):
+                self.scheduler.dead_letter(("blockscout_logs", contract_address), e)
             return []
 
-    def discover_campaigns_from_blockscout(self) -> list[dict]:
-        """Blockscout API를 통해 모든 컨트랙트에서 캠페인 발견"""
+    def _get_json(
+        self, client: httpx.Client, url: str, params: dict, contract_address: str
+    ) -> dict:
+        """GET 요청 후 JSON 응답 반환 (HTTP 오류는 예외)"""
+        with self.profiler.span("blockscout.logs_page", contract=contract_address) as span:
+            response = client.get(url, params=params)
+            span.bytes = len(response.content)
+            response.raise_for_status()
+            return response.json()
+
+    def discover_campaigns_from_blockscout(
+        self, failed: list[str] | None = None, stop: threading.Event | None = None
+    ) -> list[dict]:
+        """Blockscout API를 통해 모든 컨트랙트에서 캠페인 발견
+
+        Args:
+            failed: 주어지면 로그 조회에 실패한 컨트랙트 주소를 추가
+            stop: 설정되면 다음 컨트랙트부터 조회하지 않음 (hybrid 발견에서 더 기다리지 않을 때)
+        """
         all_campaigns = []
 
         for contract_addr in self.contract_addresses:
+            if stop is not None and stop.is_set():
+                break
             print(f"  Fetching logs from Blockscout for {contract_addr}...")
-            logs = self.fetch_logs_from_blockscout(contract_addr)
-
-            for log in logs:
-                decoded = log.get("decoded")
-                if not decoded:
-                    continue
-
-                method_call = decoded.get("method_call", "")
-
-                # RewardsAdded 이벤트 처리
-                if "RewardsAdded" in method_call:
-                    params = {p["name"]: p["value"] for p in decoded.get("parameters", [])}
-                    campaign_hash = params.get("campaignNameHash", "")
-                    token = params.get("token", "")
-                    start_date = int(params.get("startDate", 0))
-                    deadline = int(params.get("deadline", 0))
-
-                    all_campaigns.append({
-                        "contract_address": contract_addr,
-                        "campaign_hash": campaign_hash,
-                        "token": token,
-                        "start_date": start_date,
-                        "deadline": deadline,
-                        "block_number": log.get("block_number", 0),
-                        "tx_hash": log.get("transaction_hash", ""),
-                    })
+            logs = self.fetch_logs_from_blockscout(contract_addr, failed)
+
+            span = self.profiler.begin("decode.blockscout_logs", contract=contract_addr)
+            for log, args in self.blockscout_events(logs, "RewardsAdded"):
+                all_campaigns.append({
+                    "contract_address": contract_addr,
+                    "campaign_hash": args["campaignNameHash"],
+                    "token": args["token"],
+                    "start_date": args["startDate"],
+                    "deadline": args["deadline"],
+                    "block_number": log.get("block_number", 0),
+                    "tx_hash": log.get("transaction_hash", ""),
+                })
+            self.profiler.end(span)
 
         # 중복 제거 (campaign_hash + contract_address 기준)
         seen = set()
@@ -235,6 +434,24 @@ class AirdropMonitor:
 
         return unique_campaigns
 
+    def blockscout_indexed_block(self) -> int | None:
+        """Blockscout가 인덱싱한 마지막 블록 (main-page/blocks의 최신 블록, 조회 실패 시 None)"""
+        url = f"{self.blockscout_api_url}/main-page/blocks"
+
+        def fetch(client: httpx.Client) -> list[dict]:
+            with self.profiler.span("blockscout.blocks") as span:
+                response = client.get(url)
+                span.bytes = len(response.content)
+                response.raise_for_status()
+                return response.json()
+
+        try:
+            with httpx.Client(timeout=30.0) as client:
+                blocks = self.scheduler.call(fetch, client, url=url)
+            return max((int(block["height"]) for block in blocks), default=None)
+        except Exception:
+            return None
+
     def get_claimed_events_from_blockscout(self, wallet_address: str | None = None) -> list[dict]:
         """Blockscout API를 통해 Claimed 이벤트 조회"""
         all_claims = []
@@ -243,97 +460,96 @@ class AirdropMonitor:
         for contract_addr in self.contract_addresses:
             logs = self.fetch_logs_from_blockscout(contract_addr)
 
-            for log in logs:
-                decoded = log.get("decoded")
-                if not decoded:
-                    continue
+            span = self.profiler.begin("decode.blockscout_logs", contract=contract_addr)
+            for log, args in self.blockscout_events(logs, "Claimed"):
+                user = args["user"]
 
-                method_call = decoded.get("method_call", "")
+                # 특정 지갑 필터링
+                if wallet_lower and user.lower() != wallet_lower:
+                    continue
 
-                if "Claimed" in method_call:
-                    params = {p["name"]: p["value"] for p in decoded.get("parameters", [])}
-                    user = params.get("user", "")
+                all_claims.append({
+                    "contract_address": contract_addr,
+                    "user": user,
+                    "campaign_hash": args["campaignNameHash"],
+                    "total_reward": args["totalReward"],
+                    "fee": args["fee"],
+                    "block_number": log.get("block_number", 0),
+                    "tx_hash": log.get("transaction_hash", ""),
+                })
+            self.profiler.end(span)
 
-                    # 특정 지갑 필터링
-                    if wallet_lower and user.lower() != wallet_lower:
-                        continue
+        return all_claims
 
-                    all_claims.append({
-                        "contract_address": contract_addr,
-                        "user": user,
-                        "campaign_hash": params.get("campaignNameHash", ""),
-                        "total_reward": int(params.get("totalReward", 0)),
-                        "fee": int(params.get("fee", 0)),
-                        "block_number": log.get("block_number", 0),
-                        "tx_hash": log.get("transaction_hash", ""),
-                    })
+    @staticmethod
+    def blockscout_events(logs: list[dict], event_name: str) -> list[tuple[dict, dict]]:
+        """Blockscout 로그 중 event_name 이벤트의 (로그, 인자) 목록
 
-        return all_claims
+        원본 topics/data가 있는 로그는 decode_logs_batch로 한 번에 디코딩하고,
+        없는 로그는 Blockscout가 디코딩한 파라미터를 사용합니다. bytes32 인자는 0x hex 문자열입니다.
+        """
+        event = EVENTS[event_name]
+        fields = event.indexed + event.data
+        events: list[tuple[dict, dict] | None] = []
+        raw_logs, raw_slots = [], []
+
+        for log in logs:
+            topics = [topic for topic in log.get("topics") or [] if topic]
+            if topics and log.get("data"):
+                if log_matches(event, topics, log["data"]):
+                    raw_logs.append({"topics": topics, "data": log["data"]})
+                    raw_slots.append((len(events), log))
+                    events.append(None)
+                continue
+
+            decoded = log.get("decoded")
+            if not decoded or event_name not in decoded.get("method_call", ""):
+                continue
+            params = {p["name"]: p["value"] for p in decoded.get("parameters", [])}
+            events.append((log, {
+                name: int(params.get(name, 0)) if "int" in abi_type else params.get(name, "")
+                for name, abi_type in fields
+            }))
+
+        columns = decode_logs_batch(event, raw_logs)
+        for name, abi_type in fields:
+            if abi_type.startswith("bytes"):
+                columns[name] = ["0x" + value.hex() for value in columns[name]]
+        for (slot, log), values in zip(raw_slots, zip(*columns.values())):
+            events[slot] = (log, dict(zip(columns, values)))
+        return events
 
     def get_campaign_name_hash(self, campaign_name: str) -> bytes:
         """캠페인 이름의 keccak256 해시 생성"""
-        return Web3.keccak(text=campaign_name)
+        return keccak_text(campaign_name)
 
     def get_reward_info_by_hash(
         self, campaign_hash: bytes, wallet_address: str
     ) -> RewardInfo:
         """특정 캠페인에서 지갑의 리워드 정보 조회"""
-        wallet = Web3.to_checksum_address(wallet_address)
-        result = self.contract.functions.rewardInfoByHash(campaign_hash, wallet).call()
-        return RewardInfo(
-            total_reward=result[0],
-            bonus_reward=result[1],
-            claimed=result[2],
-            required_additional_verification=result[3],
-        )
+        return RewardInfo(*self.call_function(self.contract_address, "rewardInfoByHash", campaign_hash, wallet_address))
 
     def get_reward_info(self, campaign_name: str, wallet_address: str) -> RewardInfo:
         """캠페인 이름으로 지갑의 리워드 정보 조회"""
-        wallet = Web3.to_checksum_address(wallet_address)
-        result = self.contract.functions.rewardInfo(campaign_name, wallet).call()
-        return RewardInfo(
-            total_reward=result[0],
-            bonus_reward=result[1],
-            claimed=result[2],
-            required_additional_verification=result[3],
-        )
+        return RewardInfo(*self.call_function(self.contract_address, "rewardInfo", campaign_name, wallet_address))
 
     def get_campaign_info_by_hash(self, campaign_hash: bytes) -> CampaignInfo:
         """캠페인 해시로 캠페인 정보 조회"""
-        result = self.contract.functions.campaignInfoByHash(campaign_hash).call()
-        return CampaignInfo(
-            token=result[0],
-            start_date=result[1],
-            deadline=result[2],
-            reclaimed=result[3],
-            total_amount=result[4],
-            total_claimed=result[5],
-        )
+        return CampaignInfo(*self.call_function(self.contract_address, "campaignInfoByHash", campaign_hash))
 
     def get_campaign_info(self, campaign_name: str) -> CampaignInfo:
         """캠페인 이름으로 캠페인 정보 조회"""
-        result = self.contract.functions.campaignInfo(campaign_name).call()
-        return CampaignInfo(
-            token=result[0],
-            start_date=result[1],
-            deadline=result[2],
-            reclaimed=result[3],
-            total_amount=result[4],
-            total_claimed=result[5],
-        )
+        return CampaignInfo(*self.call_function(self.contract_address, "campaignInfo", campaign_name))
 
     def get_token_campaigns(self, token_address: str) -> list[bytes]:
         """특정 토큰의 모든 캠페인 해시 목록 조회"""
-        token = Web3.to_checksum_address(token_address)
-        return self.contract.functions.tokenCampaigns(token).call()
+        return list(self.call_function(self.contract_address, "tokenCampaigns", token_address)[0])
 
     def get_all_reward_info(
         self, token_address: str, wallet_address: str
     ) -> list[tuple[bytes, RewardInfo]]:
         """특정 토큰의 모든 캠페인에서 지갑의 리워드 정보 조회"""
-        token = Web3.to_checksum_address(token_address)
-        wallet = Web3.to_checksum_address(wallet_address)
-        result = self.contract.functions.allRewardInfo(token, wallet).call()
+        result = self.call_function(self.contract_address, "allRewardInfo", token_address, wallet_address)
 
         campaign_hashes = result[0]
         total_rewards = result[1]
@@ -406,15 +622,11 @@ class AirdropMonitor:
             block_range: from_block이 None일 때 조회할 최근 블록 수
         """
         try:
-            latest_block = self.w3.eth.block_number
+            latest_block = self.block_number()
             if from_block is None:
                 from_block = max(0, latest_block - block_range)
 
-            # web3.py 7.x에서는 from_block, to_block 파라미터 사용
-            events = self.contract.events.RewardsAdded.get_logs(
-                from_block=from_block,
-                to_block=to_block,
-            )
+            events = self.get_logs(self.contract_address, "RewardsAdded", from_block, to_block)
 
             campaigns = []
             for event in events:
@@ -434,30 +646,149 @@ class AirdropMonitor:
     def get_claimed_events_for_wallet(
         self, wallet_address: str, from_block: int = 0, to_block: str | int = "latest"
     ) -> list[dict]:
-        """특정 지갑의 Claimed 이벤트 조회"""
-        wallet = Web3.to_checksum_address(wallet_address)
+        """특정 지갑의 Claimed 이벤트 조회 (모든 컨트랙트)"""
         try:
-            # web3.py 7.x에서는 from_block, to_block 파라미터 사용
-            events = self.contract.events.Claimed.get_logs(
-                from_block=from_block,
-                to_block=to_block,
-                argument_filters={"user": wallet},
-            )
-
-            claims = []
-            for event in events:
-                claims.append({
-                    "campaign_hash": event["args"]["campaignNameHash"].hex(),
-                    "total_reward": event["args"]["totalReward"],
-                    "fee": event["args"]["fee"],
-                    "block_number": event["blockNumber"],
-                    "tx_hash": event["transactionHash"].hex(),
-                })
-            return claims
+            claims = self.get_claimed_events_for_wallets([wallet_address], from_block, to_block)
+            return claims[wallet_address.lower()]
         except Exception as e:
             print(f"Error getting claimed events: {e}")
             return []
 
+    def get_claimed_events_for_wallets(
+        self,
+        wallet_addresses: list[str],
+        from_block: int = 0,
+        to_block: str | int = "latest",
+        contract_addresses: list[str] | None = None,
+    ) -> dict[str, list[dict]]:
+        """여러 지갑의 Claimed 이벤트를 모든 컨트랙트에서 조회 (소문자 지갑 주소 -> 수령 목록)
+
+        user는 indexed 인자이므로 지갑 topic을 RPC_TOPIC_FILTER_SIZE개씩 OR 필터로 묶고,
+        컨트랙트 주소 목록 필터로 모든 컨트랙트(contract_addresses가 주어지면 그 컨트랙트만)를 한 번에 조회합니다.
+        요청 수는 (지갑 수 / RPC_TOPIC_FILTER_SIZE) x (블록 수 / EVENT_LOG_BLOCK_RANGE)입니다.
+        """
+        if to_block == "latest":
+            to_block = self.scheduler.call(self.block_number)
+        wallets = list(dict.fromkeys(w.lower() for w in wallet_addresses))
+        claims: dict[str, list[dict]] = {wallet: [] for wallet in wallets}
+        contracts = {addr.lower(): addr for addr in self.contract_addresses}
+        filter_size = max(RPC_TOPIC_FILTER_SIZE, 1)
+
+        for start in range(0, len(wallets), filter_size):
+            topics = [[encode_topic("address", wallet) for wallet in wallets[start:start + filter_size]]]
+            for block in range(from_block, to_block + 1, EVENT_LOG_BLOCK_RANGE):
+                end = min(block + EVENT_LOG_BLOCK_RANGE - 1, to_block)
+                events = self.scheduler.call(
+                    self.get_logs, contract_addresses or list(contracts.values()), "Claimed", block, end, topics
+                )
+                for event in events:
+                    args = event["args"]
+                    claims[args["user"].lower()].append({
+                        "contract_address": contracts.get(event["address"].lower(), event["address"]),
+                        "campaign_hash": args["campaignNameHash"].hex(),
+                        "total_reward": args["totalReward"],
+                        "fee": args["fee"],
+                        "block_number": event["blockNumber"],
+                        "tx_hash": event["transactionHash"].hex(),
+                    })
+        return claims
+
+    def fetch_token_balances(self, pairs: list[tuple[str, str]], block: int) -> dict[tuple[str, str], int | None]:
+        """(지갑, 토큰) 쌍의 ERC-20 balanceOf를 block 기준으로 조회 ((지갑, 토큰) -> 잔액)
+
+        RPC_BATCH_SIZE개씩 eth_call을 묶어 보내고 decode_output_batch로 한 번에 디코딩합니다.
+        batch 전체가 실패하면 해당 batch를, 항목별 에러 응답이 revert가 아니면 그 항목을 하나씩 다시 조회하며
+        그래도 실패하거나 revert된 쌍은 None입니다.
+        """
+        fn = ERC20_FUNCTIONS["balanceOf"]
+        block_tag = hex(block)
+        balances: dict[tuple[str, str], int | None] = dict.fromkeys(pairs)
+        batch_size = max(RPC_BATCH_SIZE, 1)
+        for start in range(0, len(pairs), batch_size):
+            chunk = pairs[start:start + batch_size]
+            calls = [
+                ("eth_call", [{"to": token, "data": encode_call(fn, wallet)}, block_tag])
+                for wallet, token in chunk
+            ]
+            try:
+                responses = self.scheduler.call(self.rpc_pool.make_batch_request, calls)
+            except Exception:
+                responses = None
+            if not isinstance(responses, list) or len(responses) != len(chunk):
+                for pair in chunk:
+                    balances[pair] = self._fetch_token_balance(*pair, block)
+                continue
+
+            decoded = []
+            for pair, response in zip(chunk, responses):
+                result = response.get("result")
+                if len(result or "") == 2 + 2 * WORD:
+                    decoded.append((pair, result))
+                elif result != "0x" and not is_revert(response.get("error")):
+                    balances[pair] = self._fetch_token_balance(*pair, block)  # 노드 오류 등: 단일 조회로 재시도
+            with self.profiler.span("abi.decode_batch", size=len(decoded)) as span:
+                span.bytes = sum(len(result) // 2 for _, result in decoded)
+                (values,) = decode_output_batch(fn, [result for _, result in decoded])
+            for (pair, _), value in zip(decoded, values):
+                balances[pair] = value
+        return balances
+
+    def _fetch_token_balance(self, wallet: str, token: str, block: int) -> int | None:
+        """balanceOf 단일 조회 (일시적 오류는 재시도, 실패하거나 revert되면 None)"""
+        fn = ERC20_FUNCTIONS["balanceOf"]
+        try:
+            data = self.scheduler.call(self.rpc_pool.eth_call, token, encode_call(fn, wallet), block)
+            return decode_output(fn, data)[0]
+        except Exception:
+            return None
+
+    def reconcile(self, snapshot: Snapshot, block: int | None = None) -> Reconciliation:
+        """스캔 결과를 Claimed 이벤트 및 토큰 잔액과 대사 (reconciliation.py)
+
+        Claimed 이벤트(claimed_events)와 balanceOf(batch)를 스캔이 리워드를 조회한 블록
+        (snapshot.latest_block, AirdropMonitor.reward_block)에 고정해 조회하므로 조회 사이에 들어온 수령이
+        불일치로 보고되지 않습니다. latest_block 없이 스캔했으면 리워드는 latest 기준이므로 현재 블록과 비교합니다.
+        """
+        if block is None:
+            block = snapshot.latest_block if snapshot.latest_block is not None else self.scheduler.call(self.block_number)
+        with self.profiler.span("reconcile.claims"):
+            claims = self.claimed_events(list(snapshot.wallet_names), block)
+        with self.profiler.span("reconcile.balances"):
+            balances = self.fetch_token_balances(balance_pairs(snapshot), block)
+        return reconcile_claims(snapshot, block, claims, balances)
+
+    def claimed_events(self, wallet_addresses: list[str], block: int) -> dict[str, list[dict]]:
+        """block까지의 Claimed 이벤트 (소문자 지갑 주소 -> 수령 목록)
+
+        self.event_store가 있으면 block까지 증분 수집(ingest_events, reorg 처리 포함)한 뒤 저장소의
+        Claimed column에서 찾으므로, 매 스캔에는 마지막 수집 이후 블록만 조회합니다.
+        저장소가 다루지 않는 구간(EVENT_START_BLOCK 이전, 수집이 block까지 끝나지 않은 컨트랙트)만
+        지갑 topic OR 필터로 조회합니다. 저장소가 없으면 전체 구간을 OR 필터로 조회합니다.
+        """
+        store = self.event_store
+        if store is None:
+            return self.get_claimed_events_for_wallets(wallet_addresses, CAMPAIGN_LOG_START_BLOCK, block)
+        try:
+            self.ingest_events(store, block)
+        except Exception:
+            pass  # 수집하지 못한 구간은 아래에서 OR 필터로 조회
+
+        claims = store.claims({wallet.lower() for wallet in wallet_addresses}, block)
+        gaps: list[tuple[int, int, list[str]]] = []  # (시작 블록, 끝 블록, 컨트랙트 목록)
+        if EVENT_START_BLOCK > CAMPAIGN_LOG_START_BLOCK:
+            gaps.append((CAMPAIGN_LOG_START_BLOCK, EVENT_START_BLOCK - 1, self.contract_addresses))
+        behind: dict[int, list[str]] = {}  # 수집을 이어갈 블록 -> 컨트랙트 목록
+        for contract_addr in self.contract_addresses:
+            start = store.last_block.get(contract_addr, EVENT_START_BLOCK - 1) + 1
+            if start <= block:
+                behind.setdefault(max(start, EVENT_START_BLOCK), []).append(contract_addr)
+        gaps.extend((start, block, contracts) for start, contracts in behind.items())
+        for from_block, to_block, contracts in gaps:
+            found = self.get_claimed_events_for_wallets(wallet_addresses, from_block, to_block, contracts)
+            for wallet, events in found.items():
+                claims[wallet].extend(events)
+        return claims
+
     def check_wallets_by_campaign_hash(
         self, campaign_hash: bytes, wallets: dict[str, str]
     ) -> list[WalletReward]:
@@ -489,16 +820,12 @@ class AirdropMonitor:
         """모든 컨트랙트에서 캠페인 발견"""
         all_campaigns = []
 
-        for i, contract in enumerate(self.contracts):
-            contract_addr = self.contract_addresses[i]
+        for contract_addr in self.contract_addresses:
             try:
-                latest_block = self.w3.eth.block_number
+                latest_block = self.block_number()
                 start_block = from_block if from_block is not None else max(0, latest_block - block_range)
 
-                events = contract.events.RewardsAdded.get_logs(
-                    from_block=start_block,
-                    to_block=to_block,
-                )
+                events = self.get_logs(contract_addr, "RewardsAdded", start_block, to_block)
 
                 for event in events:
                     all_campaigns.append({
@@ -519,26 +846,16 @@ class AirdropMonitor:
         self, wallet_address: str
     ) -> list[dict]:
         """모든 컨트랙트에서 지갑의 리워드 조회"""
-        wallet = Web3.to_checksum_address(wallet_address)
         all_rewards = []
 
-        for i, contract in enumerate(self.contracts):
-            contract_addr = self.contract_addresses[i]
-
-            for campaign_name in KNOWN_CAMPAIGN_NAMES:
-                try:
-                    result = contract.functions.rewardInfo(campaign_name, wallet).call()
-                    if result[0] > 0:  # total_reward > 0
-                        all_rewards.append({
-                            "contract_address": contract_addr,
-                            "campaign_name": campaign_name,
-                            "total_reward": result[0],
-                            "bonus_reward": result[1],
-                            "claimed": result[2],
-                            "required_additional_verification": result[3],
-                        })
-                except Exception:
-                    pass
+        units = [
+            RewardLookup(contract_addr, campaign_name, True, "", wallet_address)
+            for contract_addr in self.contract_addresses
+            for campaign_name in KNOWN_CAMPAIGN_NAMES
+        ]
+        for unit, reward_info in zip(units, self.lookup_rewards(units)):
+            if reward_info is not None and reward_info.total_reward > 0:
+                all_rewards.append(self.reward_record(unit, reward_info))
 
         return all_rewards
 
@@ -546,43 +863,720 @@ class AirdropMonitor:
         self, contract_index: int, campaign_hash: bytes, wallet_address: str
     ) -> RewardInfo:
         """특정 컨트랙트에서 리워드 정보 조회"""
-        wallet = Web3.to_checksum_address(wallet_address)
-        contract = self.contracts[contract_index]
-        result = contract.functions.rewardInfoByHash(campaign_hash, wallet).call()
-        return RewardInfo(
+        return RewardInfo(*self.call_function(
+            self.contract_addresses[contract_index], "rewardInfoByHash", campaign_hash, wallet_address
+        ))
+
+    def check_wallets_on_all_contracts(
+        self, campaign_hash: bytes, wallets: dict[str, str], previous: Snapshot | None = None
+    ) -> list[dict]:
+        """모든 컨트랙트에서 캠페인 해시로 여러 지갑의 리워드 조회
+
+        previous 스냅샷에서 이미 수령 완료된 항목은 조회하지 않고 저장된 값을 사용합니다.
+        """
+        campaign_hex = campaign_hash.hex() if isinstance(campaign_hash, bytes) else campaign_hash
+        rewards: list[tuple[RewardLookup, RewardInfo | None]] = []
+        pending = []  # 조회가 필요한 rewards 위치
+
+        for contract_addr in self.contract_addresses:
+            for name, address in wallets.items():
+                unit = RewardLookup(contract_addr, campaign_hex, False, name, address)
+                final = previous.final_reward(contract_addr, campaign_hex, address) if previous else None
+                if final is not None:
+                    self.reused_rewards += 1
+                    rewards.append((unit, RewardInfo(*final)))
+                else:
+                    pending.append(len(rewards))
+                    rewards.append((unit, None))
+
+        looked_up = self.lookup_rewards([rewards[i][0] for i in pending])
+        for i, reward_info in zip(pending, looked_up):
+            if reward_info is not None and reward_info.total_reward > 0:
+                rewards[i] = (rewards[i][0], reward_info)
+
+        return [self.reward_record(unit, reward_info) for unit, reward_info in rewards if reward_info is not None]
+
+    # =========================================================================
+    # Campaign Discovery (Blockscout + RPC logs)
+    # =========================================================================
+
+    def discover_campaigns(self, latest_block: int | None = None, source: str | None = None) -> list[dict]:
+        """캠페인 발견 (source: hybrid, blockscout, rpc - None이면 self.discovery_source)
+
+        소스별 캠페인 수와 소요 시간, 조회 범위는 self.discovery_stats에 기록합니다.
+        """
+        source = source or self.discovery_source
+        if source not in DISCOVERY_SOURCES:
+            raise ValueError(f"Unknown discovery source: {source}. Use: {list(DISCOVERY_SOURCES)}")
+
+        started = time.monotonic()
+        if source == "blockscout":
+            campaigns = self.discover_campaigns_from_blockscout()
+            self.discovery_stats = DiscoveryStats(
+                source, len(campaigns), time.monotonic() - started, None, None, None, None, latest_block
+            )
+            return campaigns
+
+        head = latest_block if latest_block is not None else self.scheduler.call(self.block_number)
+        if source == "hybrid":
+            return self.discover_campaigns_hybrid(head)
+
+        progress = LogProgress(head)
+        try:
+            self.discover_campaigns_from_logs(to_block=head, progress=progress)
+        except Exception as e:
+            print(f"Error discovering campaigns from RPC logs: {e}")
+        campaigns, from_block = progress.snapshot()
+        self.discovery_stats = DiscoveryStats(
+            source, None, None, None, len(campaigns),
+            time.monotonic() - started if progress.error is None else None, from_block, head,
+        )
+        return campaigns
+
+    def discover_campaigns_from_logs(
+        self,
+        from_block: int | None = None,
+        to_block: int | None = None,
+        progress: LogProgress | None = None,
+        stop: threading.Event | None = None,
+    ) -> list[dict]:
+        """RPC eth_getLogs로 모든 컨트랙트의 캠페인 발견 (최신 블록부터 과거로)
+
+        컨트랙트 주소 목록 필터로 EVENT_LOG_BLOCK_RANGE 블록씩, DISCOVERY_WORKERS개 구간을 동시에 조회하고
+        구간이 끝날 때마다 progress에 기록합니다. stop이 설정되면 남은 구간은 조회하지 않습니다.
+        같은 캠페인의 RewardsAdded가 여러 번 있으면 Blockscout 발견처럼 가장 최근 이벤트를 사용합니다.
+
+        Args:
+            from_block: 시작 블록 (None이면 CAMPAIGN_LOG_START_BLOCK)
+            to_block: 끝 블록 (None이면 최신 블록)
+        """
+        head = to_block if to_block is not None else self.scheduler.call(self.block_number)
+        start = from_block if from_block is not None else CAMPAIGN_LOG_START_BLOCK
+        progress = progress if progress is not None else LogProgress(head)
+        ranges = [
+            (max(end - EVENT_LOG_BLOCK_RANGE + 1, start), end)
+            for end in range(head, start - 1, -EVENT_LOG_BLOCK_RANGE)
+        ]
+        contracts = {addr.lower(): addr for addr in self.contract_addresses}
+        seen = set()
+
+        def fetch(block_range: tuple[int, int]) -> list[dict] | None:
+            if stop is not None and stop.is_set():
+                return None
+            return self.scheduler.call(self.get_logs, list(contracts.values()), "RewardsAdded", *block_range)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(DISCOVERY_WORKERS, 1)) as executor:
+                for (block, _), events in zip(ranges, executor.map(fetch, ranges)):
+                    if events is None:
+                        break
+                    campaigns = []
+                    for event in reversed(events):
+                        args = event["args"]
+                        contract_addr = contracts.get(event["address"].lower(), event["address"])
+                        key = (contract_addr, args["campaignNameHash"])
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        campaigns.append({
+                            "contract_address": contract_addr,
+                            "campaign_hash": "0x" + args["campaignNameHash"].hex(),
+                            "token": args["token"],
+                            "start_date": args["startDate"],
+                            "deadline": args["deadline"],
+                            "block_number": event["blockNumber"],
+                            "tx_hash": "0x" + event["transactionHash"].hex(),
+                        })
+                    progress.add(block, campaigns)
+        except Exception as e:
+            progress.finish(e)
+            raise
+        progress.finish()
+        return progress.snapshot()[0]
+
+    def discover_campaigns_hybrid(self, latest_block: int) -> list[dict]:
+        """Blockscout와 RPC 로그를 동시에 조회해 합친 캠페인 목록
+
+        1. Blockscout 로그 조회와 RPC 로그 조회(최신 블록부터)를 동시에 시작합니다.
+        2. Blockscout가 먼저 끝나면 인덱싱한 마지막 블록 이후 구간을 RPC 로그로 확보할 때까지 기다립니다.
+           Blockscout 조회가 실패한 컨트랙트가 있으면 RPC 로그 전체를 기다립니다.
+        3. 그 뒤로는 self.crosscheck_wait초까지만 나머지 소스를 기다리고 (기본 0: 바로 반환), 그때까지 두 소스가
+           함께 조회한 구간에서 캠페인을 교차 검증합니다. RPC 로그가 먼저 전부 끝난 경우도 같습니다.
+        """
+        progress = LogProgress(latest_block)
+        stop = threading.Event()
+        failed: list[str] = []
+        timings: dict[str, float] = {}
+        started = time.monotonic()
+
+        def run_blockscout() -> tuple[list[dict], int | None]:
+            campaigns = self.discover_campaigns_from_blockscout(failed, stop)
+            indexed = self.blockscout_indexed_block()
+            if indexed is None:
+                # 인덱싱 블록을 모르면 Blockscout가 아는 마지막 캠페인 블록까지만 믿음
+                indexed = max((c["block_number"] for c in campaigns), default=CAMPAIGN_LOG_START_BLOCK - 1)
+            timings["blockscout"] = time.monotonic() - started
+            return campaigns, indexed
+
+        def run_logs() -> None:
+            try:
+                self.discover_campaigns_from_logs(to_block=latest_block, progress=progress, stop=stop)
+                timings["rpc"] = time.monotonic() - started
+            except Exception as e:
+                print(f"Error discovering campaigns from RPC logs: {e}")
+
+        executor = ThreadPoolExecutor(max_workers=2)
+        # worker 스레드의 진행 출력도 호출한 스레드의 출력(동시 스캔이면 네트워크별 버퍼)으로 보냄
+        blockscout_future = executor.submit(inherit_stdout(run_blockscout))
+        logs_future = executor.submit(inherit_stdout(run_logs))
+        blockscout = indexed = None
+        try:
+            wait([blockscout_future, logs_future], return_when=FIRST_COMPLETED)
+            if blockscout_future.done() or progress.error is not None:
+                blockscout, indexed = blockscout_future.result()
+                progress.wait_until(CAMPAIGN_LOG_START_BLOCK if failed else indexed + 1)
+                if self.crosscheck_wait > 0:
+                    progress.wait_done(self.crosscheck_wait)
+            else:
+                with contextlib.suppress(FuturesTimeoutError):
+                    blockscout, indexed = blockscout_future.result(timeout=self.crosscheck_wait)
+        finally:
+            stop.set()
+            executor.shutdown(wait=False)
+
+        logs, from_block = progress.snapshot()
+        if from_block > latest_block:
+            logs = None
+        campaigns, tail, blockscout_only, rpc_only = merge_campaigns(blockscout, indexed, logs, from_block)
+        self.discovery_stats = DiscoveryStats(
+            "hybrid",
+            len(blockscout) if blockscout is not None else None,
+            timings.get("blockscout"),
+            indexed,
+            len(logs) if logs is not None else None,
+            timings.get("rpc"),
+            from_block if logs is not None else None,
+            latest_block,
+            tail,
+            blockscout_only,
+            rpc_only,
+            len(failed),
+        )
+        return campaigns
+
+    # =========================================================================
+    # Contract Discovery
+    # =========================================================================
+
+    def discover_contracts(self, registry: ContractRegistry | None = None, to_block: int | None = None) -> list[str]:
+        """주소 필터 없이 RewardsAdded/Claimed 로그를 조회해 새 RedeemableAirdrop 컨트랙트 발견
+
+        registry.last_block 이후 블록을 DISCOVERY_BLOCK_RANGE씩 나누어 DISCOVERY_WORKERS개씩 동시에 조회하고,
+        처음 보는 주소는 verify_contract로 확인한 뒤 registry와 self.contract_addresses에 추가합니다.
+        checkpoint는 앞에서부터 끝난 구간까지만 갱신하므로 중간에 실패해도 다음 발견이 이어서 조회합니다.
+
+        Returns:
+            새로 등록한 컨트랙트 주소 목록
+        """
+        registry = registry if registry is not None else self.registry
+        head = to_block if to_block is not None else self.scheduler.call(self.block_number)
+        start = max(registry.last_block + 1, DISCOVERY_START_BLOCK)
+        ranges = [
+            (block, min(block + DISCOVERY_BLOCK_RANGE - 1, head))
+            for block in range(start, head + 1, DISCOVERY_BLOCK_RANGE)
+        ]
+        topic0 = [EVENTS["RewardsAdded"].topic0, EVENTS["Claimed"].topic0]
+
+        def fetch(block_range: tuple[int, int]) -> list[dict]:
+            from_block, end = block_range
+            return self.scheduler.call(self.rpc_pool.request, "eth_getLogs", [{
+                "fromBlock": hex(from_block),
+                "toBlock": hex(end),
+                "topics": [topic0],
+            }])
+
+        found = []
+        try:
+            with ThreadPoolExecutor(max_workers=max(DISCOVERY_WORKERS, 1)) as executor:
+                for (_, end), logs in zip(ranges, executor.map(fetch, ranges)):
+                    for log in logs:
+                        address = to_checksum_address(log["address"])
+                        if address in self.contract_addresses or registry.known(address):
+                            continue
+                        if self.verify_contract(address):
+                            registry.contracts[address] = int(log["blockNumber"], 16)
+                            found.append(address)
+                        else:
+                            registry.rejected.add(address.lower())
+                    registry.last_block = end
+        finally:
+            self.contract_addresses.extend(found)
+        return found
+
+    def verify_contract(self, address: str) -> bool:
+        """RedeemableAirdrop ABI로 조회되는 컨트랙트인지 확인 (일시적 오류는 그대로 raise)
+
+        같은 이벤트 시그니처를 쓰는 다른 컨트랙트는 campaignInfoByHash 조회가 revert되거나
+        반환값이 ABI와 맞지 않습니다.
+        """
+        try:
+            self.scheduler.call(self.call_function, address, "campaignInfoByHash", bytes(32))
+            return True
+        except Exception as e:
+            if is_retryable(e):
+                raise
+            return False
+
+    # =========================================================================
+    # Event Store
+    # =========================================================================
+
+    def ingest_events(self, store: EventStore, to_block: int | None = None) -> IngestResult:
+        """RewardsAdded/Claimed 이벤트를 store에 증분 수집
+
+        먼저 미확정 블록의 해시를 다시 확인해 reorg가 있었으면 갈라진 블록 이후만 되돌립니다.
+        그 다음 컨트랙트마다 store.last_block 이후 블록을 EVENT_LOG_BLOCK_RANGE씩 조회하며,
+        구간마다 last_block을 갱신하므로 중간에 실패해도 수집한 구간은 유지됩니다.
+        이벤트 블록의 timestamp와 새 캠페인 토큰의 decimals도 함께 저장합니다.
+        """
+        head = to_block if to_block is not None else self.scheduler.call(self.block_number)
+        reorg_block = self.check_reorg(store)
+        removed = store.rollback(reorg_block) if reorg_block is not None else 0
+
+        # 로그보다 먼저 head 해시를 기록해 두면 수집 도중의 reorg도 다음 수집 때 감지됨
+        if head > store.confirmed_block and EVENT_CONFIRMATIONS > 0:
+            block = self.fetch_blocks([head]).get(head)
+            if block is not None:
+                store.block_hashes[head] = block["hash"]
+
+        added = 0
+        for contract_addr in self.contract_addresses:
+            start = store.last_block.get(contract_addr, EVENT_START_BLOCK - 1) + 1
+            for from_block in range(start, head + 1, EVENT_LOG_BLOCK_RANGE):
+                end = min(from_block + EVENT_LOG_BLOCK_RANGE - 1, head)
+                for event_name in EVENT_COLUMNS:
+                    logs = self.scheduler.call(self.get_logs, contract_addr, event_name, from_block, end)
+                    store.append(event_name, contract_addr, logs)
+                    added += len(logs)
+                store.last_block[contract_addr] = end
+        store.confirm(head - EVENT_CONFIRMATIONS)
+
+        for token in set(store.columns["RewardsAdded"]["token"]):
+            if token.lower() not in store.token_decimals:
+                # 파일에 계속 남으므로 확인된 값만 저장 (일시적 오류는 다음 수집 때 다시 조회)
+                decimals = self._fetch_token_decimals(token)
+                if decimals is not None:
+                    store.token_decimals[token.lower()] = decimals
+                    TOKEN_DECIMALS.set(token, decimals)
+        self.fetch_block_times(store)
+        return IngestResult(added, removed, reorg_block)
+
+    def check_reorg(self, store: EventStore) -> int | None:
+        """보관한 미확정 블록 해시를 현재 체인과 비교해 reorg된 첫 블록 반환 (없으면 None)
+
+        가장 최근 블록 해시가 같으면 그 이전 블록도 같으므로 요청 하나로 끝납니다.
+        다르면 보관한 블록을 모두 조회해, 해시가 같은 마지막 블록 (없으면 확정 블록) 다음을 반환합니다.
+        """
+        if not store.block_hashes:
+            return None
+        tracked = sorted(store.block_hashes)
+        latest = self.fetch_blocks(tracked[-1:]).get(tracked[-1])
+        if latest is not None and latest["hash"] == store.block_hashes[tracked[-1]]:
+            return None
+
+        current = self.fetch_blocks(tracked)
+        common = store.confirmed_block
+        for block in tracked:
+            if block not in current or current[block]["hash"] != store.block_hashes[block]:
+                break
+            common = block
+        return common + 1
+
+    def fetch_blocks(self, blocks: list[int]) -> dict[int, dict]:
+        """eth_getBlockByNumber batch 조회 (블록 번호 -> 블록, 아직 없는 블록은 제외)"""
+        found = {}
+        batch_size = max(RPC_BATCH_SIZE, 1)
+        for start in range(0, len(blocks), batch_size):
+            chunk = blocks[start:start + batch_size]
+            responses = self.scheduler.call(
+                self.rpc_pool.make_batch_request,
+                [("eth_getBlockByNumber", [hex(block), False]) for block in chunk],
+            )
+            if not isinstance(responses, list):
+                raise RpcResponseError("eth_getBlockByNumber", responses.get("error", responses))
+            for block, response in zip(chunk, responses):
+                if response.get("result"):
+                    found[block] = response["result"]
+        return found
+
+    def fetch_block_times(self, store: EventStore) -> None:
+        """timestamp를 모르는 이벤트 블록을 조회해 store에 기록"""
+        for block, result in self.fetch_blocks(store.missing_block_times()).items():
+            store.block_times[block] = int(result["timestamp"], 16)
+
+    # =========================================================================
+    # Retry / Dead-letter
+    # =========================================================================
+
+    def lookup_reward(self, unit: RewardLookup) -> RewardInfo | None:
+        """작업 단위 하나를 조회 (일시적 오류는 재시도)
+
+        재시도 후에도 실패하거나 revert가 아닌 JSON-RPC 에러면 dead-letter에 기록하고 None을 반환합니다.
+        revert 등 재시도 불가 오류는 보상이 없는 것으로 보고 None을 반환합니다.
+        refresh 스케줄러가 설정되어 있으면 재조회 시각이 되지 않은 항목은 마지막 조회 결과를 반환합니다.
+        checkpoint에 기록된 항목은 조회하지 않고 기록된 결과를 반환합니다. 리워드 없음은 revert가
+        확인된 경우에만 기록하므로 일시적 오류로 끝난 조회는 --resume에서 다시 조회됩니다.
+        """
+        if self.checkpoint is not None:
+            found, reward_info = self.resumed_reward(unit)
+            if found:
+                return reward_info
+
+        refresh_key = self.refresh_key(unit)
+        if refresh_key is not None and not self.refresh.is_due(refresh_key):
+            return self.refresh.cached(refresh_key)
+
+        try:
+            result = self.scheduler.call(
+                self.call_function_at,
+                self.reward_block_tag,
+                unit.contract_address,
+                *self.reward_call(unit),
+                unit.wallet_address,
+            )
+        except Exception as e:
+            if is_retryable(e) or (isinstance(e, RpcResponseError) and not is_revert(e)):
+                self.scheduler.dead_letter(unit, e)
+            elif is_revert(e):
+                self.record_completed(unit, None)  # revert가 확인된 경우만 리워드 없음으로 기록
+            return None
+
+        reward_info = RewardInfo(
             total_reward=result[0],
             bonus_reward=result[1],
             claimed=result[2],
             required_additional_verification=result[3],
         )
+        if refresh_key is not None:
+            self.refresh.record(refresh_key, reward_info)
+        self.record_completed(unit, reward_info)
+        return reward_info
 
-    def check_wallets_on_all_contracts(
-        self, campaign_hash: bytes, wallets: dict[str, str]
-    ) -> list[dict]:
-        """모든 컨트랙트에서 캠페인 해시로 여러 지갑의 리워드 조회"""
-        results = []
+    def lookup_rewards(self, units: list[RewardLookup]) -> list[RewardInfo | None]:
+        """작업 단위 여러 개를 JSON-RPC batch로 조회 (units와 같은 순서로 반환)
 
-        for i, contract in enumerate(self.contracts):
-            contract_addr = self.contract_addresses[i]
+        RPC_BATCH_SIZE개씩 eth_call을 묶어 보내고, 반환값은 decode_output_batch로 한 번에 디코딩합니다.
+        batch 전체가 실패하면 해당 batch의 작업 단위를, 항목별 에러 응답이 revert가 아니면 그 항목을
+        lookup_reward로 하나씩 다시 조회하며 (재시도/dead-letter 처리 포함), revert된 항목은 None입니다.
+        """
+        results: list[RewardInfo | None] = [None] * len(units)
+        pending: list[tuple[int, tuple | None]] = []  # (units 위치, refresh key)
+        for i, unit in enumerate(units):
+            if self.checkpoint is not None:
+                found, results[i] = self.resumed_reward(unit)
+                if found:
+                    continue
+            refresh_key = self.refresh_key(unit)
+            if refresh_key is not None and not self.refresh.is_due(refresh_key):
+                results[i] = self.refresh.cached(refresh_key)
+            else:
+                pending.append((i, refresh_key))
+
+        if RPC_BATCH_SIZE <= 1:
+            for i, _ in pending:
+                results[i] = self.lookup_reward(units[i])
+            return results
+
+        output_fn = FUNCTIONS["rewardInfoByHash"]  # rewardInfo와 반환 레이아웃이 같음
+        block_tag = self.reward_block_tag
+        for start in range(0, len(pending), RPC_BATCH_SIZE):
+            chunk = pending[start:start + RPC_BATCH_SIZE]
+            calls = []
+            for i, _ in chunk:
+                unit = units[i]
+                name, *args = self.reward_call(unit)
+                calls.append(("eth_call", [
+                    {"to": unit.contract_address, "data": encode_call(FUNCTIONS[name], *args, unit.wallet_address)},
+                    block_tag,
+                ]))
+            try:
+                responses = self.scheduler.call(self.rpc_pool.make_batch_request, calls)
+            except Exception:
+                responses = None
+            if not isinstance(responses, list) or len(responses) != len(chunk):
+                for i, _ in chunk:
+                    results[i] = self.lookup_reward(units[i])
+                continue
+
+            decoded = []
+            for (i, refresh_key), response in zip(chunk, responses):
+                result = response.get("result")
+                if len(result or "") == 2 + 2 * WORD * len(output_fn.output_types):
+                    decoded.append((i, refresh_key, result))
+                elif is_revert(response.get("error")):
+                    self.record_completed(units[i], None)  # revert: 리워드 없음
+                elif result != "0x":
+                    results[i] = self.lookup_reward(units[i])  # 노드 오류 등: 단일 조회로 재시도
+            with self.profiler.span("abi.decode_batch", size=len(decoded)) as span:
+                span.bytes = sum(len(result) // 2 for _, _, result in decoded)
+                columns = decode_output_batch(output_fn, [result for _, _, result in decoded])
+            for (i, refresh_key, _), values in zip(decoded, zip(*columns)):
+                reward_info = RewardInfo(*values)
+                results[i] = reward_info
+                if refresh_key is not None:
+                    self.refresh.record(refresh_key, reward_info)
+                self.record_completed(units[i], reward_info)
+        return results
 
-            for name, address in wallets.items():
+    @property
+    def reward_block_tag(self) -> str:
+        """리워드 조회 eth_call의 block 파라미터 (reward_block이 없으면 latest)"""
+        return hex(self.reward_block) if self.reward_block is not None else "latest"
+
+    def resumed_reward(self, unit: RewardLookup) -> tuple[bool, RewardInfo | None]:
+        """checkpoint에 기록된 작업 단위면 (True, 기록된 리워드)"""
+        found, reward = self.checkpoint.lookup(unit.contract_address, unit.campaign, unit.by_name, unit.wallet_address)
+        return found, RewardInfo(*reward) if reward is not None else None
+
+    def record_completed(self, unit: RewardLookup, reward_info: RewardInfo | None) -> None:
+        """완료한 작업 단위를 checkpoint에 기록 (checkpoint가 없으면 무시)"""
+        if self.checkpoint is not None:
+            self.checkpoint.record(unit.contract_address, unit.campaign, unit.by_name, unit.wallet_address, reward_info)
+
+    def refresh_key(self, unit: RewardLookup) -> tuple | None:
+        """refresh 스케줄러 key (스케줄러가 없으면 None)"""
+        if self.refresh is None:
+            return None
+        campaign_key = unit.campaign if unit.by_name else normalize_campaign_hash(unit.campaign)
+        return (unit.contract_address, campaign_key, unit.wallet_address.lower())
+
+    @staticmethod
+    def reward_call(unit: RewardLookup) -> tuple[str, str | bytes]:
+        """작업 단위의 리워드 조회 함수 이름과 캠페인 인자"""
+        if unit.by_name:
+            return "rewardInfo", unit.campaign
+        return "rewardInfoByHash", bytes.fromhex(unit.campaign.removeprefix("0x"))
+
+    @staticmethod
+    def reward_record(unit: RewardLookup, reward_info: RewardInfo) -> dict:
+        """조회 결과를 리포트용 dict로 변환"""
+        record = {"contract_address": unit.contract_address}
+        if unit.by_name:
+            record["campaign_name"] = unit.campaign
+        else:
+            record["wallet_name"] = unit.wallet_name
+            record["wallet_address"] = unit.wallet_address
+            record["campaign_hash"] = unit.campaign
+        record.update({
+            "total_reward": reward_info.total_reward,
+            "bonus_reward": reward_info.bonus_reward,
+            "claimed": reward_info.claimed,
+            "required_additional_verification": reward_info.required_additional_verification,
+        })
+        return record
+
+    def retry_dead_letters(self) -> list[tuple[RewardLookup, RewardInfo]]:
+        """스캔 중 실패한 리워드 조회를 다시 시도
+
+        복구된 (작업 단위, 리워드) 목록을 반환하며, 다시 실패한 작업과
+        리워드 조회가 아닌 작업은 dead-letter 목록에 남습니다.
+        """
+        recovered = []
+        self.scheduler.reset_retry_budget()
+        for letter in self.scheduler.drain_dead_letters():
+            if not isinstance(letter.unit, RewardLookup):
+                self.scheduler.dead_letters.append(letter)
+                continue
+            reward_info = self.lookup_reward(letter.unit)
+            if reward_info is not None:
+                recovered.append((letter.unit, reward_info))
+        return recovered
+
+    def update_refresh_campaigns(self, campaigns: list[dict]) -> None:
+        """발견된 캠페인의 마감/회수 상태를 self.refresh에 반영 (캠페인마다 campaignInfoByHash 한 번)
+
+        회수는 되돌릴 수 없으므로 이미 회수된 캠페인은 다시 조회하지 않고, 조회에 실패하면
+        이전에 확인한 상태를 유지합니다 (재조회 주기에만 영향, 다음 스캔에서 다시 확인).
+        """
+        refresh = self.refresh
+        for campaign in campaigns:
+            key = normalize_campaign_hash(campaign["campaign_hash"])
+            known = refresh.campaigns.get(key)
+            reclaimed = known is not None and known.reclaimed
+            if not reclaimed:
                 try:
-                    reward_info = self.get_reward_from_contract(i, campaign_hash, address)
-                    if reward_info.total_reward > 0:
-                        results.append({
-                            "contract_address": contract_addr,
-                            "wallet_name": name,
-                            "wallet_address": address,
-                            "campaign_hash": campaign_hash.hex() if isinstance(campaign_hash, bytes) else campaign_hash,
-                            "total_reward": reward_info.total_reward,
-                            "bonus_reward": reward_info.bonus_reward,
-                            "claimed": reward_info.claimed,
-                            "required_additional_verification": reward_info.required_additional_verification,
-                        })
+                    campaign_info = CampaignInfo(*self.scheduler.call(
+                        self.call_function, campaign["contract_address"], "campaignInfoByHash", bytes.fromhex(key)
+                    ))
+                    reclaimed = campaign_info.reclaimed
                 except Exception:
                     pass
+            refresh.update_campaign(key, campaign["deadline"], reclaimed)
 
-        return results
+    # =========================================================================
+    # Scan Engine
+    # =========================================================================
+
+    def scan(
+        self,
+        wallets: dict[str, str],
+        report: "ScanReport | None" = None,
+        latest_block: int | None = None,
+        previous: Snapshot | None = None,
+        campaigns: list[dict] | None = None,
+    ) -> ScanResult:
+        """캠페인 발견, 리워드 조회, 실패한 조회 재시도까지 스캔 1회 실행
+
+        리워드는 도착하는 즉시 ScanResult에 추가되어 지갑/컨트랙트/캠페인별 합계가 함께
+        갱신됩니다. report가 주어지면 진행 상황과 결과를 이벤트로 전달합니다.
+
+        Args:
+            wallets: {지갑 이름: 주소}
+            report: 결과 renderer (None이면 출력 없음)
+            latest_block: 리워드를 조회할 블록이자 결과에 기록할 최신 블록 번호 (None이면 latest 기준)
+            previous: 이전 스캔 스냅샷 (수령 완료된 항목은 다시 조회하지 않음)
+            campaigns: 이미 발견한 캠페인 목록 (주어지면 캠페인 발견 생략, 샤드 worker용)
+
+        self.refresh가 설정되어 있으면 발견된 캠페인의 마감/회수 상태를 스케줄러에 반영하고,
+        재조회 시각이 되지 않은 (컨트랙트, 캠페인, 지갑)은 마지막 조회 결과를 사용합니다.
+        """
+        report = report or ScanReport()
+        profiler = self.profiler
+        result = ScanResult(self.network, wallets, self.contract_addresses, latest_block)
+        started = time.monotonic()
+        self.scheduler.drain_dead_letters()
+        self.reused_rewards = 0
+        self.reward_block = latest_block  # 리워드를 latest_block 기준으로 조회 (reconcile이 같은 블록과 비교)
+        refresh = self.refresh
+        if refresh is not None:
+            refresh.reset_counts()
+
+        # 1. Blockscout API와 RPC 로그로 캠페인 발견 (discovery_source)
+        source = self.discovery_source
+        report.section(f"Discovering Campaigns via {DISCOVERY_SOURCE_LABELS[source]}...")
+        if source != "rpc":
+            report.status(f"Blockscout API: {self.blockscout_api_url}")
+
+        checkpoint = self.checkpoint
+        if campaigns is None and checkpoint is not None and checkpoint.campaigns is not None:
+            campaigns = checkpoint.campaigns
+            report.status(f"Resuming from checkpoint: {len(campaigns)} campaign(s), {len(checkpoint)} completed lookup(s)")
+        with profiler.span("scan.discovery"):
+            if campaigns is None:
+                campaigns = self.discover_campaigns(latest_block)
+                if source == "hybrid":
+                    for line in describe_discovery(self.discovery_stats):
+                        report.status(line)
+            result.campaigns = campaigns
+        if checkpoint is not None and checkpoint.campaigns is None:
+            checkpoint.record_campaigns(result.campaigns)
+
+        if refresh is not None:
+            self.update_refresh_campaigns(result.campaigns)
+
+        if result.campaigns:
+            report.status(f"\nFound {len(result.campaigns)} campaign(s). Checking for rewards...")
+
+            # 먼저 모든 캠페인에서 보상 확인
+            with profiler.span("scan.campaign_rewards"):
+                for campaign in result.campaigns:
+                    campaign_hash = bytes.fromhex(normalize_campaign_hash(campaign["campaign_hash"]))
+                    rewards = self.check_wallets_on_all_contracts(campaign_hash, wallets, previous)
+                    rewards = [r for r in rewards if r["total_reward"] > 0]
+                    decimals = self.token_decimals(campaign["token"]) if rewards else DEFAULT_TOKEN_DECIMALS
+                    for reward in rewards:
+                        reward["decimals"] = decimals
+                        result.add_reward(campaign, reward)
+                    if rewards:
+                        report.campaign_rewards(campaign, rewards)
+
+            if self.reused_rewards:
+                report.status(f"  ({self.reused_rewards} claimed reward(s) reused from the previous snapshot)")
+            report.discovery_done(result)
+        else:
+            report.status("\nNo campaigns discovered yet.")
+
+        # 2. 모든 컨트랙트에서 알려진 캠페인 이름들 확인
+        report.section("Checking Known Campaign Names (All Contracts)...")
+
+        found_any = False
+        known_decimals: dict[tuple[str, str], int] = {}  # (컨트랙트, 캠페인 이름) -> 토큰 decimals
+        with profiler.span("scan.known_names"):
+            for contract_addr in self.contract_addresses:
+                for campaign_name in KNOWN_CAMPAIGN_NAMES:
+                    try:
+                        campaign_info = CampaignInfo(*self.scheduler.call(
+                            self.call_function, contract_addr, "campaignInfo", campaign_name
+                        ))
+                    except Exception as e:
+                        if is_retryable(e):
+                            self.scheduler.dead_letter(("campaignInfo", contract_addr, campaign_name), e)
+                        continue
+
+                    if campaign_info.token == "0x0000000000000000000000000000000000000000":
+                        continue
+
+                    found_any = True
+                    if refresh is not None:
+                        refresh.update_campaign(campaign_name, campaign_info.deadline, campaign_info.reclaimed)
+                    decimals = known_decimals[(contract_addr, campaign_name)] = self.token_decimals(campaign_info.token)
+                    result.known_name_campaigns.append((contract_addr, campaign_name, campaign_info, decimals))
+                    report.known_name_campaign(contract_addr, campaign_name, campaign_info)
+
+                    # 각 지갑 확인
+                    for wallet_name, wallet_addr in wallets.items():
+                        unit = RewardLookup(contract_addr, campaign_name, True, wallet_name, wallet_addr)
+                        reward_info = self.lookup_reward(unit)
+                        if reward_info is not None and reward_info.total_reward > 0:
+                            result.known_name_rewards.append((unit, reward_info))
+                            report.known_name_reward(unit, reward_info, decimals)
+
+        if not found_any:
+            report.status("\nNo active campaigns found with known names.")
+
+        if refresh is not None and refresh.skipped:
+            report.status(
+                f"\nDeadline schedule: {refresh.refreshed} lookup(s) refreshed, "
+                f"{refresh.skipped} not yet due (last result reused)"
+            )
+
+        # 실패한 조회를 스캔 마지막에 재시도
+        if self.scheduler.dead_letters:
+            report.section(f"Retrying {len(self.scheduler.dead_letters)} failed lookup(s)...")
+
+            with profiler.span("scan.retry_dead_letters"):
+                campaigns_by_hash = {
+                    normalize_campaign_hash(c["campaign_hash"]): c for c in result.campaigns
+                }
+                for unit, reward_info in self.retry_dead_letters():
+                    if reward_info.total_reward == 0:
+                        continue
+                    if unit.by_name:
+                        decimals = known_decimals.get((unit.contract_address, unit.campaign), DEFAULT_TOKEN_DECIMALS)
+                        result.known_name_rewards.append((unit, reward_info))
+                        report.recovered_reward(unit, reward_info, decimals)
+                        continue
+
+                    # 복구된 해시 조회 결과를 집계에 반영
+                    campaign = campaigns_by_hash.get(normalize_campaign_hash(unit.campaign))
+                    if campaign is None:
+                        continue
+                    decimals = self.token_decimals(campaign["token"])
+                    result.add_reward(campaign, dict(self.reward_record(unit, reward_info), decimals=decimals))
+                    report.recovered_reward(unit, reward_info, decimals)
+
+        if checkpoint is not None:
+            checkpoint.flush()
+            if checkpoint.resumed:
+                report.status(f"\n{checkpoint.resumed} lookup(s) skipped (completed before resume)")
+
+        result.reused_rewards = self.reused_rewards
+        result.failed = list(self.scheduler.dead_letters)
+        if result.failed:
+            report.failed_lookups(result.failed)
+
+        result.duration = time.monotonic() - started
+        return result
 
 
 # =============================================================================
@@ -590,9 +1584,9 @@ class AirdropMonitor:
 # =============================================================================
 
 
-def wei_to_ether(wei: int) -> float:
-    """Wei를 Ether로 변환"""
-    return wei / 10**18
+def format_total(amount: int) -> str:
+    """합계 금액(AMOUNT_TOTAL_DECIMALS 단위 정수)을 천 단위 구분 기호와 함께 포맷"""
+    return format_amount(amount, AMOUNT_TOTAL_DECIMALS, grouping=True)
 
 
 def format_timestamp(timestamp: int) -> str:
@@ -602,6 +1596,7 @@ def format_timestamp(timestamp: int) -> str:
     return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
 
 
+@lru_cache(maxsize=None)
 def get_campaign_name(campaign_hash: str) -> str:
     """캠페인 해시에서 이름 조회
 
@@ -621,7 +1616,7 @@ def get_campaign_name(campaign_hash: str) -> str:
 
     # 2. 알려진 이름들의 해시와 비교
     for name in KNOWN_CAMPAIGN_NAMES:
-        name_hash = Web3.keccak(text=name).hex()
+        name_hash = keccak_text(name).hex()
         if name_hash.lower() == campaign_hash:
             return name
 
@@ -633,8 +1628,8 @@ def print_reward_info(reward: WalletReward) -> None:
     """리워드 정보 출력"""
     print(f"\n  [{reward.wallet_name}]")
     print(f"  Address: {reward.wallet_address}")
-    print(f"  Total Reward: {wei_to_ether(reward.total_reward):.4f}")
-    print(f"  Bonus Reward: {wei_to_ether(reward.bonus_reward):.4f}")
+    print(f"  Total Reward: {format_amount(reward.total_reward)}")
+    print(f"  Bonus Reward: {format_amount(reward.bonus_reward)}")
     print(f"  Claimed: {'Yes' if reward.claimed else 'No'}")
     print(
         f"  Additional Verification: {'Required' if reward.required_additional_verification else 'Not Required'}"
@@ -650,18 +1645,592 @@ def print_campaign_info(campaign: CampaignInfo, campaign_hash: bytes | None = No
     print(f"Start Date: {format_timestamp(campaign.start_date)}")
     print(f"Deadline: {format_timestamp(campaign.deadline)}")
     print(f"Reclaimed: {'Yes' if campaign.reclaimed else 'No'}")
-    print(f"Total Amount: {wei_to_ether(campaign.total_amount):.4f}")
-    print(f"Total Claimed: {wei_to_ether(campaign.total_claimed):.4f}")
+    decimals = TOKEN_DECIMALS.get(campaign.token)
+    print(f"Total Amount: {format_amount(campaign.total_amount, decimals)}")
+    print(f"Total Claimed: {format_amount(campaign.total_claimed, decimals)}")
     if campaign.total_amount > 0:
         claim_rate = (campaign.total_claimed / campaign.total_amount) * 100
         print(f"Claim Rate: {claim_rate:.2f}%")
 
 
+def print_known_name_reward(
+    unit: RewardLookup, reward_info: RewardInfo, decimals: int = DEFAULT_TOKEN_DECIMALS
+) -> None:
+    """캠페인 이름으로 조회한 지갑 리워드 출력"""
+    print(f"\n  [{unit.wallet_name}]")
+    print(f"  Address: {unit.wallet_address}")
+    print(f"  Total Reward: {format_amount(reward_info.total_reward, decimals)}")
+    print(f"  Bonus Reward: {format_amount(reward_info.bonus_reward, decimals)}")
+    print(f"  Claimed: {'Yes' if reward_info.claimed else 'No'}")
+
+
+def dead_letter_target(letter: DeadLetter) -> str:
+    """실패한 작업 단위 설명 (컨트랙트 / 캠페인 / 지갑)"""
+    unit = letter.unit
+    if isinstance(unit, RewardLookup):
+        campaign = unit.campaign if unit.by_name else get_campaign_name(unit.campaign)
+        return f"{unit.contract_address} / {campaign} / {unit.wallet_name or unit.wallet_address}"
+    return " / ".join(str(part) for part in unit)
+
+
+def print_dead_letters(dead_letters: list[DeadLetter]) -> None:
+    """재시도 후에도 실패한 조회 목록 출력 (결과에서 누락된 항목)"""
+    print("\n" + "!" * 60)
+    print(f"FAILED LOOKUPS ({len(dead_letters)}) - results below are incomplete")
+    print("!" * 60)
+    for letter in dead_letters:
+        print(f"  - {dead_letter_target(letter)} ({letter.attempts} attempts): {letter.error}")
+
+
+def print_profile_report(profiler: Profiler) -> None:
+    """호출 유형별 지연시간/바이트/재시도 통계 출력"""
+    print("\n" + "=" * 100)
+    print("Profile")
+    print("=" * 100)
+    print(
+        f"{'Call Type':<40} {'Count':>7} {'Err':>5} {'Total(s)':>9} "
+        f"{'p50(ms)':>8} {'p95(ms)':>8} {'p99(ms)':>8} {'KB':>8} {'Retry':>6}"
+    )
+    print("-" * 100)
+    for row in profiler.report_rows():
+        print(
+            f"{row['call_type']:<40} {row['count']:>7} {row['errors']:>5} {row['total']:>9.3f} "
+            f"{row['p50'] * 1000:>8.1f} {row['p95'] * 1000:>8.1f} {row['p99'] * 1000:>8.1f} "
+            f"{row['bytes'] / 1024:>8.1f} {row['retries']:>6}"
+        )
+
+
+def reward_metric_rows(result: ScanResult) -> list[tuple]:
+    """스캔 결과를 metrics용 (지갑, 주소, 컨트랙트, 캠페인, 리워드, decimals, 수령 여부) 행으로 변환"""
+    return [
+        (
+            reward["wallet_name"],
+            reward["wallet_address"],
+            reward["contract_address"],
+            get_campaign_name(campaign["campaign_hash"]),
+            reward["total_reward"],
+            reward.get("decimals", DEFAULT_TOKEN_DECIMALS),
+            reward["claimed"],
+        )
+        for campaign, rewards in result.campaigns_with_rewards
+        for reward in rewards
+    ]
+
+
+def print_rpc_pool_status(pool: RpcPool) -> None:
+    """RPC 엔드포인트 풀 상태 출력"""
+    print(f"RPC Endpoints ({len(pool.endpoints)}):")
+    for status in pool.status():
+        state = "OK" if status["healthy"] else "UNHEALTHY"
+        if status["lagging"]:
+            state = "LAGGING"
+        latency = f"{status['latency'] * 1000:.0f}ms" if status["latency"] is not None else "-"
+        head = status["head_block"] if status["head_block"] is not None else "-"
+        print(f"  - {status['url']} [{state}] latency={latency} head={head}")
+
+
+# =============================================================================
+# Report Renderers
+# =============================================================================
+
+
+def hex_campaign_hash(campaign_hash: str | bytes) -> str:
+    """캠페인 해시를 0x 접두사가 있는 소문자 hex로 변환 (출력 레코드용)"""
+    if isinstance(campaign_hash, bytes):
+        campaign_hash = campaign_hash.hex()
+    return "0x" + normalize_campaign_hash(campaign_hash)
+
+
+class ScanReport:
+    """AirdropMonitor.scan 이벤트를 받는 renderer 기본 클래스 (아무것도 출력하지 않음)"""
+
+    verbose = False
+
+    def status(self, line: str = "") -> None:
+        pass
+
+    def section(self, title: str) -> None:
+        pass
+
+    def scan_started(self, network: str, latest_block: int | None, wallet_count: int, contract_count: int) -> None:
+        pass
+
+    def campaign_rewards(self, campaign: dict, rewards: list[dict]) -> None:
+        pass
+
+    def discovery_done(self, result: ScanResult) -> None:
+        pass
+
+    def known_name_campaign(self, contract_address: str, campaign_name: str, campaign_info: CampaignInfo) -> None:
+        pass
+
+    def known_name_reward(self, unit: RewardLookup, reward_info: RewardInfo, decimals: int) -> None:
+        pass
+
+    def recovered_reward(self, unit: RewardLookup, reward_info: RewardInfo, decimals: int) -> None:
+        pass
+
+    def failed_lookups(self, dead_letters: list[DeadLetter]) -> None:
+        pass
+
+    def summary(self, monitor: AirdropMonitor, result: ScanResult) -> None:
+        pass
+
+    def changes(self, previous: Snapshot | None, snapshot: Snapshot, changes: list[Change]) -> None:
+        pass
+
+    def reconciliation(self, reconciliation: Reconciliation, snapshot: Snapshot) -> None:
+        pass
+
+    def networks_summary(self, results: NetworkScanResults) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class TextReport(ScanReport):
+    """스캔 결과를 사람이 읽는 형식으로 stdout에 출력"""
+
+    verbose = True
+
+    def status(self, line: str = "") -> None:
+        print(line)
+
+    def section(self, title: str) -> None:
+        print("\n" + "=" * 60)
+        print(title)
+        print("=" * 60)
+
+    def discovery_done(self, result: ScanResult) -> None:
+        # 보상이 있는 캠페인 먼저 출력
+        if result.campaigns_with_rewards:
+            self.section(f"CAMPAIGNS WITH REWARDS ({len(result.campaigns_with_rewards)})")
+
+            for campaign, rewards in result.campaigns_with_rewards:
+                campaign_name = get_campaign_name(campaign['campaign_hash'])
+                print(f"\n--- Campaign: {campaign_name} ---")
+                print(f"Hash: {campaign['campaign_hash']}")
+                print(f"Contract: {campaign['contract_address']}")
+                print(f"Token: {campaign['token']}")
+                print(f"Deadline: {format_timestamp(campaign['deadline'])}")
+
+                decimals = TOKEN_DECIMALS.get(campaign["token"])
+                total_all_wallets = 0
+                for reward in rewards:
+                    total_all_wallets += reward["total_reward"]
+                    print(f"\n  [{reward['wallet_name']}]")
+                    print(f"  Address: {reward['wallet_address']}")
+                    print(f"  Total Reward: {format_amount(reward['total_reward'], decimals)}")
+                    print(f"  Bonus Reward: {format_amount(reward['bonus_reward'], decimals)}")
+                    print(f"  Claimed: {'Yes' if reward['claimed'] else 'No'}")
+
+                print(f"\n  >>> Total across all wallets: {format_amount(total_all_wallets, decimals)}")
+        else:
+            print("\n>>> No rewards found for any monitored wallet in any campaign.")
+
+        # 보상 없는 캠페인 요약
+        if result.campaigns_without_rewards:
+            print(f"\n--- {result.campaigns_without_rewards} campaign(s) with no rewards for monitored wallets ---")
+
+    def known_name_campaign(self, contract_address: str, campaign_name: str, campaign_info: CampaignInfo) -> None:
+        print(f"\n--- Campaign: {campaign_name} ---")
+        print(f"Contract: {contract_address}")
+        print(f"Token: {campaign_info.token}")
+        print(f"Start Date: {format_timestamp(campaign_info.start_date)}")
+        print(f"Deadline: {format_timestamp(campaign_info.deadline)}")
+        decimals = TOKEN_DECIMALS.get(campaign_info.token)
+        print(f"Total Amount: {format_amount(campaign_info.total_amount, decimals)}")
+        print(f"Total Claimed: {format_amount(campaign_info.total_claimed, decimals)}")
+        print("\n--- Wallet Rewards ---")
+
+    def known_name_reward(self, unit: RewardLookup, reward_info: RewardInfo, decimals: int) -> None:
+        print_known_name_reward(unit, reward_info, decimals)
+
+    def recovered_reward(self, unit: RewardLookup, reward_info: RewardInfo, decimals: int) -> None:
+        if unit.by_name:
+            print(f"\n--- Campaign: {unit.campaign} (recovered) ---")
+            print(f"Contract: {unit.contract_address}")
+            print_known_name_reward(unit, reward_info, decimals)
+        else:
+            print(f"  Recovered: {unit.wallet_name} @ {get_campaign_name(unit.campaign)}")
+
+    def failed_lookups(self, dead_letters: list[DeadLetter]) -> None:
+        print_dead_letters(dead_letters)
+
+    def summary(self, monitor: AirdropMonitor, result: ScanResult) -> None:
+        # 컨트랙트별 상세 보상 요약 출력
+        print("\nDetailed Rewards by Contract:")
+        print("=" * 60)
+
+        for addr in result.contract_addresses:
+            totals = result.contract_totals[addr]
+
+            print(f"\n[Contract: {addr[:10]}...{addr[-6:]}]")
+            if totals.total_reward > 0:
+                print(f"  Total: {format_total(totals.total_reward)} ({totals.campaign_count} campaigns)")
+
+                for campaign_totals in result.contract_campaigns[addr]:
+                    campaign_status = "Claimed" if campaign_totals.unclaimed == 0 else "Unclaimed"
+                    print(f"\n  Campaign: {get_campaign_name(campaign_totals.campaign_hash)}")
+                    print(f"    Total: {format_amount(campaign_totals.total_reward, campaign_totals.decimals, grouping=True)} ({campaign_status})")
+                    print("    Wallets:")
+                    for wr in campaign_totals.wallet_rewards:
+                        wr_status = "Claimed" if wr["claimed"] else "Unclaimed"
+                        print(f"      - {wr['wallet_name']}: {format_amount(wr['total_reward'], campaign_totals.decimals, grouping=True)} ({wr_status})")
+            else:
+                print("  No rewards found")
+
+        # 전체 합계
+        if result.totals.total_reward > 0:
+            print("\n" + "-" * 60)
+            print(f"GRAND TOTAL: {format_total(result.totals.total_reward)}")
+            print(f"UNCLAIMED: {format_total(result.totals.unclaimed)}")
+
+        # 지갑별 보상 요약 출력
+        print("\n" + "=" * 60)
+        print("Wallet Rewards Summary:")
+        print("-" * 60)
+        for name in result.wallets:
+            totals = result.wallet_totals[name]
+            if totals.total_reward > 0:
+                status = "Claimed" if totals.unclaimed == 0 else "Unclaimed"
+                print(f"  {name}: {format_total(totals.total_reward)} ({status})")
+            else:
+                print(f"  {name}: 0.0000")
+
+        if result.totals.total_reward > 0:
+            print("-" * 60)
+            print(f"  TOTAL: {format_total(result.totals.total_reward)}")
+            print(f"  Unclaimed: {format_total(result.totals.unclaimed)}")
+
+        if result.failed:
+            print(f"\n  WARNING: {len(result.failed)} lookup(s) failed; totals may be incomplete")
+
+        print("\nMonitored Contracts:")
+        # 네트워크별 Blockscout URL 사용
+        blockscout_base = monitor.blockscout_api_url.replace("/api/v2", "")
+        for addr in result.contract_addresses:
+            print(f"  {blockscout_base}/address/{addr}")
+
+    def reconciliation(self, reconciliation: Reconciliation, snapshot: Snapshot) -> None:
+        print_reconciliation(reconciliation, snapshot)
+
+    def networks_summary(self, results: NetworkScanResults) -> None:
+        self.section("All Networks Summary")
+        for network, result in results.results.items():
+            failed = f", {len(result.failed)} failed lookup(s)" if result.failed else ""
+            print(
+                f"  {network}: {format_total(result.totals.total_reward)} "
+                f"(unclaimed {format_total(result.totals.unclaimed)}, "
+                f"{result.reward_count} reward(s){failed})"
+            )
+        print("-" * 60)
+        print(f"  TOTAL: {format_total(results.totals.total_reward)}")
+        print(f"  Unclaimed: {format_total(results.totals.unclaimed)}")
+
+        print("\nWallets (all networks):")
+        for name, totals in results.wallet_totals.items():
+            print(
+                f"  {name}: {format_total(totals.total_reward)} "
+                f"(unclaimed {format_total(totals.unclaimed)})"
+            )
+
+
+class StructuredReport(ScanReport):
+    """스캔 결과를 레코드로 변환해 RecordWriter에 기록 (진행 상황은 stderr로 출력)"""
+
+    def __init__(self, writer: RecordWriter):
+        self.writer = writer
+        self.network: str | None = None
+
+    def write(self, record_type: str, record: dict) -> None:
+        """네트워크를 붙여 레코드 기록 (여러 네트워크가 writer 하나를 공유할 때 구분)"""
+        self.writer.write(record_type, {"network": self.network, **record})
+
+    def status(self, line: str = "") -> None:
+        print(line, file=sys.stderr)
+
+    def section(self, title: str) -> None:
+        print(title, file=sys.stderr)
+
+    def scan_started(self, network: str, latest_block: int | None, wallet_count: int, contract_count: int) -> None:
+        self.network = network
+        self.write("scan", {
+            "network": network,
+            "latest_block": latest_block,
+            "scanned_at": int(time.time()),
+            "wallet_count": wallet_count,
+            "contract_count": contract_count,
+        })
+
+    def campaign_rewards(self, campaign: dict, rewards: list[dict]) -> None:
+        campaign_hash = hex_campaign_hash(campaign["campaign_hash"])
+        campaign_name = get_campaign_name(campaign["campaign_hash"])
+        self.write("campaign", {
+            "contract_address": campaign["contract_address"],
+            "campaign_hash": campaign_hash,
+            "campaign_name": campaign_name,
+            "token": campaign["token"],
+            "deadline": campaign["deadline"],
+            "source": "discovery",
+        })
+        for reward in rewards:
+            self.write(
+                "reward",
+                dict(reward, campaign_hash=campaign_hash, campaign_name=campaign_name, source="discovery"),
+            )
+
+    def known_name_campaign(self, contract_address: str, campaign_name: str, campaign_info: CampaignInfo) -> None:
+        self.write("campaign", {
+            "contract_address": contract_address,
+            "campaign_hash": hex_campaign_hash(keccak_text(campaign_name)),
+            "campaign_name": campaign_name,
+            "token": campaign_info.token,
+            "deadline": campaign_info.deadline,
+            "source": "known_name",
+        })
+
+    def _write_reward(self, unit: RewardLookup, reward_info: RewardInfo, decimals: int, source: str) -> None:
+        if unit.by_name:
+            campaign_hash = hex_campaign_hash(keccak_text(unit.campaign))
+            campaign_name = unit.campaign
+        else:
+            campaign_hash = hex_campaign_hash(unit.campaign)
+            campaign_name = get_campaign_name(unit.campaign)
+        self.write("reward", {
+            "wallet_name": unit.wallet_name,
+            "wallet_address": unit.wallet_address,
+            "contract_address": unit.contract_address,
+            "campaign_hash": campaign_hash,
+            "campaign_name": campaign_name,
+            **reward_info._asdict(),
+            "decimals": decimals,
+            "source": source,
+        })
+
+    def known_name_reward(self, unit: RewardLookup, reward_info: RewardInfo, decimals: int) -> None:
+        self._write_reward(unit, reward_info, decimals, "known_name")
+
+    def recovered_reward(self, unit: RewardLookup, reward_info: RewardInfo, decimals: int) -> None:
+        self._write_reward(unit, reward_info, decimals, "recovered")
+
+    def failed_lookups(self, dead_letters: list[DeadLetter]) -> None:
+        print(f"WARNING: {len(dead_letters)} lookup(s) failed; results are incomplete", file=sys.stderr)
+        for letter in dead_letters:
+            self.write("failed_lookup", {
+                "target": dead_letter_target(letter),
+                "attempts": letter.attempts,
+                "error": letter.error,
+            })
+
+    def summary(self, monitor: AirdropMonitor, result: ScanResult) -> None:
+        for addr in result.contract_addresses:
+            totals = result.contract_totals[addr]
+            self.write("contract_total", {
+                "contract_address": addr,
+                "total_reward": totals.total_reward,
+                "unclaimed_reward": totals.unclaimed,
+                "claimed_reward": totals.claimed,
+                "campaign_count": totals.campaign_count,
+            })
+        for name, address in result.wallets.items():
+            totals = result.wallet_totals[name]
+            self.write("wallet_total", {
+                "wallet_name": name,
+                "wallet_address": address,
+                "total_reward": totals.total_reward,
+                "bonus_reward": totals.bonus_reward,
+                "unclaimed_reward": totals.unclaimed,
+                "claimed_reward": totals.claimed,
+                "campaign_count": totals.campaign_count,
+            })
+
+    def reconciliation(self, reconciliation: Reconciliation, snapshot: Snapshot) -> None:
+        if reconciliation.issues:
+            print(f"WARNING: {len(reconciliation.issues)} claim reconciliation issue(s)", file=sys.stderr)
+        self.write("reconciliation", {
+            "block": reconciliation.block,
+            "wallet_count": reconciliation.wallet_count,
+            "token_count": reconciliation.token_count,
+            "claim_count": reconciliation.claim_count,
+            "untracked_claims": reconciliation.untracked_claims,
+            "issue_count": len(reconciliation.issues),
+        })
+        for issue in reconciliation.issues:
+            self.write("reconcile_issue", reconcile_issue_record(issue, snapshot))
+
+    def networks_summary(self, results: NetworkScanResults) -> None:
+        for network, result in results.results.items():
+            self.write("network_total", {
+                "network": network,
+                "total_reward": result.totals.total_reward,
+                "unclaimed_reward": result.totals.unclaimed,
+                "claimed_reward": result.totals.claimed,
+                "reward_count": result.reward_count,
+                "failed_lookups": len(result.failed),
+            })
+
+    def close(self) -> None:
+        if self.writer.closed:
+            return
+        self.writer.close()
+        if self.writer.path not in (None, "-"):
+            self.status(f"Wrote {self.writer.records} record(s) to {self.writer.path}")
+
+
+CHANGE_LABELS = {
+    "new_campaign": "New campaign",
+    "new_reward": "New reward",
+    "reward_changed": "Reward changed",
+    "claimed": "Claimed",
+    "verification_required": "Verification required",
+    "deadline_soon": "Deadline soon",
+    "removed_reward": "Removed reward",
+}
+
+
+class DiffReport(ScanReport):
+    """--diff: 이전 스냅샷 대비 변경 사항만 출력 (writer가 있으면 change 레코드로 기록)"""
+
+    def __init__(self, writer: RecordWriter | None = None):
+        self.writer = writer
+
+    def failed_lookups(self, dead_letters: list[DeadLetter]) -> None:
+        print(
+            f"WARNING: {len(dead_letters)} lookup(s) failed; previous values kept for those entries",
+            file=sys.stderr,
+        )
+
+    def changes(self, previous: Snapshot | None, snapshot: Snapshot, changes: list[Change]) -> None:
+        if self.writer is not None:
+            for change in changes:
+                # 금액(최소 단위)과 마감 시간을 다른 컬럼으로 기록 (Parquet에서 금액 컬럼은 decimal)
+                values = (
+                    {"deadline": change.new}
+                    if change.kind in DEADLINE_CHANGE_KINDS
+                    else {"old_amount": change.old, "new_amount": change.new}
+                )
+                self.writer.write("change", {
+                    "network": snapshot.network,
+                    "kind": change.kind,
+                    "contract_address": change.contract_address,
+                    "campaign_hash": "0x" + change.campaign_hash,
+                    "campaign_name": get_campaign_name(change.campaign_hash),
+                    "wallet_name": snapshot.wallet_names.get(change.wallet_address or ""),
+                    "wallet_address": change.wallet_address,
+                    **values,
+                })
+            return
+
+        if previous is None:
+            print(f"\nNo previous snapshot; saved baseline with {len(snapshot.rewards)} reward(s).")
+            return
+        print("\n" + "=" * 60)
+        print(
+            f"Changes since {format_timestamp(int(previous.scanned_at))} "
+            f"(block {previous.latest_block} -> {snapshot.latest_block})"
+        )
+        print("=" * 60)
+        if not changes:
+            print("No changes.")
+            return
+        for change in changes:
+            print(f"  {CHANGE_LABELS[change.kind]}: {describe_change(change, snapshot)}")
+
+    def reconciliation(self, reconciliation: Reconciliation, snapshot: Snapshot) -> None:
+        if self.writer is not None:
+            for issue in reconciliation.issues:
+                self.writer.write(
+                    "reconcile_issue", {"network": snapshot.network, **reconcile_issue_record(issue, snapshot)}
+                )
+            return
+        print_reconciliation(reconciliation, snapshot)
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+
+
+def describe_reconcile_issue(issue: ReconcileIssue, snapshot: Snapshot) -> str:
+    """대사 항목 한 줄 설명"""
+    wallet = snapshot.wallet_names.get(issue.wallet_address) or issue.wallet_address
+    amount = partial(format_amount, decimals=TOKEN_DECIMALS.get(issue.token or ""), grouping=True)
+    if issue.campaign_hash is None:
+        balance = amount(issue.actual) if issue.actual is not None else "unknown"
+        return f"{wallet} / token {issue.token}: received {amount(issue.expected)} (Claimed events), balance {balance}"
+    target = f"{wallet} @ {get_campaign_name(issue.campaign_hash)} ({issue.contract_address[:10]}...)"
+    if issue.kind == "missing_claim_event":
+        return f"{target}: {amount(issue.expected)} claimed in scan, no Claimed event"
+    if issue.kind == "unflagged_claim":
+        return f"{target}: {amount(issue.actual)} in Claimed events, unclaimed in scan"
+    return f"{target}: {amount(issue.expected)} in scan, {amount(issue.actual)} in Claimed events"
+
+
+def reconcile_issue_record(issue: ReconcileIssue, snapshot: Snapshot) -> dict:
+    """대사 항목을 출력 레코드로 변환"""
+    record = issue._asdict()
+    record["wallet_name"] = snapshot.wallet_names.get(issue.wallet_address)
+    if issue.campaign_hash is not None:
+        record["campaign_hash"] = "0x" + issue.campaign_hash
+        record["campaign_name"] = get_campaign_name(issue.campaign_hash)
+    return record
+
+
+def print_reconciliation(reconciliation: Reconciliation, snapshot: Snapshot) -> None:
+    """대사 결과 출력 (맞지 않는 항목만 나열)"""
+    print(
+        f"\nClaim reconciliation at block {reconciliation.block}: {reconciliation.wallet_count} wallet(s) x "
+        f"{reconciliation.token_count} token(s), {reconciliation.claim_count} Claimed event(s)"
+    )
+    if reconciliation.untracked_claims:
+        print(f"  {reconciliation.untracked_claims} Claimed event(s) for campaigns not found by this scan were skipped")
+    if not reconciliation.issues:
+        print("  All claims match Claimed events and token balances.")
+        return
+    for issue in reconciliation.issues:
+        print(f"  {ISSUE_LABELS[issue.kind]}: {describe_reconcile_issue(issue, snapshot)}")
+
+
+def describe_change(change: Change, snapshot: Snapshot) -> str:
+    """변경 사항 한 줄 설명"""
+    target = get_campaign_name(change.campaign_hash)
+    if change.wallet_address:
+        wallet = snapshot.wallet_names.get(change.wallet_address) or change.wallet_address
+        target = f"{wallet} @ {target}"
+    target += f" ({change.contract_address[:10]}...)"
+
+    campaign = snapshot.campaigns.get((change.contract_address, change.campaign_hash))
+    amount = partial(format_amount, decimals=TOKEN_DECIMALS.get(campaign.token if campaign else ""), grouping=True)
+    if change.kind == "reward_changed":
+        return f"{target}: {amount(change.old)} -> {amount(change.new)}"
+    if change.kind in ("new_reward", "claimed"):
+        return f"{target}: {amount(change.new)}"
+    if change.kind == "removed_reward":
+        return f"{target}: was {amount(change.old)}"
+    if change.kind in DEADLINE_CHANGE_KINDS:
+        return f"{target}, deadline {format_timestamp(change.new)}"
+    return target
+
+
 # =============================================================================
 # Main
 # =============================================================================
 
 
+def parse_networks(value: str) -> list[str]:
+    """--network 값 파싱 ('all' 또는 쉼표로 구분한 네트워크 목록)"""
+    if value == "all":
+        return list(ALL_NETWORKS)
+    networks = list(dict.fromkeys(n.strip() for n in value.split(",") if n.strip()))
+    unknown = [n for n in networks if n not in RPC_URLS]
+    if unknown or not networks:
+        raise argparse.ArgumentTypeError(
+            f"unknown network {', '.join(unknown) or repr(value)} (choose from {', '.join(RPC_URLS)}, all)"
+        )
+    return networks
+
+
 def parse_args():
     """커맨드라인 인자 파싱"""
     parser = argparse.ArgumentParser(
@@ -671,16 +2240,30 @@ def parse_args():
 Examples:
   %(prog)s                                    # testnet, wallets.json 사용
   %(prog)s --network mainnet                  # mainnet
+  %(prog)s --network all                      # mainnet + testnet 동시 스캔
   %(prog)s --wallets my_wallets.json          # 지갑 파일 지정
   %(prog)s --address 0x1234...                # 단일 주소 조회
   %(prog)s --address 0x1234... --name "alice" # 단일 주소 + 이름
+  %(prog)s --diff                             # 마지막 스캔 이후 변경 사항만 출력
         """,
     )
     parser.add_argument(
         "--network",
-        choices=["mainnet", "mainnet_remote", "testnet"],
+        type=parse_networks,
         default="testnet",
-        help="Network to connect to (default: testnet)",
+        dest="networks",
+        metavar="NETWORK",
+        help=(
+            f"Network to connect to: {', '.join(RPC_URLS)}, a comma-separated list, "
+            "or 'all' to scan every network concurrently (default: testnet)"
+        ),
+    )
+    parser.add_argument(
+        "--rpc-url",
+        action="append",
+        dest="rpc_urls",
+        metavar="URL",
+        help="RPC endpoint URL (repeatable; overrides the network's endpoint pool)",
     )
     parser.add_argument(
         "--block-range",
@@ -703,300 +2286,452 @@ Examples:
         type=str,
         help="Name for the single address (used with --address)",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--watch",
+        type=float,
+        metavar="SECONDS",
+        help="Keep running and rescan every SECONDS (use with --metrics-port for monitoring)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        metavar="PORT",
+        help="Serve Prometheus metrics on http://127.0.0.1:PORT/metrics",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-call-type latency/bytes/retry statistics at the end",
+    )
+    parser.add_argument(
+        "--trace-file",
+        type=str,
+        metavar="PATH",
+        help="Write per-request spans (Chrome trace JSON, or JSON lines if PATH ends with .jsonl)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        dest="output_format",
+        help="Output format (default: text). Non-text formats write records to stdout or --output",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        metavar="PATH",
+        help="Write --format records to PATH instead of stdout (rewritten on every --watch scan)",
+    )
+    parser.add_argument(
+        "--diff",
+        action="store_true",
+        help="Report only changes since the last saved snapshot",
+    )
+    parser.add_argument(
+        "--snapshot-file",
+        type=str,
+        metavar="PATH",
+        help=f"Snapshot file to compare with and update, .snap or .json (default: {default_snapshot_path('<network>')})",
+    )
+    parser.add_argument(
+        "--no-snapshot",
+        action="store_true",
+        help="Do not read or write the snapshot",
+    )
+    parser.add_argument(
+        "--discovery-source",
+        choices=DISCOVERY_SOURCES,
+        default=CAMPAIGN_DISCOVERY_SOURCE,
+        help=(
+            "Where to discover campaigns: Blockscout and RPC logs together with gap filling and a cross-check "
+            f"(hybrid), or only one of them (default: {CAMPAIGN_DISCOVERY_SOURCE})"
+        ),
+    )
+    parser.add_argument(
+        "--crosscheck-wait",
+        type=float,
+        default=CAMPAIGN_CROSSCHECK_WAIT,
+        metavar="SECONDS",
+        help=(
+            "hybrid: after the needed block range is covered, wait up to SECONDS for the slower source "
+            f"to cross-check more blocks (default: {CAMPAIGN_CROSSCHECK_WAIT:g}, return at once)"
+        ),
+    )
+    parser.add_argument(
+        "--reconcile",
+        action="store_true",
+        help=(
+            "After each scan, check claims against Claimed events and ERC-20 balanceOf of every wallet x "
+            "campaign token, pinned to the scanned block, and report mismatches"
+        ),
+    )
+    parser.add_argument(
+        "--discover-contracts",
+        action="store_true",
+        help=(
+            "Scan blocks since the last discovery checkpoint for new RedeemableAirdrop contracts "
+            f"(saved to {CONTRACT_REGISTRY_DIR}/<network>.json)"
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            f"Resume an interrupted scan from {CHECKPOINT_DIR}/<network>.jsonl, "
+            "skipping lookups that already completed"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Shard wallets by address hash across N worker processes, each with its own RPC pool "
+            "and retry budget (deadline-aware --watch refresh is not applied to sharded scans)"
+        ),
+    )
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if len(args.networks) > 1 and (args.rpc_urls or args.snapshot_file):
+        parser.error("--rpc-url and --snapshot-file require a single --network")
+    return args
+
+
+def run_scan(
+    monitor: AirdropMonitor,
+    wallets: dict[str, str],
+    report: ScanReport,
+    latest_block: int | None = None,
+    previous: Snapshot | None = None,
+    workers: int = 1,
+    reconcile: bool = False,
+) -> tuple[ScanResult, Snapshot]:
+    """CLI 스캔 1회: AirdropMonitor.scan 실행 후 요약 및 이전 스냅샷 대비 변경 사항 출력
+
+    workers가 2 이상이면 지갑을 샤드로 나누어 worker 프로세스에서 스캔한 뒤 합칩니다 (sharding.py).
+    reconcile이면 스캔 결과를 같은 블록 기준의 Claimed 이벤트 및 토큰 잔액과 대사합니다.
+    """
+    report.scan_started(monitor.network, latest_block, len(wallets), len(monitor.contract_addresses))
+    if workers > 1:
+        from sharding import scan_sharded  # worker 프로세스 관련 모듈은 필요할 때만 로드
 
+        result = scan_sharded(monitor, wallets, workers, report, latest_block, previous)
+    else:
+        result = monitor.scan(wallets, report, latest_block, previous)
 
-def main():
-    args = parse_args()
+    # 3. 요약
+    report.section("Summary")
+    with monitor.profiler.span("report.summary"):
+        report.summary(monitor, result)
 
-    print("=" * 60)
-    print("Spacecoin Airdrop Monitor for Creditcoin Chain")
-    print("=" * 60)
+    snapshot = Snapshot.from_result(result, previous)
+    changes = snapshot.diff(previous, DIFF_DEADLINE_WINDOW) if previous is not None else []
+    report.changes(previous, snapshot, changes)
 
-    # 지갑 정보 로드
-    try:
-        wallets = get_wallets(args)
-    except FileNotFoundError as e:
-        print(f"\nError: {e}")
-        return
+    if reconcile:
+        report.section("Claim Reconciliation")
+        try:
+            with monitor.profiler.span("scan.reconcile"):
+                reconciliation = monitor.reconcile(snapshot, latest_block)
+        except Exception as e:
+            report.status(f"Claim reconciliation failed: {e}")
+        else:
+            report.reconciliation(reconciliation, snapshot)
+    return result, snapshot
 
-    network = args.network
-    print(f"\nNetwork: {network}")
-    print(f"Wallets ({len(wallets)}):")
-    for name, addr in wallets.items():
-        print(f"  - {name}: {addr}")
 
-    # 모니터 초기화
-    try:
-        monitor = AirdropMonitor(network=network)
-    except Exception as e:
-        print(f"Failed to initialize monitor: {e}")
-        return
+class ThreadOutput:
+    """스레드별로 stdout 출력을 버퍼에 모으는 stdout proxy (여러 네트워크 동시 스캔용)
 
-    # 컨트랙트 주소 표시
-    print(f"\nContracts ({len(monitor.contract_addresses)}):")
-    for addr in monitor.contract_addresses:
-        print(f"  - {addr}")
+    capture 중인 스레드의 출력은 해당 스레드의 버퍼에, 나머지는 원래 stream에 기록합니다.
+    """
 
-    # 연결 확인
-    if not monitor.is_connected():
-        print(f"Failed to connect to {network} RPC")
-        return
-    print(f"\nConnected to {network}")
-    print(f"Latest block: {monitor.w3.eth.block_number}")
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
 
-    # 1. Blockscout API를 통해 캠페인 발견 (RPC보다 안정적)
-    print("\n" + "=" * 60)
-    print("Discovering Campaigns via Blockscout API...")
-    print("=" * 60)
-    print(f"Blockscout API: {monitor.blockscout_api_url}")
+    def write(self, text: str) -> int:
+        return (getattr(self._local, "buffer", None) or self.stream).write(text)
 
-    discovered_campaigns = monitor.discover_campaigns_from_blockscout()
+    def flush(self) -> None:
+        self.stream.flush()
 
-    if discovered_campaigns:
-        print(f"\nFound {len(discovered_campaigns)} campaign(s). Checking for rewards...")
+    def capture(self, fn, *args):
+        """fn(*args)를 실행하고 (출력, 반환값 또는 예외) 반환"""
+        self._local.buffer = buffer = io.StringIO()
+        try:
+            return buffer, fn(*args), None
+        except Exception as e:
+            return buffer, None, e
+        finally:
+            self._local.buffer = None
 
-        # 먼저 모든 캠페인에서 보상 확인
-        campaigns_with_rewards = []
-        campaigns_without_rewards = []
+    def bind(self, fn):
+        """현재 스레드의 출력 대상을 이어받아 fn을 실행하는 함수 반환 (capture 중에 만든 worker 스레드용)"""
+        buffer = getattr(self._local, "buffer", None)
 
-        for campaign in discovered_campaigns:
-            campaign_hash_hex = campaign['campaign_hash']
-            if campaign_hash_hex.startswith("0x"):
-                campaign_hash_hex = campaign_hash_hex[2:]
-            campaign_hash_bytes = bytes.fromhex(campaign_hash_hex)
+        def run(*args):
+            self._local.buffer = buffer
+            try:
+                return fn(*args)
+            finally:
+                self._local.buffer = None
 
-            rewards = monitor.check_wallets_on_all_contracts(campaign_hash_bytes, wallets)
-            rewards_with_value = [r for r in rewards if r["total_reward"] > 0]
+        return run
 
-            if rewards_with_value:
-                campaigns_with_rewards.append((campaign, rewards_with_value))
-            else:
-                campaigns_without_rewards.append(campaign)
 
-        # 보상이 있는 캠페인 먼저 출력
-        if campaigns_with_rewards:
-            print("\n" + "=" * 60)
-            print(f"CAMPAIGNS WITH REWARDS ({len(campaigns_with_rewards)})")
-            print("=" * 60)
+def inherit_stdout(fn):
+    """worker 스레드에서 실행할 fn의 출력이 호출한 스레드의 출력과 같은 곳으로 가도록 감쌈
 
-            for campaign, rewards in campaigns_with_rewards:
-                campaign_name = get_campaign_name(campaign['campaign_hash'])
-                print(f"\n--- Campaign: {campaign_name} ---")
-                print(f"Hash: {campaign['campaign_hash']}")
-                print(f"Contract: {campaign['contract_address']}")
-                print(f"Token: {campaign['token']}")
-                print(f"Deadline: {format_timestamp(campaign['deadline'])}")
+    여러 네트워크 동시 스캔에서 sys.stdout이 ThreadOutput이면 호출한 스레드의 버퍼를 이어받습니다.
+    """
+    output = sys.stdout
+    return output.bind(fn) if isinstance(output, ThreadOutput) else fn
 
-                total_all_wallets = 0
-                for reward in rewards:
-                    total_all_wallets += reward["total_reward"]
-                    print(f"\n  [{reward['wallet_name']}]")
-                    print(f"  Address: {reward['wallet_address']}")
-                    print(f"  Total Reward: {wei_to_ether(reward['total_reward']):.4f}")
-                    print(f"  Bonus Reward: {wei_to_ether(reward['bonus_reward']):.4f}")
-                    print(f"  Claimed: {'Yes' if reward['claimed'] else 'No'}")
 
-                print(f"\n  >>> Total across all wallets: {wei_to_ether(total_all_wallets):.4f}")
-        else:
-            print("\n>>> No rewards found for any monitored wallet in any campaign.")
+class NetworkSession:
+    """네트워크 하나의 모니터와 스캔 간 상태 (최신 블록, 이전 스냅샷)"""
 
-        # 보상 없는 캠페인 요약
-        if campaigns_without_rewards:
-            print(f"\n--- {len(campaigns_without_rewards)} campaign(s) with no rewards for monitored wallets ---")
-    else:
-        print("\nNo campaigns discovered yet.")
+    def __init__(self, monitor: AirdropMonitor, latest_block: int, snapshot_path: Path | None):
+        self.monitor = monitor
+        self.network = monitor.network
+        self.latest_block = latest_block
+        self.snapshot_path = snapshot_path
+        self.previous = Snapshot.load(snapshot_path) if snapshot_path is not None else None
+        if self.previous is not None and self.previous.network != self.network:
+            self.previous = None
+        self.report: ScanReport = ScanReport()
 
-    # 2. 모든 컨트랙트에서 알려진 캠페인 이름들 확인
-    print("\n" + "=" * 60)
-    print("Checking Known Campaign Names (All Contracts)...")
-    print("=" * 60)
 
-    found_any = False
-    for i, contract in enumerate(monitor.contracts):
-        contract_addr = monitor.contract_addresses[i]
+def scan_networks(
+    sessions: list[NetworkSession], wallets: dict[str, str], workers: int = 1, reconcile: bool = False
+) -> dict[str, tuple[ScanResult, Snapshot]]:
+    """네트워크별 run_scan을 동시에 실행 (네트워크마다 연결 풀, 스케줄러, profiler가 따로 있음)
 
-        for campaign_name in KNOWN_CAMPAIGN_NAMES:
-            campaign_hash = monitor.get_campaign_name_hash(campaign_name)
+    각 네트워크의 출력은 스레드별로 모았다가 네트워크 순서대로 출력합니다.
+    스캔에 실패한 네트워크는 오류를 출력하고 결과에서 제외합니다.
+    """
+    if len(sessions) == 1:
+        session = sessions[0]
+        return {
+            session.network: run_scan(
+                session.monitor, wallets, session.report, session.latest_block, session.previous, workers, reconcile
+            )
+        }
 
-            try:
-                campaign_info_result = contract.functions.campaignInfo(campaign_name).call()
-                token_addr = campaign_info_result[0]
+    def scan_one(session: NetworkSession) -> tuple[ScanResult, Snapshot]:
+        session.report.section(f"Network: {session.network}")
+        return run_scan(
+            session.monitor, wallets, session.report, session.latest_block, session.previous, workers, reconcile
+        )
 
-                if token_addr == "0x0000000000000000000000000000000000000000":
-                    continue
+    output = ThreadOutput(sys.stdout)
+    with contextlib.redirect_stdout(output), ThreadPoolExecutor(max_workers=len(sessions)) as executor:
+        futures = [executor.submit(output.capture, scan_one, session) for session in sessions]
 
-                found_any = True
-                print(f"\n--- Campaign: {campaign_name} ---")
-                print(f"Contract: {contract_addr}")
-                print(f"Token: {token_addr}")
-                print(f"Start Date: {format_timestamp(campaign_info_result[1])}")
-                print(f"Deadline: {format_timestamp(campaign_info_result[2])}")
-                print(f"Total Amount: {wei_to_ether(campaign_info_result[4]):.4f}")
-                print(f"Total Claimed: {wei_to_ether(campaign_info_result[5]):.4f}")
-
-                # 각 지갑 확인
-                print("\n--- Wallet Rewards ---")
-                for wallet_name, wallet_addr in wallets.items():
-                    try:
-                        wallet_checksum = Web3.to_checksum_address(wallet_addr)
-                        reward_result = contract.functions.rewardInfo(campaign_name, wallet_checksum).call()
-                        if reward_result[0] > 0:
-                            print(f"\n  [{wallet_name}]")
-                            print(f"  Address: {wallet_addr}")
-                            print(f"  Total Reward: {wei_to_ether(reward_result[0]):.4f}")
-                            print(f"  Bonus Reward: {wei_to_ether(reward_result[1]):.4f}")
-                            print(f"  Claimed: {'Yes' if reward_result[2] else 'No'}")
-                    except Exception:
-                        pass
+    outcomes = {}
+    for session, future in zip(sessions, futures):
+        buffer, outcome, error = future.result()
+        sys.stdout.write(buffer.getvalue())
+        if error is not None:
+            print(f"\nScan failed for {session.network}: {error}", file=sys.stderr)
+            continue
+        outcomes[session.network] = outcome
+    return outcomes
 
-            except Exception:
-                pass
 
-    if not found_any:
-        print("\nNo active campaigns found with known names.")
+def create_output_writer(args) -> RecordWriter | None:
+    """--format/--output에 맞는 writer 생성 (text면 None)"""
+    if args.output_format == "text":
+        return None
+    return create_writer(args.output_format, args.output)
+
+
+def create_report(args, writer: RecordWriter | None) -> ScanReport:
+    """--format/--diff에 맞는 결과 renderer 생성 (스캔마다 새로 생성, 네트워크끼리 writer 공유)"""
+    if args.diff:
+        return DiffReport(writer)
+    if writer is None:
+        return TextReport()
+    return StructuredReport(writer)
 
-    # 3. 요약
-    print("\n" + "=" * 60)
-    print("Summary")
-    print("=" * 60)
-
-    # 지갑별 총 보상 요약 계산
-    wallet_totals: dict[str, dict] = {}
-    for name in wallets:
-        wallet_totals[name] = {
-            "total_reward": 0,
-            "bonus_reward": 0,
-            "unclaimed": 0,
-            "claimed": 0,
-            "campaign_count": 0,
-        }
 
-    # 컨트랙트별 총 보상 요약 계산
-    contract_totals: dict[str, dict] = {}
+def connect_network(network: str, args, log, console) -> tuple[AirdropMonitor, int] | None:
+    """네트워크 모니터 초기화 및 연결 확인 (실패하면 None)"""
+    profiler = Profiler(trace=bool(args.trace_file))
+    try:
+        monitor = AirdropMonitor(network=network, rpc_urls=args.rpc_urls, profiler=profiler)
+    except Exception as e:
+        log(f"Failed to initialize monitor: {e}")
+        return None
+    monitor.discovery_source = args.discovery_source
+    monitor.crosscheck_wait = args.crosscheck_wait
+
+    # 컨트랙트 주소 표시
+    log(f"\nContracts ({len(monitor.contract_addresses)}):")
     for addr in monitor.contract_addresses:
-        contract_totals[addr] = {
-            "total_reward": 0,
-            "unclaimed": 0,
-            "claimed": 0,
-            "campaign_count": 0,
-            "campaigns": [],  # 캠페인별 상세 정보 저장
-        }
+        log(f"  - {addr}")
 
-    if campaigns_with_rewards:
-        for campaign, rewards in campaigns_with_rewards:
-            campaign_name = get_campaign_name(campaign["campaign_hash"])
-
-            # 컨트랙트별로 보상 분리
-            rewards_by_contract: dict[str, list] = {}
-            for reward in rewards:
-                contract_addr = reward["contract_address"]
-                if contract_addr not in rewards_by_contract:
-                    rewards_by_contract[contract_addr] = []
-                rewards_by_contract[contract_addr].append(reward)
-
-            # 각 컨트랙트별로 집계
-            for contract_addr, contract_rewards in rewards_by_contract.items():
-                campaign_total = 0
-                campaign_unclaimed = 0
-                campaign_claimed = 0
-                campaign_wallet_rewards = []
-
-                for reward in contract_rewards:
-                    name = reward["wallet_name"]
-                    wallet_totals[name]["total_reward"] += reward["total_reward"]
-                    wallet_totals[name]["bonus_reward"] += reward["bonus_reward"]
-                    wallet_totals[name]["campaign_count"] += 1
-                    if reward["claimed"]:
-                        wallet_totals[name]["claimed"] += reward["total_reward"]
-                    else:
-                        wallet_totals[name]["unclaimed"] += reward["total_reward"]
-
-                    # 컨트랙트별 집계
-                    campaign_total += reward["total_reward"]
-                    if reward["claimed"]:
-                        campaign_claimed += reward["total_reward"]
-                    else:
-                        campaign_unclaimed += reward["total_reward"]
-
-                    # 캠페인 내 지갑별 보상 저장
-                    campaign_wallet_rewards.append({
-                        "wallet_name": name,
-                        "total_reward": reward["total_reward"],
-                        "claimed": reward["claimed"],
-                    })
+    # 연결 확인
+    if not monitor.is_connected():
+        log(f"Failed to connect to {network} RPC")
+        return None
+    log(f"\nConnected to {network}")
+    latest_block = monitor.scheduler.call(monitor.block_number)
+    log(f"Latest block: {latest_block}")
+
+    # 새 컨트랙트 발견 (마지막 checkpoint 이후 블록만 조회)
+    if args.discover_contracts:
+        try:
+            found = monitor.discover_contracts(to_block=latest_block)
+            log(f"Contract discovery: {len(found)} new contract(s) up to block {monitor.registry.last_block}")
+            for addr in found:
+                log(f"  + {addr}")
+        except Exception as e:
+            log(f"Contract discovery failed: {e}")
+        finally:
+            monitor.registry.save()
+    with console():
+        print_rpc_pool_status(monitor.rpc_pool)
+    return monitor, latest_block
 
-                # 컨트랙트별 집계 업데이트
-                if contract_addr in contract_totals:
-                    contract_totals[contract_addr]["total_reward"] += campaign_total
-                    contract_totals[contract_addr]["unclaimed"] += campaign_unclaimed
-                    contract_totals[contract_addr]["claimed"] += campaign_claimed
-                    contract_totals[contract_addr]["campaign_count"] += 1
-                    contract_totals[contract_addr]["campaigns"].append({
-                        "name": campaign_name,
-                        "total": campaign_total,
-                        "unclaimed": campaign_unclaimed,
-                        "wallet_rewards": campaign_wallet_rewards,
-                    })
 
-    # 컨트랙트별 상세 보상 요약 출력
-    print("\nDetailed Rewards by Contract:")
-    print("=" * 60)
-    contract_grand_total = 0
-    contract_grand_unclaimed = 0
+def trace_path(path: str, network: str, multi: bool) -> str:
+    """네트워크별 trace 파일 경로 (여러 네트워크면 확장자 앞에 네트워크 이름 추가)"""
+    if not multi:
+        return path
+    p = Path(path)
+    return str(p.with_name(f"{p.stem}.{network}{p.suffix}"))
 
-    for addr in monitor.contract_addresses:
-        totals = contract_totals[addr]
-        contract_grand_total += totals["total_reward"]
-        contract_grand_unclaimed += totals["unclaimed"]
-
-        print(f"\n[Contract: {addr[:10]}...{addr[-6:]}]")
-        if totals["total_reward"] > 0:
-            print(f"  Total: {wei_to_ether(totals['total_reward']):,.4f} ({totals['campaign_count']} campaigns)")
-
-            for campaign_data in totals["campaigns"]:
-                campaign_status = "Claimed" if campaign_data["unclaimed"] == 0 else "Unclaimed"
-                print(f"\n  Campaign: {campaign_data['name']}")
-                print(f"    Total: {wei_to_ether(campaign_data['total']):,.4f} ({campaign_status})")
-                print("    Wallets:")
-                for wr in campaign_data["wallet_rewards"]:
-                    wr_status = "Claimed" if wr["claimed"] else "Unclaimed"
-                    print(f"      - {wr['wallet_name']}: {wei_to_ether(wr['total_reward']):,.4f} ({wr_status})")
-        else:
-            print("  No rewards found")
-
-    # 전체 합계
-    if contract_grand_total > 0:
-        print("\n" + "-" * 60)
-        print(f"GRAND TOTAL: {wei_to_ether(contract_grand_total):,.4f}")
-        print(f"UNCLAIMED: {wei_to_ether(contract_grand_unclaimed):,.4f}")
-
-    # 지갑별 보상 요약 출력
-    print("\n" + "=" * 60)
-    print("Wallet Rewards Summary:")
-    print("-" * 60)
-    grand_total = 0
-    grand_unclaimed = 0
-    for name, address in wallets.items():
-        totals = wallet_totals[name]
-        if totals["total_reward"] > 0:
-            grand_total += totals["total_reward"]
-            grand_unclaimed += totals["unclaimed"]
-            status = "Claimed" if totals["unclaimed"] == 0 else "Unclaimed"
-            print(f"  {name}: {wei_to_ether(totals['total_reward']):,.4f} ({status})")
-        else:
-            print(f"  {name}: 0.0000")
 
-    if grand_total > 0:
-        print("-" * 60)
-        print(f"  TOTAL: {wei_to_ether(grand_total):,.4f}")
-        print(f"  Unclaimed: {wei_to_ether(grand_unclaimed):,.4f}")
+def main():
+    args = parse_args()
+    networks = args.networks
+    multi = len(networks) > 1
 
-    print("\nMonitored Contracts:")
-    # 네트워크별 Blockscout URL 사용
-    blockscout_base = monitor.blockscout_api_url.replace("/api/v2", "")
-    for addr in monitor.contract_addresses:
-        print(f"  {blockscout_base}/address/{addr}")
+    # text 이외의 형식은 stdout을 레코드 전용으로 쓰고 진행 상황은 stderr로 출력
+    text_output = args.output_format == "text"
+    log = print if text_output else partial(print, file=sys.stderr)
+    console = contextlib.nullcontext if text_output else partial(contextlib.redirect_stdout, sys.stderr)
+
+    try:
+        writer = create_output_writer(args)
+    except RuntimeError as e:
+        log(f"Error: {e}")
+        return
+    verbose = create_report(args, writer).verbose
+
+    log("=" * 60)
+    log("Spacecoin Airdrop Monitor for Creditcoin Chain")
+    log("=" * 60)
+
+    # 지갑 정보 로드
+    try:
+        wallets = get_wallets(args)
+    except FileNotFoundError as e:
+        log(f"\nError: {e}")
+        return
+
+    log(f"\nNetwork: {', '.join(networks)}")
+    log(f"Wallets ({len(wallets)}):")
+    if verbose:
+        for name, addr in wallets.items():
+            log(f"  - {name}: {addr}")
+
+    # 네트워크별 모니터 초기화 (각자 연결 풀, 요청 스케줄러, profiler 사용)
+    sessions = []
+    for network in networks:
+        if multi:
+            log(f"\n[{network}]")
+        connected = connect_network(network, args, log, console)
+        if connected is None:
+            continue
+        monitor, latest_block = connected
+        # 이전 스캔 스냅샷 (diff 및 수령 완료 항목 재사용)
+        snapshot_path = None
+        if not args.no_snapshot:
+            snapshot_path = Path(args.snapshot_file) if args.snapshot_file else default_snapshot_path(network)
+        sessions.append(NetworkSession(monitor, latest_block, snapshot_path))
+        # watch 모드: 마감까지 남은 시간과 수령 상태에 따라 (캠페인, 지갑)별 재조회 주기 적용
+        if args.watch:
+            monitor.refresh = RefreshScheduler()
+        # 대사: Claimed 이벤트를 이벤트 저장소에 증분 수집해 사용 (analytics.py와 같은 파일)
+        if args.reconcile:
+            monitor.event_store = EventStore.load(event_store_path(network)) or EventStore(network)
+    if not sessions:
+        return
+
+    # Prometheus metrics exporter
+    exporter = None
+    if args.metrics_port:
+        exporter = MetricsExporter([session.network for session in sessions])
+        exporter.monitors.extend(session.monitor for session in sessions)
+        exporter.register_cache("campaign_name", lambda: get_campaign_name.cache_info()[:2])
+        exporter.start(args.metrics_port)
+        log(f"Metrics: http://127.0.0.1:{args.metrics_port}/metrics")
+
+    resume = args.resume
+    try:
+        while True:
+            reports = []
+            for session in sessions:
+                session.report = create_report(args, writer)
+                reports.append(session.report)
+                # 완료한 조회를 기록 (중단되면 다음 --resume에서 이어서 실행)
+                session.monitor.checkpoint = ScanCheckpoint.open(session.network, resume=resume)
+            resume = False
+            try:
+                with console():
+                    outcomes = scan_networks(sessions, wallets, args.workers, args.reconcile)
+                    if multi and outcomes:
+                        reports[0].networks_summary(
+                            NetworkScanResults({network: result for network, (result, _) in outcomes.items()})
+                        )
+            finally:
+                for report in reports:
+                    report.close()
+                for session in sessions:
+                    session.monitor.checkpoint.close()
+
+            for session in sessions:
+                if session.network not in outcomes:
+                    continue
+                result, snapshot = outcomes[session.network]
+                if session.snapshot_path is not None:
+                    snapshot.save(session.snapshot_path)
+                    session.previous = snapshot
+                if session.monitor.event_store is not None:
+                    session.monitor.event_store.save(event_store_path(session.network))
+                session.monitor.checkpoint.discard()  # 스캔 완료
+                if exporter is not None:
+                    exporter.set_rewards(reward_metric_rows(result), session.network)
+                    exporter.observe_scan(result.duration, session.latest_block, session.network)
+
+            if not args.watch:
+                break
+            # 마감 임박 항목의 재조회 시각이 --watch 주기보다 빠르면 그때 다시 스캔
+            next_due = min(session.monitor.refresh.next_due_at() for session in sessions)
+            time.sleep(max(0.0, min(args.watch, next_due - time.time())))
+            for session in sessions:
+                session.latest_block = session.monitor.scheduler.call(session.monitor.block_number)
+                log(f"\nLatest block{f' ({session.network})' if multi else ''}: {session.latest_block}")
+            writer = create_output_writer(args)
+    except KeyboardInterrupt:
+        log("\nStopped.")
+
+    for session in sessions:
+        profiler = session.monitor.profiler
+        if args.profile:
+            with console():
+                if multi:
+                    print(f"\n[{session.network}]")
+                print_profile_report(profiler)
+        if args.trace_file:
+            path = trace_path(args.trace_file, session.network, multi)
+            profiler.write_trace(path)
+            log(f"\nTrace written to {path}")
 
 
 if __name__ == "__main__":
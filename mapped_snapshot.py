@@ -0,0 +1,316 @@
+"""
+Memory-mapped Snapshots
+
+스냅샷을 고정 길이 레코드의 바이너리 파일(.snap)로 저장하고, 읽을 때는 파일을 mmap으로 열어
+필요한 레코드만 그 자리에서 디코딩합니다. JSON처럼 전체를 파싱하지 않으므로 리워드가 수백만 개여도
+여는 시간은 거의 0이고, 조회는 정렬된 레코드에 대한 이진 탐색입니다.
+
+파일 구조 (정수는 big-endian, 섹션은 8바이트 정렬):
+
+    header     magic, version, network, latest_block, scanned_at, 섹션별 레코드 수
+    campaigns  contract(20) campaign(32) token(20) deadline(u64)                      (컨트랙트, 캠페인) 순
+    rewards    contract(20) campaign(32) wallet(20) total(u256) bonus(u256) flags(u8) (컨트랙트, 캠페인, 지갑) 순
+    wallets    wallet(20) name offset(u32) name length(u32)                           지갑 순
+    names      UTF-8 지갑 이름
+
+MappedSnapshot은 Snapshot의 조회 인터페이스(campaigns, rewards, wallet_names, deadlines, final_reward)를
+그대로 제공하므로 다음 스캔의 previous로 바로 쓸 수 있습니다.
+"""
+
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from collections.abc import Iterator, Mapping
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from abi_codec import to_checksum_address
+from snapshot import CampaignKey, CampaignState, RewardKey, RewardState, reward_key
+
+if TYPE_CHECKING:
+    from snapshot import Snapshot
+
+MAGIC = b"AIRDSNAP"
+MAPPED_SNAPSHOT_VERSION = 1
+
+HEADER = struct.Struct(">8sI32sqdQQQQ")  # magic, version, network, latest_block(-1: 없음), scanned_at, 레코드 수 x3, names 크기
+CAMPAIGN = struct.Struct(">20s32s20sQ")
+REWARD = struct.Struct(">20s32s20s32s32sB7x")
+WALLET = struct.Struct(">20sII")
+
+CAMPAIGN_KEY_SIZE = 52  # contract + campaign
+REWARD_KEY_SIZE = 72  # contract + campaign + wallet
+CLAIMED = 1
+VERIFICATION = 2
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _raw(hex_value: str) -> bytes:
+    return bytes.fromhex(hex_value.removeprefix("0x"))
+
+
+def _layout(campaigns: int, rewards: int, wallets: int) -> tuple[int, int, int, int]:
+    """(campaigns, rewards, wallets, names) 섹션 시작 위치"""
+    campaigns_at = _align(HEADER.size)
+    rewards_at = _align(campaigns_at + campaigns * CAMPAIGN.size)
+    wallets_at = _align(rewards_at + rewards * REWARD.size)
+    names_at = wallets_at + wallets * WALLET.size
+    return campaigns_at, rewards_at, wallets_at, names_at
+
+
+# =============================================================================
+# Write
+# =============================================================================
+
+
+def write_mapped_snapshot(snapshot: "Snapshot", path: str | Path) -> None:
+    """스냅샷을 .snap 형식으로 저장 (임시 파일에 쓴 뒤 교체)"""
+    campaigns = sorted(
+        CAMPAIGN.pack(_raw(contract), _raw(campaign), _raw(state.token), state.deadline)
+        for (contract, campaign), state in snapshot.campaigns.items()
+    )
+    rewards = sorted(
+        REWARD.pack(
+            _raw(contract),
+            _raw(campaign),
+            _raw(wallet),
+            state.total_reward.to_bytes(32, "big"),
+            state.bonus_reward.to_bytes(32, "big"),
+            (CLAIMED if state.claimed else 0) | (VERIFICATION if state.required_additional_verification else 0),
+        )
+        for (contract, campaign, wallet), state in snapshot.rewards.items()
+    )
+    names = bytearray()
+    wallets = []
+    for wallet, name in sorted((_raw(wallet), name) for wallet, name in snapshot.wallet_names.items()):
+        encoded = name.encode("utf-8")
+        wallets.append(WALLET.pack(wallet, len(names), len(encoded)))
+        names += encoded
+
+    campaigns_at, rewards_at, wallets_at, names_at = _layout(len(campaigns), len(rewards), len(wallets))
+    buffer = bytearray(names_at + len(names))
+    HEADER.pack_into(
+        buffer, 0,
+        MAGIC,
+        MAPPED_SNAPSHOT_VERSION,
+        snapshot.network.encode("utf-8"),
+        snapshot.latest_block if snapshot.latest_block is not None else -1,
+        snapshot.scanned_at,
+        len(campaigns),
+        len(rewards),
+        len(wallets),
+        len(names),
+    )
+    for start, records in ((campaigns_at, campaigns), (rewards_at, rewards), (wallets_at, wallets)):
+        joined = b"".join(records)
+        buffer[start:start + len(joined)] = joined
+    buffer[names_at:] = names
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(buffer)
+    os.replace(tmp_path, path)
+
+
+# =============================================================================
+# Read
+# =============================================================================
+
+
+class _Table:
+    """정렬된 고정 길이 레코드 구간 (key 앞부분으로 이진 탐색)"""
+
+    def __init__(self, view: memoryview, offset: int, count: int, record: struct.Struct, key_size: int):
+        self.view = view
+        self.offset = offset
+        self.count = count
+        self.record = record
+        self.key_size = key_size
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> bytes:
+        """index번째 레코드의 key (bisect용)"""
+        start = self.offset + index * self.record.size
+        return bytes(self.view[start:start + self.key_size])
+
+    def find(self, key: bytes) -> tuple | None:
+        index = bisect_left(self, key)
+        if index < self.count and self[index] == key:
+            return self.unpack(index)
+        return None
+
+    def unpack(self, index: int) -> tuple:
+        return self.record.unpack_from(self.view, self.offset + index * self.record.size)
+
+    def __iter__(self) -> Iterator[tuple]:
+        return iter(self.record.iter_unpack(self.view[self.offset:self.offset + self.count * self.record.size]))
+
+
+class _Addresses:
+    """raw 주소 -> checksum 주소 (컨트랙트처럼 종류가 적은 주소용 캐시)"""
+
+    def __init__(self):
+        self._cache: dict[bytes, str] = {}
+
+    def __call__(self, raw: bytes) -> str:
+        address = self._cache.get(raw)
+        if address is None:
+            address = self._cache[raw] = to_checksum_address(raw)
+        return address
+
+
+class _CampaignMap(Mapping):
+    """(컨트랙트, 캠페인 키) -> CampaignState"""
+
+    def __init__(self, table: _Table, contract_address: _Addresses):
+        self._table = table
+        self._contract_address = contract_address
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __getitem__(self, key: CampaignKey) -> CampaignState:
+        try:
+            record = self._table.find(_raw(key[0]) + _raw(key[1]))
+        except ValueError:
+            record = None
+        if record is None:
+            raise KeyError(key)
+        return CampaignState(to_checksum_address(record[2]), record[3])
+
+    def __iter__(self) -> Iterator[CampaignKey]:
+        for contract, campaign, _, _ in self._table:
+            yield self._contract_address(contract), campaign.hex()
+
+    def items(self):
+        for contract, campaign, token, deadline in self._table:
+            yield (self._contract_address(contract), campaign.hex()), CampaignState(to_checksum_address(token), deadline)
+
+
+class _RewardMap(Mapping):
+    """(컨트랙트, 캠페인 키, 소문자 지갑 주소) -> RewardState"""
+
+    def __init__(self, table: _Table, contract_address: _Addresses):
+        self._table = table
+        self._contract_address = contract_address
+
+    @staticmethod
+    def _state(total: bytes, bonus: bytes, flags: int) -> RewardState:
+        return RewardState(
+            int.from_bytes(total, "big"),
+            int.from_bytes(bonus, "big"),
+            bool(flags & CLAIMED),
+            bool(flags & VERIFICATION),
+        )
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __getitem__(self, key: RewardKey) -> RewardState:
+        try:
+            record = self._table.find(_raw(key[0]) + _raw(key[1]) + _raw(key[2]))
+        except ValueError:
+            record = None
+        if record is None:
+            raise KeyError(key)
+        return self._state(*record[3:])
+
+    def __iter__(self) -> Iterator[RewardKey]:
+        for contract, campaign, wallet, *_ in self._table:
+            yield self._contract_address(contract), campaign.hex(), "0x" + wallet.hex()
+
+    def items(self):
+        for contract, campaign, wallet, *state in self._table:
+            yield (self._contract_address(contract), campaign.hex(), "0x" + wallet.hex()), self._state(*state)
+
+
+class _WalletNames(Mapping):
+    """소문자 지갑 주소 -> 지갑 이름"""
+
+    def __init__(self, table: _Table, names: memoryview):
+        self._table = table
+        self._names = names
+
+    def _name(self, offset: int, length: int) -> str:
+        return str(self._names[offset:offset + length], "utf-8")
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __getitem__(self, wallet: str) -> str:
+        try:
+            record = self._table.find(_raw(wallet))
+        except ValueError:
+            record = None
+        if record is None:
+            raise KeyError(wallet)
+        return self._name(*record[1:])
+
+    def __iter__(self) -> Iterator[str]:
+        for wallet, _, _ in self._table:
+            yield "0x" + wallet.hex()
+
+    def items(self):
+        for wallet, offset, length in self._table:
+            yield "0x" + wallet.hex(), self._name(offset, length)
+
+
+class MappedSnapshot:
+    """mmap으로 연 .snap 스냅샷 (읽기 전용, Snapshot과 같은 조회 인터페이스)"""
+
+    def __init__(self, buffer: mmap.mmap, path: str | Path | None = None):
+        self._mmap = buffer
+        self.path = Path(path) if path is not None else None  # 연 파일 (mmap은 pickle할 수 없으므로 다른 프로세스에는 경로를 전달)
+        view = memoryview(buffer)
+        _, _, network, latest_block, scanned_at, n_campaigns, n_rewards, n_wallets, names_size = HEADER.unpack_from(view)
+        self.network = network.rstrip(b"\0").decode("utf-8")
+        self.latest_block = latest_block if latest_block >= 0 else None
+        self.scanned_at = scanned_at
+
+        campaigns_at, rewards_at, wallets_at, names_at = _layout(n_campaigns, n_rewards, n_wallets)
+        contract_address = _Addresses()
+        self.campaigns = _CampaignMap(_Table(view, campaigns_at, n_campaigns, CAMPAIGN, CAMPAIGN_KEY_SIZE), contract_address)
+        self.rewards = _RewardMap(_Table(view, rewards_at, n_rewards, REWARD, REWARD_KEY_SIZE), contract_address)
+        self.wallet_names = _WalletNames(
+            _Table(view, wallets_at, n_wallets, WALLET, 20), view[names_at:names_at + names_size]
+        )
+
+    @cached_property
+    def deadlines(self) -> dict[str, int]:
+        """캠페인 키 -> 마감 시간 (캠페인 수만큼만 디코딩)"""
+        return {campaign: state.deadline for (_, campaign), state in self.campaigns.items()}
+
+    def final_reward(self, contract_address: str, campaign_hash: str, wallet_address: str) -> RewardState | None:
+        """더 이상 바뀌지 않는(claimed) 리워드 상태 (없으면 None)"""
+        state = self.rewards.get(reward_key(contract_address, campaign_hash, wallet_address))
+        return state if state is not None and state.claimed else None
+
+    @classmethod
+    def open(cls, path: str | Path) -> "MappedSnapshot | None":
+        """.snap 파일 열기 (없거나 형식/크기가 맞지 않으면 None)"""
+        try:
+            with open(path, "rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):  # ValueError: 빈 파일
+            return None
+        if len(buffer) < HEADER.size:
+            buffer.close()
+            return None
+        magic, version, *_, n_campaigns, n_rewards, n_wallets, names_size = HEADER.unpack_from(buffer)
+        if (
+            magic != MAGIC
+            or version != MAPPED_SNAPSHOT_VERSION
+            or len(buffer) != _layout(n_campaigns, n_rewards, n_wallets)[3] + names_size
+        ):
+            buffer.close()
+            return None
+        return cls(buffer, path)
@@ -0,0 +1,216 @@
+"""
+Prometheus Metrics Exporter
+
+스캔 결과(지갑/캠페인별 미수령 보상)와 실행 통계(스캔 시간, RPC 요청/오류, Blockscout 페이지,
+캐시 적중률, 마지막 블록)를 로컬 HTTP 엔드포인트에서 Prometheus text 형식으로 제공합니다.
+
+스캔 루프는 스캔이 끝날 때 결과 dict를 한 번 교체하기만 하고, RPC/Blockscout 카운터는
+scrape 시점에 profiler/RPC 풀에서 읽어오므로 스캔 속도에 영향을 주지 않습니다.
+"""
+
+import bisect
+import threading
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from amounts import TokenAmount
+
+# 스캔 소요 시간 histogram 버킷 (초)
+SCAN_DURATION_BUCKETS = (1, 5, 10, 30, 60, 120, 300, 600, 1800)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+class NetworkMetrics:
+    """네트워크 하나의 스캔 결과와 스캔 시간 histogram"""
+
+    def __init__(self):
+        self.reward_rows: list[tuple[str, str, str, str, int, int, bool]] = []
+        self.last_block: int | None = None
+        self.scans = 0
+        self.bucket_counts = [0] * (len(SCAN_DURATION_BUCKETS) + 1)
+        self.duration_sum = 0.0
+
+
+class MetricsExporter:
+    """모니터 상태를 Prometheus 형식으로 노출하는 HTTP exporter (network 라벨로 네트워크 구분)"""
+
+    def __init__(self, network: str | list[str]):
+        """
+        Args:
+            network: 네트워크 이름 또는 목록 (--network all 등 여러 네트워크를 한 exporter로 노출)
+        """
+        networks = [network] if isinstance(network, str) else list(network)
+        self.network = networks[0]  # network를 생략한 업데이트의 기본 네트워크
+        self.networks = {name: NetworkMetrics() for name in networks}
+        self.monitors: list = []  # scrape 시 RPC/Blockscout 통계를 읽을 AirdropMonitor 목록
+        self.caches: dict[str, Callable[[], tuple[int, int]]] = {}
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+
+    # =========================================================================
+    # Updates (스캔 루프에서 호출)
+    # =========================================================================
+
+    def register_cache(self, name: str, stats: Callable[[], tuple[int, int]]) -> None:
+        """캐시 등록 (stats는 (hits, misses)를 반환하는 함수)"""
+        self.caches[name] = stats
+
+    def set_rewards(
+        self, rows: list[tuple[str, str, str, str, int, int, bool]], network: str | None = None
+    ) -> None:
+        """스캔 결과 교체: (wallet_name, wallet_address, contract, campaign, total_reward, decimals, claimed)"""
+        self.networks[network or self.network].reward_rows = rows
+
+    def observe_scan(self, duration: float, last_block: int | None, network: str | None = None) -> None:
+        """스캔 1회 완료 기록"""
+        stats = self.networks[network or self.network]
+        with self._lock:
+            stats.scans += 1
+            stats.duration_sum += duration
+            stats.bucket_counts[bisect.bisect_left(SCAN_DURATION_BUCKETS, duration)] += 1
+            if last_block is not None:
+                stats.last_block = last_block
+
+    # =========================================================================
+    # Rendering
+    # =========================================================================
+
+    def render(self) -> str:
+        """현재 상태를 Prometheus text exposition 형식으로 변환"""
+        lines: list[str] = []
+
+        def metric(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        # 리워드 (지갑 × 캠페인)
+        wallet_unclaimed: dict[tuple[str, str], float] = {}
+        reward_lines, unclaimed_lines = [], []
+        for network, stats in self.networks.items():
+            for wallet_name, wallet_address, contract, campaign, total_reward, decimals, claimed in stats.reward_rows:
+                labels = _labels(
+                    network=network,
+                    wallet=wallet_name,
+                    address=wallet_address,
+                    contract=contract,
+                    campaign=campaign,
+                )
+                amount = float(TokenAmount(total_reward, decimals).to_decimal())
+                unclaimed = 0.0 if claimed else amount
+                reward_lines.append(f"airdrop_reward_tokens{labels} {amount}")
+                unclaimed_lines.append(f"airdrop_unclaimed_tokens{labels} {unclaimed}")
+                key = (network, wallet_name)
+                wallet_unclaimed[key] = wallet_unclaimed.get(key, 0.0) + unclaimed
+        metric("airdrop_reward_tokens", "gauge", "Reward per wallet and campaign (token units)")
+        lines.extend(reward_lines)
+        metric("airdrop_unclaimed_tokens", "gauge", "Unclaimed reward per wallet and campaign")
+        lines.extend(unclaimed_lines)
+
+        metric("airdrop_wallet_unclaimed_tokens", "gauge", "Unclaimed reward per wallet")
+        for (network, wallet_name), unclaimed in wallet_unclaimed.items():
+            lines.append(
+                f"airdrop_wallet_unclaimed_tokens{_labels(network=network, wallet=wallet_name)} {unclaimed}"
+            )
+
+        # 스캔 시간 histogram
+        with self._lock:
+            snapshots = [
+                (network, list(stats.bucket_counts), stats.duration_sum, stats.scans, stats.last_block)
+                for network, stats in self.networks.items()
+            ]
+        metric("airdrop_scan_duration_seconds", "histogram", "Duration of a full scan")
+        for network, bucket_counts, duration_sum, scans, _ in snapshots:
+            cumulative = 0
+            for bound, count in zip(SCAN_DURATION_BUCKETS, bucket_counts):
+                cumulative += count
+                lines.append(
+                    f"airdrop_scan_duration_seconds_bucket{_labels(network=network, le=str(bound))} {cumulative}"
+                )
+            lines.append(
+                f"airdrop_scan_duration_seconds_bucket{_labels(network=network, le='+Inf')} {scans}"
+            )
+            lines.append(f"airdrop_scan_duration_seconds_sum{_labels(network=network)} {duration_sum}")
+            lines.append(f"airdrop_scan_duration_seconds_count{_labels(network=network)} {scans}")
+
+        block_lines = [
+            f"airdrop_last_processed_block{_labels(network=network)} {last_block}"
+            for network, _, _, _, last_block in snapshots
+            if last_block is not None
+        ]
+        if block_lines:
+            metric("airdrop_last_processed_block", "gauge", "Latest block seen by the last scan")
+            lines.extend(block_lines)
+
+        # RPC 엔드포인트 / Blockscout (scrape 시점에 읽음)
+        metric("airdrop_rpc_requests_total", "counter", "RPC requests per endpoint")
+        error_lines, latency_lines = [], []
+        blockscout_pages = dict.fromkeys(self.networks, 0)
+        for monitor in self.monitors:
+            for status in monitor.rpc_pool.status():
+                labels = _labels(network=monitor.network, endpoint=status["url"])
+                lines.append(f"airdrop_rpc_requests_total{labels} {status['requests']}")
+                error_lines.append(f"airdrop_rpc_errors_total{labels} {status['errors']}")
+                if status["latency"] is not None:
+                    latency_lines.append(f"airdrop_rpc_latency_seconds{labels} {status['latency']}")
+            pages = monitor.profiler.stats.get("blockscout.logs_page")
+            if monitor.network in blockscout_pages and pages:
+                blockscout_pages[monitor.network] += pages.count
+        metric("airdrop_rpc_errors_total", "counter", "RPC transport errors per endpoint")
+        lines.extend(error_lines)
+        metric("airdrop_rpc_latency_seconds", "gauge", "EWMA RPC latency per endpoint")
+        lines.extend(latency_lines)
+        metric("airdrop_blockscout_pages_total", "counter", "Blockscout log pages fetched")
+        for network, pages in blockscout_pages.items():
+            lines.append(f"airdrop_blockscout_pages_total{_labels(network=network)} {pages}")
+
+        # 캐시 적중률
+        if self.caches:
+            metric("airdrop_cache_hit_ratio", "gauge", "Cache hit ratio")
+            ratio_lines = []
+            for name, stats in self.caches.items():
+                hits, misses = stats()
+                total = hits + misses
+                ratio_lines.append(
+                    f"airdrop_cache_hit_ratio{_labels(cache=name)} {hits / total if total else 0.0}"
+                )
+            lines.extend(ratio_lines)
+
+        return "\n".join(lines) + "\n"
+
+    # =========================================================================
+    # HTTP Server
+    # =========================================================================
+
+    def start(self, port: int, host: str = "127.0.0.1") -> None:
+        """백그라운드 스레드에서 /metrics HTTP 서버 시작"""
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server = None
@@ -0,0 +1,283 @@
+"""
+Structured Output Writers
+
+스캔 결과 레코드(캠페인, 지갑 × 캠페인 리워드, 컨트랙트/지갑 합계, 실패한 조회, 변경 사항)를
+JSON / JSON lines / CSV / Parquet 형식으로 저장합니다.
+
+JSON lines와 CSV는 레코드가 생성되는 즉시 큰 버퍼에 기록하고(스트리밍), JSON과 Parquet은
+스캔이 끝날 때 한 번에 기록합니다. 금액은 정밀도 손실이 없도록 최소 단위 정수 그대로 저장합니다
+(reward는 토큰 decimals를 함께 기록하고, 합계 레코드는 AMOUNT_TOTAL_DECIMALS 단위).
+"""
+
+import csv
+import json
+import sys
+import threading
+from decimal import Decimal
+from typing import IO, Any
+
+OUTPUT_FORMATS = ("text", "json", "jsonl", "csv", "parquet")
+
+# 출력 버퍼 크기 (레코드마다 write 시스템 콜이 발생하지 않도록)
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# 레코드 종류별 필드 (CSV/Parquet은 record_type + 전체 필드의 합집합을 컬럼으로 사용)
+RECORD_FIELDS: dict[str, tuple[str, ...]] = {
+    "scan": ("network", "latest_block", "scanned_at", "wallet_count", "contract_count"),
+    "campaign": ("network", "contract_address", "campaign_hash", "campaign_name", "token", "deadline", "source"),
+    "reward": (
+        "network",
+        "wallet_name",
+        "wallet_address",
+        "contract_address",
+        "campaign_hash",
+        "campaign_name",
+        "total_reward",
+        "bonus_reward",
+        "claimed",
+        "required_additional_verification",
+        "decimals",
+        "source",
+    ),
+    "contract_total": (
+        "network",
+        "contract_address",
+        "total_reward",
+        "unclaimed_reward",
+        "claimed_reward",
+        "campaign_count",
+    ),
+    "wallet_total": (
+        "network",
+        "wallet_name",
+        "wallet_address",
+        "total_reward",
+        "bonus_reward",
+        "unclaimed_reward",
+        "claimed_reward",
+        "campaign_count",
+    ),
+    "failed_lookup": ("network", "target", "attempts", "error"),
+    "change": (
+        "network",
+        "kind",
+        "contract_address",
+        "campaign_hash",
+        "campaign_name",
+        "wallet_name",
+        "wallet_address",
+        "old_amount",
+        "new_amount",
+        "deadline",
+    ),
+    "network_total": (
+        "network",
+        "total_reward",
+        "unclaimed_reward",
+        "claimed_reward",
+        "reward_count",
+        "failed_lookups",
+    ),
+    "reconciliation": (
+        "network",
+        "block",
+        "wallet_count",
+        "token_count",
+        "claim_count",
+        "untracked_claims",
+        "issue_count",
+    ),
+    "reconcile_issue": (
+        "network",
+        "kind",
+        "wallet_name",
+        "wallet_address",
+        "token",
+        "contract_address",
+        "campaign_hash",
+        "campaign_name",
+        "expected",
+        "actual",
+    ),
+}
+
+# 최소 단위 정수 금액 필드 (Parquet에서 decimal256(76, 0)으로 저장: decimal128(38)은 uint256 금액이 넘침)
+AMOUNT_FIELDS = frozenset(
+    {
+        "total_reward",
+        "bonus_reward",
+        "unclaimed_reward",
+        "claimed_reward",
+        "old_amount",
+        "new_amount",
+        "expected",
+        "actual",
+    }
+)
+
+
+def _columns() -> list[str]:
+    """CSV/Parquet 컬럼 목록 (record_type + 모든 레코드 필드, 등장 순서 유지)"""
+    columns = ["record_type"]
+    for fields in RECORD_FIELDS.values():
+        columns.extend(f for f in fields if f not in columns)
+    return columns
+
+
+class RecordWriter:
+    """레코드 writer 기본 클래스"""
+
+    binary = False
+
+    def __init__(self, path: str | None = None):
+        """
+        Args:
+            path: 출력 파일 경로 (None 또는 '-'이면 stdout)
+        """
+        self.path = path
+        self.records = 0
+        self.closed = False
+        self._stream: IO | None = None
+        self._lock = threading.Lock()  # 여러 네트워크의 report가 writer 하나를 공유
+        # stdout은 생성 시점의 fd를 기억 (스캔 중 진행 출력이 stderr로 redirect되어도 유지)
+        self._stdout_fd = sys.stdout.fileno() if path in (None, "-") else None
+
+    def _open(self) -> IO:
+        """출력 스트림을 큰 버퍼로 열기 (stdout은 닫지 않음)"""
+        if self._stdout_fd is not None:
+            target, closefd = self._stdout_fd, False
+        else:
+            target, closefd = self.path, True
+        if self.binary:
+            return open(target, "wb", buffering=OUTPUT_BUFFER_SIZE, closefd=closefd)
+        return open(
+            target, "w", buffering=OUTPUT_BUFFER_SIZE, encoding="utf-8", newline="", closefd=closefd
+        )
+
+    @property
+    def stream(self) -> IO:
+        if self._stream is None:
+            self._stream = self._open()
+        return self._stream
+
+    def write(self, record_type: str, record: dict[str, Any]) -> None:
+        """레코드 하나 기록"""
+        with self._lock:
+            self.records += 1
+            self._write(record_type, {f: record.get(f) for f in RECORD_FIELDS[record_type]})
+
+    def _write(self, record_type: str, record: dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """남은 데이터 기록 후 스트림 닫기 (여러 번 호출해도 한 번만 닫음)"""
+        if self.closed:
+            return
+        self.closed = True
+        self._finish()
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def _finish(self) -> None:
+        pass
+
+
+class JsonlWriter(RecordWriter):
+    """레코드마다 한 줄씩 기록하는 JSON lines writer (스트리밍)"""
+
+    def _write(self, record_type: str, record: dict[str, Any]) -> None:
+        self.stream.write(json.dumps({"record_type": record_type, **record}) + "\n")
+
+
+class CsvWriter(RecordWriter):
+    """record_type 컬럼으로 레코드 종류를 구분하는 CSV writer (스트리밍)"""
+
+    def __init__(self, path: str | None = None):
+        super().__init__(path)
+        self._writer: csv.DictWriter | None = None
+
+    def _write(self, record_type: str, record: dict[str, Any]) -> None:
+        if self._writer is None:
+            self._writer = csv.DictWriter(self.stream, fieldnames=_columns())
+            self._writer.writeheader()
+        self._writer.writerow({"record_type": record_type, **record})
+
+
+class JsonWriter(RecordWriter):
+    """레코드 종류별 배열을 가진 JSON 문서 하나로 기록
+
+    scan 레코드가 하나면 그 필드를 최상위에, 여러 네트워크를 스캔했으면 scans 배열로 기록합니다.
+    """
+
+    def __init__(self, path: str | None = None):
+        super().__init__(path)
+        self._scans: list[dict[str, Any]] = []
+        self._document: dict[str, Any] = {}
+
+    def _write(self, record_type: str, record: dict[str, Any]) -> None:
+        if record_type == "scan":
+            self._scans.append(record)
+        else:
+            self._document.setdefault(record_type + "s", []).append(record)
+
+    def _finish(self) -> None:
+        if len(self._scans) == 1:
+            document = {**self._scans[0], **self._document}
+        else:
+            document = {"scans": self._scans, **self._document}
+        json.dump(document, self.stream, indent=2)
+        self.stream.write("\n")
+
+
+class ParquetWriter(RecordWriter):
+    """Parquet writer (pyarrow 필요, 스캔 종료 시 테이블 하나로 기록)"""
+
+    binary = True
+
+    def __init__(self, path: str | None = None):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise RuntimeError(
+                "Parquet output requires pyarrow (pip install pyarrow)"
+            ) from e
+        super().__init__(path)
+        self._rows: list[dict[str, Any]] = []
+
+    def _write(self, record_type: str, record: dict[str, Any]) -> None:
+        self._rows.append({"record_type": record_type, **record})
+
+    def _finish(self) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        columns = {}
+        for name in _columns():
+            values = [row.get(name) for row in self._rows]
+            if name in AMOUNT_FIELDS:
+                values = [Decimal(v) if v is not None else None for v in values]
+                columns[name] = pa.array(values, type=pa.decimal256(76, 0))
+            else:
+                columns[name] = pa.array(values)
+        pq.write_table(pa.table(columns), self.stream)
+
+
+WRITERS: dict[str, type[RecordWriter]] = {
+    "json": JsonWriter,
+    "jsonl": JsonlWriter,
+    "csv": CsvWriter,
+    "parquet": ParquetWriter,
+}
+
+
+def create_writer(output_format: str, path: str | None = None) -> RecordWriter:
+    """형식 이름으로 writer 생성
+
+    Raises:
+        ValueError: 지원하지 않는 형식
+        RuntimeError: 필요한 선택적 의존성(pyarrow)이 없는 경우
+    """
+    if output_format not in WRITERS:
+        raise ValueError(f"Unknown output format: {output_format}. Use: {list(WRITERS)}")
+    return WRITERS[output_format](path)
@@ -0,0 +1,191 @@
+"""
+Hot-path Instrumentation
+
+RPC 메서드, Blockscout 페이지 조회, ABI 디코딩, 요약 집계 등 호출 유형별로
+호출 수, 지연시간 분포(p50/p95/p99), 전송 바이트, 재시도 횟수를 기록합니다.
+--trace-file 사용 시 요청 단위 span을 Chrome trace(JSON) 또는 JSON lines로 저장합니다.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+# 호출 유형별로 보관하는 최근 지연시간 샘플 수 (분위수 계산용)
+MAX_LATENCY_SAMPLES = 100_000
+
+
+class Span:
+    """진행 중인 요청 하나 (호출 측에서 bytes/args를 채움)"""
+
+    __slots__ = ("call_type", "start_ns", "args", "bytes", "retries", "error")
+
+    def __init__(self, call_type: str, args: dict[str, Any]):
+        self.call_type = call_type
+        self.start_ns = time.perf_counter_ns()
+        self.args = args
+        self.bytes = 0
+        self.retries = 0
+        self.error: str | None = None
+
+
+class CallStats:
+    """호출 유형별 누적 통계"""
+
+    __slots__ = ("count", "errors", "total_ns", "durations", "bytes", "retries")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.durations: deque[int] = deque(maxlen=MAX_LATENCY_SAMPLES)  # 최근 샘플 (ns)
+        self.bytes = 0
+        self.retries = 0
+
+    def percentile(self, q: float) -> float:
+        """q 분위 지연시간 (초, nearest-rank)"""
+        if not self.durations:
+            return 0.0
+        ordered = sorted(self.durations)
+        index = min(len(ordered) - 1, max(0, round(q * len(ordered) + 0.5) - 1))
+        return ordered[index] / 1e9
+
+
+class Profiler:
+    """호출 유형별 통계와 (선택적으로) 요청 단위 span 기록"""
+
+    def __init__(self, trace: bool = False):
+        """
+        Args:
+            trace: True면 모든 span을 메모리에 보관 (write_trace용)
+        """
+        self.trace = trace
+        self.stats: dict[str, CallStats] = {}
+        self.spans: list[tuple[str, int, int, int, dict, str | None]] = []
+        self._origin_ns = time.perf_counter_ns()
+        self._epoch_us = time.time() * 1e6
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def span(self, call_type: str, **args: Any) -> Iterator[Span]:
+        """call_type 호출 하나를 측정하는 context manager"""
+        span = self.begin(call_type, **args)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            self.end(span)
+
+    def begin(self, call_type: str, **args: Any) -> Span:
+        """긴 구간(스캔 단계 등) 측정 시작. end()로 종료"""
+        return Span(call_type, args)
+
+    def end(self, span: Span) -> None:
+        """span 종료 및 통계 반영"""
+        duration = time.perf_counter_ns() - span.start_ns
+        self._local.last_call_type = span.call_type
+        with self._lock:
+            stats = self.stats.get(span.call_type)
+            if stats is None:
+                stats = self.stats[span.call_type] = CallStats()
+            stats.count += 1
+            stats.total_ns += duration
+            stats.durations.append(duration)
+            stats.bytes += span.bytes
+            stats.retries += span.retries
+            if span.error:
+                stats.errors += 1
+            if self.trace:
+                self.spans.append((
+                    span.call_type,
+                    span.start_ns,
+                    duration,
+                    threading.get_ident(),
+                    span.args,
+                    span.error,
+                ))
+
+    def add_retry(self) -> None:
+        """이 스레드에서 마지막으로 끝난 호출 유형에 재시도 1회 기록"""
+        call_type = getattr(self._local, "last_call_type", None)
+        if call_type is None:
+            return
+        with self._lock:
+            self.stats[call_type].retries += 1
+
+    def report_rows(self) -> list[dict]:
+        """호출 유형별 통계 (총 소요 시간이 큰 순)"""
+        with self._lock:
+            items = list(self.stats.items())
+        rows = [
+            {
+                "call_type": call_type,
+                "count": stats.count,
+                "errors": stats.errors,
+                "total": stats.total_ns / 1e9,
+                "p50": stats.percentile(0.50),
+                "p95": stats.percentile(0.95),
+                "p99": stats.percentile(0.99),
+                "bytes": stats.bytes,
+                "retries": stats.retries,
+            }
+            for call_type, stats in items
+        ]
+        return sorted(rows, key=lambda r: r["total"], reverse=True)
+
+    def write_trace(self, path: str) -> None:
+        """span 목록 저장 (.jsonl이면 JSON lines, 그 외는 Chrome trace 형식)"""
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self.spans)
+
+        events = []
+        for call_type, start_ns, duration, tid, args, error in spans:
+            event_args = dict(args, error=error) if error else args
+            events.append({
+                "name": call_type,
+                "cat": call_type.split(".", 1)[0],
+                "ph": "X",
+                "ts": self._epoch_us + (start_ns - self._origin_ns) / 1e3,
+                "dur": duration / 1e3,
+                "pid": pid,
+                "tid": tid,
+                "args": event_args,
+            })
+
+        with open(path, "w", encoding="utf-8") as f:
+            if path.endswith(".jsonl"):
+                for event in events:
+                    f.write(json.dumps(event) + "\n")
+            else:
+                json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+_instrumented_codec_class = None
+
+
+def instrumented_codec(codec, profiler: Profiler):
+    """ABI 디코딩 시간을 측정하는 codec (web3 Web3.codec 대체용, eth_abi는 이때 처음 import)"""
+    global _instrumented_codec_class
+    if _instrumented_codec_class is None:
+        from eth_abi.codec import ABICodec
+
+        class InstrumentedCodec(ABICodec):
+            def __init__(self, codec: ABICodec, profiler: Profiler):
+                super().__init__(codec._registry)
+                self.profiler = profiler
+
+            def decode(self, types, data, strict=True):
+                with self.profiler.span("abi.decode") as span:
+                    span.bytes = len(data)
+                    return super().decode(types, data, strict=strict)
+
+        _instrumented_codec_class = InstrumentedCodec
+    return _instrumented_codec_class(codec, profiler)
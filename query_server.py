@@ -0,0 +1,328 @@
+"""
+Query Server
+
+AirdropMonitor 하나를 계속 유지하면서 백그라운드에서 주기적으로 스캔하고, 최신 스냅샷으로 만든
+인덱스로 HTTP/JSON 조회에 응답하는 읽기 전용 서버입니다. 클라이언트가 몇 명이든 RPC/Blockscout 요청은
+스캔 한 번 분량입니다.
+
+- 시작할 때 저장된 스냅샷이 있으면 첫 스캔이 끝나기 전에도 그 스냅샷으로 응답합니다.
+- 재스캔에는 마감 기반 재조회 주기(RefreshScheduler)와 이전 스냅샷의 수령 완료 항목 재사용이 적용됩니다.
+- 인덱스는 스캔마다 새로 만든 뒤 한 번에 교체하므로 요청은 lock 없이 읽습니다.
+
+    GET /status                         마지막 스캔 정보와 전체 합계
+    GET /wallets/<주소 또는 이름>         지갑의 캠페인별 리워드와 합계
+    GET /campaigns                      (컨트랙트, 캠페인)별 합계
+    GET /campaigns/<캠페인 해시>          캠페인의 컨트랙트별 합계와 지갑별 리워드
+    GET /deadlines?within=<초>          마감이 within초 이내인 미수령 리워드 (마감 순)
+
+금액은 토큰 최소 단위 정수이며, 각 항목의 decimals로 토큰 단위로 변환합니다.
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from bisect import bisect_right
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from abi_codec import to_checksum_address
+from amounts import TOKEN_DECIMALS
+from main import AirdropMonitor, get_wallets
+from refresh_scheduler import RefreshScheduler
+from scan_result import normalize_campaign_hash
+from settings import (
+    DEFAULT_NETWORK,
+    DIFF_DEADLINE_WINDOW,
+    QUERY_REFRESH_INTERVAL,
+    QUERY_SERVER_PORT,
+    RPC_URLS,
+)
+from snapshot import Snapshot, default_snapshot_path
+
+
+class QueryIndex:
+    """스냅샷 하나로 만든 조회 인덱스 (만든 뒤에는 바뀌지 않음)"""
+
+    def __init__(self, snapshot: Snapshot, duration: float | None = None):
+        self.network = snapshot.network
+        self.latest_block = snapshot.latest_block
+        self.scanned_at = snapshot.scanned_at
+        self.duration = duration
+        self.wallet_names = snapshot.wallet_names  # 소문자 주소 -> 지갑 이름
+        self.wallet_addresses = {name: addr for addr, name in snapshot.wallet_names.items()}
+
+        self.campaigns: dict[tuple[str, str], dict] = {}  # (컨트랙트, 캠페인 키) -> 합계
+        for (contract, campaign), state in snapshot.campaigns.items():
+            self.campaigns[(contract, campaign)] = self._campaign_entry(contract, campaign, state.token, state.deadline)
+
+        self.by_wallet: dict[str, list[dict]] = {}  # 소문자 주소 -> 리워드 목록
+        unclaimed = []
+        for (contract, campaign, wallet), state in snapshot.rewards.items():
+            entry = self.campaigns.get((contract, campaign))
+            if entry is None:
+                entry = self.campaigns[(contract, campaign)] = self._campaign_entry(
+                    contract, campaign, None, snapshot.deadlines.get(campaign, 0)
+                )
+            reward = {
+                "contract_address": contract,
+                "campaign_hash": "0x" + campaign,
+                "wallet_address": to_checksum_address(wallet),
+                "wallet_name": self.wallet_names.get(wallet, ""),
+                "token": entry["token"],
+                "decimals": entry["decimals"],
+                "deadline": entry["deadline"],
+                **state._asdict(),
+            }
+            self.by_wallet.setdefault(wallet, []).append(reward)
+            entry["wallet_rewards"].append(reward)
+            entry["wallets"] += 1
+            entry["total_reward"] += state.total_reward
+            entry["bonus_reward"] += state.bonus_reward
+            if state.claimed:
+                entry["claimed"] += state.total_reward
+            else:
+                entry["unclaimed"] += state.total_reward
+                if entry["deadline"]:
+                    unclaimed.append((entry["deadline"], reward))
+
+        # 마감 순 미수령 리워드 (구간 조회는 bisect)
+        unclaimed.sort(key=lambda item: item[0])
+        self.unclaimed_deadlines = [deadline for deadline, _ in unclaimed]
+        self.unclaimed_rewards = [reward for _, reward in unclaimed]
+
+        self.campaigns_by_hash: dict[str, list[dict]] = {}
+        for (_, campaign), entry in self.campaigns.items():
+            self.campaigns_by_hash.setdefault(campaign, []).append(entry)
+
+    @staticmethod
+    def _campaign_entry(contract: str, campaign: str, token: str | None, deadline: int) -> dict:
+        return {
+            "contract_address": contract,
+            "campaign_hash": "0x" + campaign,
+            "token": token,
+            "decimals": TOKEN_DECIMALS.get(token) if token else None,
+            "deadline": deadline,
+            "wallets": 0,
+            "total_reward": 0,
+            "bonus_reward": 0,
+            "claimed": 0,
+            "unclaimed": 0,
+            "wallet_rewards": [],
+        }
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def status(self) -> dict:
+        return {
+            "network": self.network,
+            "latest_block": self.latest_block,
+            "scanned_at": self.scanned_at,
+            "scan_duration": self.duration,
+            "campaigns": len(self.campaigns),
+            "rewards": sum(len(rewards) for rewards in self.by_wallet.values()),
+            "wallets": len(self.wallet_names),
+            "unclaimed_rewards": len(self.unclaimed_rewards),
+        }
+
+    def wallet(self, wallet: str) -> dict | None:
+        """주소 또는 지갑 이름으로 리워드 조회 (모르는 지갑이면 None)"""
+        address = self.wallet_addresses.get(wallet, wallet).lower()
+        if address not in self.wallet_names and address not in self.by_wallet:
+            return None
+        rewards = self.by_wallet.get(address, [])
+        return {
+            "wallet_address": to_checksum_address(address),
+            "wallet_name": self.wallet_names.get(address, ""),
+            "campaigns": len(rewards),
+            "unclaimed_campaigns": sum(1 for reward in rewards if not reward["claimed"]),
+            "rewards": rewards,
+        }
+
+    def campaign_list(self) -> list[dict]:
+        """(컨트랙트, 캠페인)별 합계 (지갑별 리워드 제외, 마감 순)"""
+        entries = sorted(self.campaigns.values(), key=lambda e: (e["deadline"], e["contract_address"], e["campaign_hash"]))
+        return [{k: v for k, v in entry.items() if k != "wallet_rewards"} for entry in entries]
+
+    def campaign(self, campaign_hash: str) -> list[dict] | None:
+        return self.campaigns_by_hash.get(normalize_campaign_hash(campaign_hash))
+
+    def deadlines(self, within: float, now: float | None = None) -> list[dict]:
+        """마감이 now ~ now + within 사이인 미수령 리워드 (마감 순)"""
+        now = now if now is not None else time.time()
+        start = bisect_right(self.unclaimed_deadlines, now)
+        end = bisect_right(self.unclaimed_deadlines, now + within, lo=start)
+        return self.unclaimed_rewards[start:end]
+
+
+class QueryServer:
+    """백그라운드 재스캔과 HTTP/JSON 조회"""
+
+    def __init__(
+        self,
+        monitor: AirdropMonitor,
+        wallets: dict[str, str],
+        interval: float = QUERY_REFRESH_INTERVAL,
+        snapshot_path: str | Path | None = None,
+    ):
+        self.monitor = monitor
+        self.wallets = wallets
+        self.interval = interval
+        self.snapshot_path = Path(snapshot_path) if snapshot_path is not None else None
+        self.previous = Snapshot.load(self.snapshot_path) if self.snapshot_path is not None else None
+        if self.previous is not None and self.previous.network != monitor.network:
+            self.previous = None
+        self.index = QueryIndex(self.previous) if self.previous is not None else None
+        self.scans = 0
+        self.scanning = False
+        self.last_error: str | None = None
+        monitor.refresh = RefreshScheduler()
+        self._stop = threading.Event()
+        self._server: ThreadingHTTPServer | None = None
+
+    # =========================================================================
+    # Background refresh
+    # =========================================================================
+
+    def refresh(self) -> None:
+        """스캔 1회 후 스냅샷 저장과 인덱스 교체 (실패하면 이전 인덱스 유지)"""
+        self.scanning = True
+        try:
+            monitor = self.monitor
+            latest_block = monitor.scheduler.call(monitor.block_number)
+            result = monitor.scan(self.wallets, latest_block=latest_block, previous=self.previous)
+            snapshot = Snapshot.from_result(result, self.previous)
+            if self.snapshot_path is not None:
+                snapshot.save(self.snapshot_path)
+            self.previous = snapshot
+            self.index = QueryIndex(snapshot, result.duration)
+            self.scans += 1
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+            print(f"Scan failed: {e}", file=sys.stderr)
+        finally:
+            self.scanning = False
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.is_set():
+            self.refresh()
+            # 마감 임박 항목의 재조회 시각이 주기보다 빠르면 그때 다시 스캔
+            next_due = self.monitor.refresh.next_due_at()
+            self._stop.wait(max(1.0, min(self.interval, next_due - time.time())))
+
+    # =========================================================================
+    # HTTP
+    # =========================================================================
+
+    def handle(self, path: str, query: dict[str, list[str]]) -> tuple[int, object]:
+        """GET 요청 처리: (HTTP status, JSON payload)"""
+        parts = [unquote(part) for part in path.strip("/").split("/") if part]
+        index = self.index
+
+        if parts == ["status"]:
+            status = index.status() if index is not None else {"network": self.monitor.network}
+            status.update(scans=self.scans, scanning=self.scanning, last_error=self.last_error)
+            return 200, status
+        if index is None:
+            return 503, {"error": "first scan in progress"}
+
+        if len(parts) == 2 and parts[0] == "wallets":
+            wallet = index.wallet(parts[1])
+            return (200, wallet) if wallet is not None else (404, {"error": f"unknown wallet: {parts[1]}"})
+        if parts == ["campaigns"]:
+            return 200, index.campaign_list()
+        if len(parts) == 2 and parts[0] == "campaigns":
+            campaign = index.campaign(parts[1])
+            return (200, campaign) if campaign is not None else (404, {"error": f"unknown campaign: {parts[1]}"})
+        if parts == ["deadlines"]:
+            try:
+                within = float(query.get("within", [DIFF_DEADLINE_WINDOW])[0])
+            except ValueError:
+                return 400, {"error": "within must be a number of seconds"}
+            return 200, index.deadlines(within)
+        return 404, {"error": f"unknown path: {path}"}
+
+    def start(self, port: int = QUERY_SERVER_PORT, host: str = "127.0.0.1") -> None:
+        """백그라운드 재스캔 스레드와 HTTP 서버 시작"""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlsplit(self.path)
+                status, payload = server.handle(url.path, parse_qs(url.query))
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        threading.Thread(target=self._refresh_loop, daemon=True).start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server = None
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Read-only HTTP/JSON query server over periodic airdrop scans")
+    parser.add_argument(
+        "--network", "-n",
+        choices=list(RPC_URLS.keys()),
+        default=DEFAULT_NETWORK,
+        help=f"Network to scan (default: {DEFAULT_NETWORK})",
+    )
+    parser.add_argument("--rpc-url", action="append", dest="rpc_urls", help="RPC endpoint URL (repeatable)")
+    parser.add_argument("--wallets", "-w", help="Path to wallets JSON file")
+    parser.add_argument("--address", "-a", help="Single wallet address to check")
+    parser.add_argument("--name", help="Name for the single wallet (used with --address)")
+    parser.add_argument("--host", default="127.0.0.1", help="Listen address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=QUERY_SERVER_PORT, help=f"Listen port (default: {QUERY_SERVER_PORT})")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=QUERY_REFRESH_INTERVAL,
+        metavar="SECONDS",
+        help=f"Rescan interval (default: {QUERY_REFRESH_INTERVAL:g})",
+    )
+    parser.add_argument(
+        "--snapshot-file",
+        help=f"Snapshot to start from and update after each scan (default: {default_snapshot_path('<network>')})",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    try:
+        wallets = get_wallets(args)
+    except FileNotFoundError as e:
+        sys.exit(f"Error: {e}")
+
+    monitor = AirdropMonitor(network=args.network, rpc_urls=args.rpc_urls)
+    snapshot_path = args.snapshot_file or default_snapshot_path(args.network)
+    server = QueryServer(monitor, wallets, args.interval, snapshot_path)
+    server.start(args.port, args.host)
+    print(f"Serving {args.network} ({len(wallets)} wallet(s)) on http://{args.host}:{args.port}/", file=sys.stderr)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        print("\nStopped.", file=sys.stderr)
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
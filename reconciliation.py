@@ -0,0 +1,123 @@
+"""
+Claim Reconciliation
+
+rewardInfoByHash의 claimed 플래그만으로는 토큰이 실제로 지갑에 들어왔는지 알 수 없습니다.
+스캔 결과(스냅샷)의 리워드를 같은 블록 기준의 Claimed 이벤트, 토큰 balanceOf와 비교해
+맞지 않는 (지갑, 캠페인) 또는 (지갑, 토큰)을 찾습니다.
+
+- Claimed 이벤트는 이벤트 저장소를 증분 수집해 읽고, 저장소가 다루지 않는 구간만
+  모든 지갑을 topic OR 필터로 묶어 조회합니다 (AirdropMonitor.claimed_events).
+- balanceOf는 모니터링 지갑 × 캠페인 토큰 전체를 JSON-RPC batch로 같은 블록에 고정해 조회합니다.
+- 지갑이 받은 토큰을 다른 곳으로 옮겼으면 잔액이 수령액보다 작을 수 있으므로
+  balance_below_claimed는 수령 실패가 아니라 확인이 필요하다는 표시입니다.
+"""
+
+from collections import defaultdict
+from typing import NamedTuple
+
+from scan_result import normalize_campaign_hash
+from snapshot import Snapshot
+
+ISSUE_LABELS = {
+    "missing_claim_event": "Claimed without event",
+    "unflagged_claim": "Claim event not in scan",
+    "amount_mismatch": "Claimed amount mismatch",
+    "balance_below_claimed": "Balance below claimed",
+    "balance_unavailable": "Balance lookup failed",
+}
+
+
+class ReconcileIssue(NamedTuple):
+    """대사 결과 맞지 않는 항목 하나"""
+
+    kind: str  # ISSUE_LABELS의 key
+    wallet_address: str  # 소문자
+    token: str | None
+    contract_address: str | None = None  # 잔액 항목은 None
+    campaign_hash: str | None = None  # 0x 없는 소문자
+    expected: int | None = None  # 스캔 결과 기준 (잔액 항목은 순 수령액 합계)
+    actual: int | None = None  # Claimed 이벤트 또는 balanceOf 기준
+
+
+class Reconciliation(NamedTuple):
+    """대사 1회 결과"""
+
+    block: int  # Claimed 이벤트와 balanceOf를 조회한 블록
+    wallet_count: int
+    token_count: int
+    claim_count: int  # 비교한 Claimed 이벤트 수
+    untracked_claims: int  # 스캔에서 발견하지 못한 캠페인의 Claimed 이벤트 수 (비교 제외)
+    received: dict[tuple[str, str], int]  # (소문자 지갑, 토큰) -> Claimed 이벤트의 순 수령액 (totalReward - fee)
+    issues: list[ReconcileIssue]
+
+
+def balance_pairs(snapshot: Snapshot) -> list[tuple[str, str]]:
+    """balanceOf를 조회할 (소문자 지갑, 토큰) 목록 (모니터링 지갑 × 발견된 캠페인 토큰)"""
+    tokens = sorted({state.token for state in snapshot.campaigns.values()})
+    return [(wallet, token) for wallet in snapshot.wallet_names for token in tokens]
+
+
+def reconcile_claims(
+    snapshot: Snapshot,
+    block: int,
+    claims: dict[str, list[dict]],
+    balances: dict[tuple[str, str], int | None],
+) -> Reconciliation:
+    """스냅샷의 리워드를 Claimed 이벤트 및 balanceOf와 비교
+
+    Args:
+        claims: 소문자 지갑 주소 -> Claimed 이벤트 목록 (AirdropMonitor.claimed_events)
+        balances: (소문자 지갑, 토큰) -> block 기준 잔액 (조회 실패는 None)
+    """
+    contracts = {contract.lower(): contract for contract, _ in snapshot.campaigns}
+    claimed_events: dict[tuple[str, str, str], int] = defaultdict(int)  # (컨트랙트, 캠페인, 지갑) -> totalReward 합계
+    received: dict[tuple[str, str], int] = defaultdict(int)
+    claim_count = untracked = 0
+    for wallet, events in claims.items():
+        for event in events:
+            contract = contracts.get(event["contract_address"].lower(), event["contract_address"])
+            campaign = normalize_campaign_hash(event["campaign_hash"])
+            state = snapshot.campaigns.get((contract, campaign))
+            if state is None:
+                untracked += 1
+                continue
+            claim_count += 1
+            claimed_events[(contract, campaign, wallet)] += event["total_reward"]
+            received[(wallet, state.token)] += event["total_reward"] - event["fee"]
+
+    issues = []
+    for key, reward in snapshot.rewards.items():
+        contract, campaign, wallet = key
+        token = snapshot.campaigns[(contract, campaign)].token if (contract, campaign) in snapshot.campaigns else None
+        event_total = claimed_events.get(key)
+        if reward.claimed and event_total is None:
+            issues.append(ReconcileIssue("missing_claim_event", wallet, token, contract, campaign, reward.total_reward, 0))
+        elif event_total is not None and event_total != reward.total_reward:
+            issues.append(
+                ReconcileIssue("amount_mismatch", wallet, token, contract, campaign, reward.total_reward, event_total)
+            )
+    for (contract, campaign, wallet), event_total in claimed_events.items():
+        reward = snapshot.rewards.get((contract, campaign, wallet))
+        if reward is None or not reward.claimed:
+            issues.append(ReconcileIssue(
+                "unflagged_claim", wallet, snapshot.campaigns[(contract, campaign)].token, contract, campaign,
+                reward.total_reward if reward is not None else 0, event_total,
+            ))
+
+    for (wallet, token), balance in balances.items():
+        amount = received.get((wallet, token), 0)
+        if balance is None:
+            if amount:
+                issues.append(ReconcileIssue("balance_unavailable", wallet, token, expected=amount))
+        elif balance < amount:
+            issues.append(ReconcileIssue("balance_below_claimed", wallet, token, expected=amount, actual=balance))
+
+    return Reconciliation(
+        block,
+        len(snapshot.wallet_names),
+        len({token for _, token in balances}),
+        claim_count,
+        untracked,
+        dict(received),
+        issues,
+    )
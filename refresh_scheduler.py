@@ -0,0 +1,97 @@
+"""
+Deadline-aware Refresh Scheduler
+
+--watch 모드에서 (컨트랙트, 캠페인, 지갑)마다 다음 재조회 시각을 정합니다.
+마감이 가까운 미수령 리워드는 자주, 마감이 먼 리워드와 리워드가 없는 항목은 드물게 조회하고,
+수령 완료 / 마감 지남 / 회수된 캠페인은 다시 조회하지 않습니다.
+조회를 건너뛴 항목은 마지막으로 조회한 값을 그대로 사용합니다.
+"""
+
+import heapq
+import math
+import time
+from typing import Any, NamedTuple
+
+from settings import (
+    REFRESH_DEFAULT_INTERVAL,
+    REFRESH_INTERVALS,
+    REFRESH_NO_REWARD_INTERVAL,
+)
+
+RefreshKey = tuple[str, str, str]  # (컨트랙트, 캠페인 키, 소문자 지갑 주소)
+
+
+class CampaignSchedule(NamedTuple):
+    """재조회 간격 계산에 쓰는 캠페인 상태"""
+
+    deadline: int  # 0이면 마감 없음
+    reclaimed: bool
+
+
+class RefreshScheduler:
+    """(컨트랙트, 캠페인, 지갑)별 재조회 시각과 마지막 조회 결과 관리"""
+
+    def __init__(self):
+        self.campaigns: dict[str, CampaignSchedule] = {}
+        self._entries: dict[RefreshKey, tuple[Any, float]] = {}  # key -> (마지막 결과, 다음 조회 시각)
+        self._heap: list[tuple[float, RefreshKey]] = []  # (다음 조회 시각, key), 오래된 항목은 lazy 삭제
+        self.refreshed = 0  # 이번 스캔에서 조회한 항목 수
+        self.skipped = 0  # 이번 스캔에서 건너뛴 항목 수
+
+    def update_campaign(self, campaign_key: str, deadline: int, reclaimed: bool = False) -> None:
+        """캠페인 마감/회수 상태 갱신 (발견 또는 campaignInfo 조회 시)"""
+        self.campaigns[campaign_key] = CampaignSchedule(deadline, reclaimed)
+
+    def interval(self, key: RefreshKey, reward: Any, now: float) -> float | None:
+        """다음 재조회까지의 간격 (초, None이면 다시 조회하지 않음)
+
+        Args:
+            reward: total_reward/claimed 속성을 가진 마지막 조회 결과
+        """
+        campaign = self.campaigns.get(key[1], CampaignSchedule(0, False))
+        if reward.claimed or campaign.reclaimed:
+            return None
+        if campaign.deadline and campaign.deadline <= now:
+            return None
+        if reward.total_reward == 0:
+            return REFRESH_NO_REWARD_INTERVAL
+
+        remaining = campaign.deadline - now if campaign.deadline else math.inf
+        for limit, interval in REFRESH_INTERVALS:
+            if remaining <= limit:
+                return interval
+        return REFRESH_DEFAULT_INTERVAL
+
+    def is_due(self, key: RefreshKey, now: float | None = None) -> bool:
+        """key를 지금 조회해야 하는지 (한 번도 조회하지 않았으면 True)"""
+        entry = self._entries.get(key)
+        return entry is None or entry[1] <= (now if now is not None else time.time())
+
+    def cached(self, key: RefreshKey) -> Any:
+        """마지막 조회 결과 (건너뛴 항목에 사용)"""
+        self.skipped += 1
+        return self._entries[key][0]
+
+    def record(self, key: RefreshKey, reward: Any, now: float | None = None) -> None:
+        """조회 결과 기록 및 다음 조회 시각 계산"""
+        now = now if now is not None else time.time()
+        interval = self.interval(key, reward, now)
+        due = math.inf if interval is None else now + interval
+        self._entries[key] = (reward, due)
+        self.refreshed += 1
+        if interval is not None:
+            heapq.heappush(self._heap, (due, key))
+
+    def next_due_at(self) -> float:
+        """가장 이른 다음 조회 시각 (예정된 항목이 없으면 inf)"""
+        while self._heap:
+            due, key = self._heap[0]
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == due:
+                return due
+            heapq.heappop(self._heap)
+        return math.inf
+
+    def reset_counts(self) -> None:
+        self.refreshed = 0
+        self.skipped = 0
@@ -0,0 +1,174 @@
+"""
+Request Scheduler
+
+RPC와 Blockscout 요청이 함께 사용하는 요청 스케줄러입니다.
+엔드포인트(host)별 token bucket으로 요청 속도를 제한하고, 일시적 오류는 jitter가 적용된
+지수 backoff로 재시도하며, 전체 재시도 횟수는 retry budget으로 제한합니다.
+끝내 실패한 작업 단위는 dead-letter 목록에 쌓아 스캔 마지막에 재시도/보고합니다.
+"""
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, NamedTuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from profiling import Profiler
+from settings import (
+    RATE_LIMIT_DEFAULT,
+    RATE_LIMITS,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_CAP,
+    RETRY_BUDGET_MIN,
+    RETRY_BUDGET_RATIO,
+    RETRY_MAX_ATTEMPTS,
+)
+
+
+class DeadLetter(NamedTuple):
+    """재시도 후에도 실패한 작업 단위"""
+
+    unit: tuple  # 작업 단위 (예: RewardLookup)
+    error: str  # 마지막 오류 메시지
+    attempts: int  # 시도 횟수
+
+
+def endpoint_key(url: str) -> str:
+    """URL에서 rate limit 키(host[:port]) 추출"""
+    return urlsplit(url).netloc or url
+
+
+def is_retryable(error: BaseException) -> bool:
+    """일시적 오류(연결 실패, 타임아웃, HTTP 429/5xx)인지 확인
+
+    컨트랙트 revert 같은 논리 오류는 재시도해도 결과가 같으므로 제외합니다.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, (ConnectionError, TimeoutError, httpx.TransportError))
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 token bucket"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """토큰 하나를 가져옴 (부족하면 대기). 대기한 시간(초)을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RequestScheduler:
+    """엔드포인트별 rate limit, 재시도, dead-letter 관리"""
+
+    def __init__(
+        self,
+        max_attempts: int = RETRY_MAX_ATTEMPTS,
+        backoff_base: float = RETRY_BACKOFF_BASE,
+        backoff_cap: float = RETRY_BACKOFF_CAP,
+        profiler: Profiler | None = None,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.profiler = profiler or Profiler()
+        self.requests = 0
+        self.retries = 0
+        self.throttled_seconds = 0.0
+        self.dead_letters: list[DeadLetter] = []
+        self.rate_limits: dict[str, tuple[float, int]] = dict(RATE_LIMITS)  # host -> (rps, burst)
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, key: str) -> TokenBucket:
+        """키(host)에 해당하는 token bucket (없으면 설정값으로 생성)"""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                rate, burst = self.rate_limits.get(key, RATE_LIMIT_DEFAULT)
+                bucket = self._buckets[key] = TokenBucket(rate, burst)
+            return bucket
+
+    def acquire(self, url: str) -> None:
+        """URL의 엔드포인트에 요청을 보내기 전 rate limit 토큰 획득"""
+        waited = self.bucket(endpoint_key(url)).acquire()
+        with self._lock:
+            self.requests += 1
+            self.throttled_seconds += waited
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째 재시도 전 대기 시간 (full jitter 지수 backoff)"""
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2**attempt))
+
+    def _take_retry(self) -> bool:
+        """retry budget에서 재시도 한 번을 차감 (budget이 없으면 False)"""
+        with self._lock:
+            budget = RETRY_BUDGET_MIN + RETRY_BUDGET_RATIO * self.requests
+            if self.retries >= budget:
+                return False
+            self.retries += 1
+            return True
+
+    def call(self, fn: Callable[..., Any], *args: Any, url: str | None = None) -> Any:
+        """fn(*args) 호출, 일시적 오류는 backoff 후 재시도
+
+        Args:
+            fn: 호출할 함수
+            url: 지정하면 매 시도 전에 해당 엔드포인트의 rate limit 토큰 획득
+
+        Raises:
+            마지막 시도의 예외 (재시도 불가 오류이거나 시도 횟수/budget 소진 시)
+        """
+        attempt = 0
+        while True:
+            if url is not None:
+                self.acquire(url)
+            try:
+                return fn(*args)
+            except Exception as e:
+                attempt += 1
+                if (
+                    not is_retryable(e)
+                    or attempt >= self.max_attempts
+                    or not self._take_retry()
+                ):
+                    e.attempts = attempt
+                    raise
+                self.profiler.add_retry()
+                time.sleep(self.backoff(attempt))
+
+    def reset_retry_budget(self) -> None:
+        """retry budget을 새로 시작 (스캔 마지막 재시도 단계용)"""
+        with self._lock:
+            self.requests = 0
+            self.retries = 0
+
+    def dead_letter(self, unit: tuple, error: BaseException) -> None:
+        """재시도 후에도 실패한 작업 단위를 dead-letter 목록에 추가"""
+        with self._lock:
+            self.dead_letters.append(
+                DeadLetter(unit=unit, error=str(error), attempts=getattr(error, "attempts", 1))
+            )
+
+    def drain_dead_letters(self) -> list[DeadLetter]:
+        """dead-letter 목록을 꺼내고 비움 (재시도용)"""
+        with self._lock:
+            letters, self.dead_letters = self.dead_letters, []
+            return letters
@@ -0,0 +1,430 @@
+"""
+RPC Endpoint Pool
+
+네트워크별 여러 RPC 엔드포인트를 하나의 JSON-RPC 클라이언트로 묶습니다.
+엔드포인트마다 지연시간/오류율을 EWMA로 추적해 가장 빠른 정상 노드로 요청을 보내고,
+응답이 느리면 두 번째 노드로 hedge 요청을 보내며, head 블록이 뒤처진 노드는 제외합니다.
+
+web3에 의존하지 않으며, web3 provider가 필요하면 web3_provider()로 감싸서 사용합니다
+(web3는 그때 처음 import).
+"""
+
+import itertools
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any
+
+import httpx
+
+from settings import (
+    RPC_EWMA_ALPHA,
+    RPC_FAILURE_COOLDOWN,
+    RPC_FAILURE_THRESHOLD,
+    RPC_HEAD_CHECK_INTERVAL,
+    RPC_HEDGE_LATENCY_FACTOR,
+    RPC_HEDGE_MIN_DELAY,
+    RPC_MAX_BLOCK_LAG,
+    RPC_MAX_ERROR_RATE,
+    RPC_TIMEOUT,
+)
+from profiling import Profiler, Span
+from request_scheduler import RequestScheduler
+
+# hedge(중복 전송) 하면 안 되는 메서드
+_NON_IDEMPOTENT_METHODS = {"eth_sendRawTransaction", "eth_sendTransaction"}
+
+# 노드 과부하/요청 제한을 의미하는 JSON-RPC 에러 코드 (EIP-1474 limit exceeded)
+_THROTTLE_ERROR_CODES = {-32005}
+# 컨트랙트 revert를 의미하는 JSON-RPC 에러 코드 (geth: execution reverted)
+_REVERT_ERROR_CODES = {3}
+
+
+class RpcEndpointError(ConnectionError):
+    """엔드포인트 전송 실패 (타임아웃, HTTP 5xx/429, 요청 제한)"""
+
+    def __init__(self, url: str, message: str):
+        super().__init__(f"{url}: {message}")
+        self.url = url
+
+
+class RpcResponseError(Exception):
+    """JSON-RPC 에러 응답 (execution reverted 등, 재시도 대상 아님)"""
+
+    def __init__(self, method: str, error: Any):
+        message = error.get("message", error) if isinstance(error, dict) else error
+        super().__init__(f"{method}: {message}")
+        self.error = error
+
+
+class EndpointStats:
+    """엔드포인트별 지연시간/오류율 통계"""
+
+    def __init__(self, url: str, alpha: float = RPC_EWMA_ALPHA):
+        self.url = url
+        self.alpha = alpha
+        self.latency: float | None = None  # EWMA 지연시간 (초), 측정 전에는 None
+        self.error_rate = 0.0  # EWMA 오류율 (0.0 ~ 1.0)
+        self.requests = 0
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.cooldown_until = 0.0
+        self.head_block: int | None = None
+        self.lagging = False
+        self._lock = threading.Lock()
+
+    def record_success(self, latency: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.consecutive_errors = 0
+            if self.latency is None:
+                self.latency = latency
+            else:
+                self.latency += self.alpha * (latency - self.latency)
+            self.error_rate *= 1 - self.alpha
+
+    def record_error(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self.errors += 1
+            self.consecutive_errors += 1
+            self.error_rate += self.alpha * (1.0 - self.error_rate)
+            if self.consecutive_errors >= RPC_FAILURE_THRESHOLD:
+                self.cooldown_until = time.monotonic() + RPC_FAILURE_COOLDOWN
+
+    def is_healthy(self, now: float) -> bool:
+        return (
+            not self.lagging
+            and now >= self.cooldown_until
+            and self.error_rate <= RPC_MAX_ERROR_RATE
+        )
+
+    def score(self) -> float:
+        """낮을수록 우선 (측정 전 엔드포인트는 한 번씩 시도되도록 0으로 취급)"""
+        latency = self.latency if self.latency is not None else 0.0
+        return latency * (1.0 + 4.0 * self.error_rate)
+
+
+class RpcPool:
+    """여러 RPC 엔드포인트에 요청을 분산하는 JSON-RPC 클라이언트"""
+
+    def __init__(
+        self,
+        urls: list[str],
+        timeout: float = RPC_TIMEOUT,
+        max_block_lag: int = RPC_MAX_BLOCK_LAG,
+        head_check_interval: float = RPC_HEAD_CHECK_INTERVAL,
+        scheduler: RequestScheduler | None = None,
+        profiler: Profiler | None = None,
+        call_labels: dict[str, str] | None = None,
+    ):
+        """
+        Args:
+            urls: RPC 엔드포인트 URL 목록 (앞에 있을수록 동률일 때 우선)
+            timeout: 요청 타임아웃 (초)
+            max_block_lag: 최고 head 대비 허용하는 블록 지연
+            head_check_interval: head 블록 일치 여부 재확인 주기 (초)
+            scheduler: 엔드포인트별 rate limit을 적용할 요청 스케줄러
+            profiler: 요청별 지연시간/바이트를 기록할 profiler
+            call_labels: eth_call 함수 selector(0x + 8자리) → 함수 이름 (측정 라벨용)
+        """
+        if not urls:
+            raise ValueError("RpcPool requires at least one RPC URL")
+
+        self.endpoints = [EndpointStats(url) for url in dict.fromkeys(urls)]
+        self.max_block_lag = max_block_lag
+        self.head_check_interval = head_check_interval
+        self.scheduler = scheduler or RequestScheduler()
+        self.profiler = profiler or self.scheduler.profiler
+        self.call_labels = call_labels or {}
+        self.hedged_requests = 0
+        self._request_ids = itertools.count()
+        self._last_head_check: float | None = None
+        self._clients = {
+            ep.url: httpx.Client(timeout=timeout, headers={"Content-Type": "application/json"})
+            for ep in self.endpoints
+        }
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(2, 2 * len(self.endpoints)), thread_name_prefix="rpc-pool"
+        )
+
+    def __repr__(self) -> str:
+        return f"RpcPool({[ep.url for ep in self.endpoints]})"
+
+    # =========================================================================
+    # Routing
+    # =========================================================================
+
+    def ranked_endpoints(self) -> list[EndpointStats]:
+        """라우팅 우선순위 순으로 정렬된 엔드포인트 목록
+
+        정상 노드를 빠른 순으로 먼저 두고, 비정상 노드는 최후의 failover 대상으로 뒤에 둡니다.
+        """
+        now = time.monotonic()
+        healthy = [ep for ep in self.endpoints if ep.is_healthy(now)]
+        unhealthy = [ep for ep in self.endpoints if not ep.is_healthy(now)]
+        return sorted(healthy, key=EndpointStats.score) + sorted(
+            unhealthy, key=lambda ep: (ep.lagging, ep.cooldown_until, ep.score())
+        )
+
+    def _hedge_delay(self, endpoint: EndpointStats) -> float:
+        if endpoint.latency is None:
+            return RPC_HEDGE_MIN_DELAY
+        return max(RPC_HEDGE_MIN_DELAY, endpoint.latency * RPC_HEDGE_LATENCY_FACTOR)
+
+    def _post(self, endpoint: EndpointStats, request_data: bytes) -> bytes:
+        """단일 엔드포인트로 요청 전송 (통계 기록 포함)"""
+        self.scheduler.acquire(endpoint.url)
+        start = time.perf_counter()
+        try:
+            response = self._clients[endpoint.url].post(endpoint.url, content=request_data)
+            if response.status_code == 429 or response.status_code >= 500:
+                raise RpcEndpointError(endpoint.url, f"HTTP {response.status_code}")
+            response.raise_for_status()
+            raw = response.content
+            if b'"error"' in raw and _is_throttle_response(raw):
+                raise RpcEndpointError(endpoint.url, "rate limited")
+        except httpx.HTTPError as e:
+            endpoint.record_error()
+            raise RpcEndpointError(endpoint.url, str(e) or type(e).__name__) from e
+        except RpcEndpointError:
+            endpoint.record_error()
+            raise
+        endpoint.record_success(time.perf_counter() - start)
+        return raw
+
+    def _dispatch(self, method: str, request_data: bytes, span: Span) -> bytes:
+        """가장 빠른 정상 노드로 전송하고, 느리면 hedge, 실패하면 다음 노드로 failover"""
+        candidates = self.ranked_endpoints()
+        errors: list[RpcEndpointError] = []
+
+        while candidates:
+            span.retries = len(errors)
+            primary = candidates.pop(0)
+            if not candidates or method in _NON_IDEMPOTENT_METHODS:
+                try:
+                    raw = self._post(primary, request_data)
+                    span.args["endpoint"] = primary.url
+                    return raw
+                except RpcEndpointError as e:
+                    errors.append(e)
+                    continue
+
+            futures = {self._executor.submit(self._post, primary, request_data): primary}
+            done, _ = wait(futures, timeout=self._hedge_delay(primary))
+            if not done:
+                backup = candidates.pop(0)
+                self.hedged_requests += 1
+                span.args["hedged"] = True
+                futures[self._executor.submit(self._post, backup, request_data)] = backup
+
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        raw = future.result()
+                    except RpcEndpointError as e:
+                        errors.append(e)
+                        continue
+                    span.args["endpoint"] = futures[future].url
+                    return raw
+
+        raise RpcEndpointError(
+            "rpc-pool", "all endpoints failed: " + "; ".join(str(e) for e in errors)
+        )
+
+    # =========================================================================
+    # Head Block Agreement
+    # =========================================================================
+
+    def check_head_agreement(self) -> dict[str, int | None]:
+        """모든 엔드포인트의 head 블록을 조회하고 뒤처진 노드를 라우팅에서 제외"""
+        request_data = self.encode_rpc_request("eth_blockNumber", [])
+        futures = {
+            ep: self._executor.submit(self._post, ep, request_data) for ep in self.endpoints
+        }
+
+        heads: dict[str, int | None] = {}
+        for ep, future in futures.items():
+            try:
+                ep.head_block = int(self.decode_rpc_response(future.result())["result"], 16)
+            except (RpcEndpointError, KeyError, TypeError, ValueError):
+                ep.head_block = None
+            heads[ep.url] = ep.head_block
+
+        best = max((h for h in heads.values() if h is not None), default=None)
+        for ep in self.endpoints:
+            ep.lagging = (
+                best is not None
+                and ep.head_block is not None
+                and best - ep.head_block > self.max_block_lag
+            )
+
+        self._last_head_check = time.monotonic()
+        return heads
+
+    def _maybe_check_heads(self) -> None:
+        if len(self.endpoints) < 2:
+            return
+        if (
+            self._last_head_check is None
+            or time.monotonic() - self._last_head_check >= self.head_check_interval
+        ):
+            self.check_head_agreement()
+
+    # =========================================================================
+    # JSON-RPC
+    # =========================================================================
+
+    def encode_rpc_request(self, method: str, params: Any) -> bytes:
+        request = {"jsonrpc": "2.0", "method": method, "params": params or [], "id": next(self._request_ids)}
+        return json.dumps(request, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+    def encode_batch_rpc_request(self, requests: list[tuple[str, Any]]) -> bytes:
+        return b"[" + b",".join(self.encode_rpc_request(method, params) for method, params in requests) + b"]"
+
+    @staticmethod
+    def decode_rpc_response(raw: bytes) -> Any:
+        return json.loads(raw)
+
+    def _call_type(self, method: str, params: Any) -> tuple[str, dict]:
+        """측정 라벨과 trace 인자 (eth_call은 호출 함수/컨트랙트별로 구분)"""
+        if method != "eth_call" or not params or not isinstance(params[0], dict):
+            return f"rpc.{method}", {}
+        tx = params[0]
+        selector = str(tx.get("data") or tx.get("input") or "")[:10]
+        label = self.call_labels.get(selector, selector)
+        return f"rpc.eth_call:{label}", {"to": tx.get("to")}
+
+    def make_request(self, method: str, params: Any) -> dict:
+        """JSON-RPC 요청 하나 (응답 dict 그대로 반환)"""
+        self._maybe_check_heads()
+        call_type, args = self._call_type(method, params)
+        with self.profiler.span(call_type, **args) as span:
+            request_data = self.encode_rpc_request(method, params)
+            raw = self._dispatch(method, request_data, span)
+            span.bytes = len(request_data) + len(raw)
+        return self.decode_rpc_response(raw)
+
+    def make_batch_request(self, requests: list[tuple[str, Any]]) -> list[dict] | dict:
+        self._maybe_check_heads()
+        with self.profiler.span("rpc.batch", size=len(requests)) as span:
+            request_data = self.encode_batch_rpc_request(requests)
+            raw = self._dispatch("batch", request_data, span)
+            span.bytes = len(request_data) + len(raw)
+        response = self.decode_rpc_response(raw)
+        if not isinstance(response, list):
+            return response
+        return sorted(response, key=lambda r: r.get("id", 0))
+
+    def request(self, method: str, params: Any) -> Any:
+        """JSON-RPC 요청 후 result 반환
+
+        Raises:
+            RpcResponseError: 에러 응답 (revert 등)
+        """
+        response = self.make_request(method, params)
+        if "error" in response:
+            raise RpcResponseError(method, response["error"])
+        return response["result"]
+
+    def eth_call(self, to: str, data: str, block: str | int = "latest") -> bytes:
+        """eth_call 반환 데이터"""
+        if isinstance(block, int):
+            block = hex(block)
+        return bytes.fromhex(self.request("eth_call", [{"to": to, "data": data}, block])[2:])
+
+    def block_number(self) -> int:
+        return int(self.request("eth_blockNumber", []), 16)
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        heads = self.check_head_agreement()
+        if any(h is not None for h in heads.values()):
+            return True
+        if show_traceback:
+            raise RpcEndpointError("rpc-pool", "no endpoint returned a head block")
+        return False
+
+    def status(self) -> list[dict]:
+        """엔드포인트별 현재 상태 (출력용)"""
+        now = time.monotonic()
+        return [
+            {
+                "url": ep.url,
+                "healthy": ep.is_healthy(now),
+                "latency": ep.latency,
+                "error_rate": ep.error_rate,
+                "requests": ep.requests,
+                "errors": ep.errors,
+                "head_block": ep.head_block,
+                "lagging": ep.lagging,
+            }
+            for ep in self.endpoints
+        ]
+
+
+def _json_default(value: Any) -> Any:
+    """bytes(HexBytes 포함)를 0x hex로 직렬화 (web3가 넘기는 파라미터용)"""
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + bytes(value).hex()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_web3_provider_class = None
+
+
+def web3_provider(pool: RpcPool):
+    """RpcPool을 web3 provider로 감싸기 (web3는 이때 처음 import)"""
+    global _web3_provider_class
+    if _web3_provider_class is None:
+        from web3.providers import JSONBaseProvider
+
+        class RpcPoolProvider(JSONBaseProvider):
+            """RpcPool로 요청을 보내는 web3 provider"""
+
+            def __init__(self, rpc_pool: RpcPool):
+                super().__init__()
+                self.rpc_pool = rpc_pool
+
+            def make_request(self, method, params):
+                return self.rpc_pool.make_request(method, params)
+
+            def make_batch_request(self, requests):
+                return self.rpc_pool.make_batch_request(requests)
+
+            def is_connected(self, show_traceback: bool = False) -> bool:
+                return self.rpc_pool.is_connected(show_traceback)
+
+        _web3_provider_class = RpcPoolProvider
+    return _web3_provider_class(pool)
+
+
+def is_revert(error: Any) -> bool:
+    """JSON-RPC 에러(에러 객체 또는 RpcResponseError)가 컨트랙트 revert인지 확인
+
+    revert는 다시 조회해도 결과가 같으므로 리워드 없음으로 처리하고, 그 밖의 에러
+    (노드 내부 오류, 요청 제한 등)는 일시적 오류로 보고 다시 조회합니다.
+    """
+    if isinstance(error, RpcResponseError):
+        error = error.error
+    if not isinstance(error, dict):
+        return "revert" in str(error).lower()
+    return error.get("code") in _REVERT_ERROR_CODES or "revert" in str(error.get("message", "")).lower()
+
+
+def _is_throttle_response(raw: bytes) -> bool:
+    """JSON-RPC 응답이 요청 제한 에러인지 확인"""
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        return False
+    for item in data if isinstance(data, list) else [data]:
+        error = item.get("error") if isinstance(item, dict) else None
+        if not isinstance(error, dict):
+            continue
+        message = str(error.get("message", "")).lower()
+        if error.get("code") in _THROTTLE_ERROR_CODES or "rate limit" in message:
+            return True
+    return False
@@ -0,0 +1,167 @@
+"""
+Scan Result
+
+스캔 1회의 결과와 집계입니다. 리워드가 추가될 때마다 지갑별, 컨트랙트별, 컨트랙트 × 캠페인별
+합계를 함께 갱신하므로 요약 출력, 구조화된 출력, metrics는 합계를 다시 계산하지 않고 읽기만 합니다.
+
+금액은 모두 정수입니다. 캠페인 합계는 캠페인 토큰의 최소 단위, 그 밖의 합계(전체, 지갑별, 컨트랙트별)는
+decimals가 다른 토큰도 더할 수 있도록 AMOUNT_TOTAL_DECIMALS 단위로 맞춘 값입니다.
+"""
+
+import time
+
+from amounts import total_scale
+from request_scheduler import DeadLetter
+from settings import DEFAULT_TOKEN_DECIMALS
+
+
+def normalize_campaign_hash(campaign_hash: str) -> str:
+    """캠페인 해시를 0x 없는 소문자 hex로 정규화 (집계 키)"""
+    return campaign_hash.lower().removeprefix("0x")
+
+
+class RewardTotals:
+    """리워드 합계 (최소 단위 정수)"""
+
+    __slots__ = ("total_reward", "bonus_reward", "claimed", "unclaimed", "campaign_count")
+
+    def __init__(self):
+        self.total_reward = 0
+        self.bonus_reward = 0
+        self.claimed = 0  # 수령 완료된 리워드 합계
+        self.unclaimed = 0  # 미수령 리워드 합계
+        self.campaign_count = 0
+
+    def add(self, reward: dict, scale: int = 1) -> None:
+        """리워드 레코드 하나를 합계에 반영 (scale: 합계 단위로 맞추는 배수)"""
+        total_reward = reward["total_reward"] * scale
+        self.total_reward += total_reward
+        self.bonus_reward += reward["bonus_reward"] * scale
+        if reward["claimed"]:
+            self.claimed += total_reward
+        else:
+            self.unclaimed += total_reward
+
+    def merge(self, other: "RewardTotals") -> None:
+        """다른 합계를 더하기 (네트워크 합산)"""
+        self.total_reward += other.total_reward
+        self.bonus_reward += other.bonus_reward
+        self.claimed += other.claimed
+        self.unclaimed += other.unclaimed
+        self.campaign_count += other.campaign_count
+
+
+class CampaignTotals(RewardTotals):
+    """컨트랙트 × 캠페인 합계와 지갑별 리워드 목록"""
+
+    __slots__ = ("contract_address", "campaign_hash", "decimals", "wallet_rewards")
+
+    def __init__(self, contract_address: str, campaign_hash: str, decimals: int = DEFAULT_TOKEN_DECIMALS):
+        super().__init__()
+        self.contract_address = contract_address
+        self.campaign_hash = campaign_hash
+        self.decimals = decimals  # 캠페인 토큰 decimals (합계는 토큰 최소 단위)
+        self.wallet_rewards: list[dict] = []
+
+    def add(self, reward: dict, scale: int = 1) -> None:
+        super().add(reward)
+        self.wallet_rewards.append(reward)
+
+
+class ScanResult:
+    """스캔 1회 결과 (발견된 캠페인, 지갑별 리워드, 증분 집계, 실패한 조회)"""
+
+    def __init__(
+        self,
+        network: str,
+        wallets: dict[str, str],
+        contract_addresses: list[str],
+        latest_block: int | None = None,
+    ):
+        self.network = network
+        self.wallets = wallets
+        self.contract_addresses = contract_addresses
+        self.latest_block = latest_block
+        self.started_at = time.time()
+        self.duration = 0.0
+
+        self.campaigns: list[dict] = []  # 발견된 캠페인
+        self.campaigns_with_rewards: list[tuple[dict, list[dict]]] = []  # (캠페인, 리워드 목록)
+        self.known_name_campaigns: list[tuple] = []  # 이름으로 찾은 (컨트랙트, 캠페인 이름, 캠페인 정보, decimals)
+        self.known_name_rewards: list[tuple] = []  # 캠페인 이름으로 조회한 (작업 단위, 리워드)
+        self.failed: list[DeadLetter] = []  # 재시도 후에도 실패한 조회
+        self.reused_rewards = 0  # 이전 스냅샷에서 재사용한 (조회를 건너뛴) 리워드 수
+
+        # 집계 (add_reward에서 갱신)
+        self.totals = RewardTotals()  # AMOUNT_TOTAL_DECIMALS 단위
+        self.wallet_totals = {name: RewardTotals() for name in wallets}
+        self.contract_totals = {addr: RewardTotals() for addr in contract_addresses}
+        self.campaign_totals: dict[tuple[str, str], CampaignTotals] = {}  # (컨트랙트, 캠페인 키)
+        self.contract_campaigns: dict[str, list[CampaignTotals]] = {
+            addr: [] for addr in contract_addresses
+        }
+        self._campaign_rewards: dict[str, list[dict]] = {}  # 캠페인 키 -> campaigns_with_rewards의 리워드 목록
+
+    @property
+    def campaigns_without_rewards(self) -> int:
+        """모니터링 지갑의 리워드가 없는 발견된 캠페인 수"""
+        return len(self.campaigns) - len(self.campaigns_with_rewards)
+
+    @property
+    def reward_count(self) -> int:
+        """지갑 × 컨트랙트 × 캠페인 리워드 수"""
+        return sum(len(rewards) for _, rewards in self.campaigns_with_rewards)
+
+    def rewards_for_campaign(self, campaign_hash: str) -> list[dict]:
+        """캠페인의 리워드 목록 (없으면 빈 목록)"""
+        return self._campaign_rewards.get(normalize_campaign_hash(campaign_hash), [])
+
+    def add_reward(self, campaign: dict, reward: dict) -> None:
+        """발견된 캠페인의 지갑 리워드 하나를 추가하고 집계 갱신
+
+        reward["decimals"]는 캠페인 토큰의 decimals입니다 (없으면 DEFAULT_TOKEN_DECIMALS).
+        """
+        decimals = reward.get("decimals", DEFAULT_TOKEN_DECIMALS)
+        scale = total_scale(decimals)
+        key = normalize_campaign_hash(campaign["campaign_hash"])
+        rewards = self._campaign_rewards.get(key)
+        if rewards is None:
+            rewards = self._campaign_rewards[key] = []
+            self.campaigns_with_rewards.append((campaign, rewards))
+        rewards.append(reward)
+
+        self.totals.add(reward, scale)
+        wallet_totals = self.wallet_totals.get(reward["wallet_name"])
+        if wallet_totals is not None:
+            wallet_totals.add(reward, scale)
+            wallet_totals.campaign_count += 1
+
+        contract_addr = reward["contract_address"]
+        contract_totals = self.contract_totals.get(contract_addr)
+        if contract_totals is None:
+            return
+        campaign_totals = self.campaign_totals.get((contract_addr, key))
+        if campaign_totals is None:
+            campaign_totals = CampaignTotals(contract_addr, campaign["campaign_hash"], decimals)
+            self.campaign_totals[(contract_addr, key)] = campaign_totals
+            self.contract_campaigns[contract_addr].append(campaign_totals)
+            contract_totals.campaign_count += 1
+        campaign_totals.add(reward)
+        contract_totals.add(reward, scale)
+
+
+class NetworkScanResults:
+    """여러 네트워크를 동시에 스캔한 결과 (네트워크별 ScanResult와 네트워크 합산 집계)"""
+
+    def __init__(self, results: dict[str, ScanResult]):
+        self.results = results
+        self.totals = RewardTotals()  # AMOUNT_TOTAL_DECIMALS 단위
+        self.wallet_totals: dict[str, RewardTotals] = {}
+        for result in results.values():
+            self.totals.merge(result.totals)
+            for name, totals in result.wallet_totals.items():
+                self.wallet_totals.setdefault(name, RewardTotals()).merge(totals)
+
+    @property
+    def reward_count(self) -> int:
+        return sum(result.reward_count for result in self.results.values())
@@ -21,6 +21,122 @@ RPC_URLS = {
     "testnet": "https://rpc.cc3-testnet.creditcoin.network",
 }
 
+# --network all로 동시에 스캔할 네트워크 (mainnet_remote는 mainnet과 같은 체인)
+ALL_NETWORKS = ["mainnet", "testnet"]
+
+# =============================================================================
+# RPC Endpoint Pool
+# =============================================================================
+
+# 네트워크별 RPC 엔드포인트 목록 (지연시간/오류율 기반으로 라우팅, 장애 시 failover)
+RPC_POOL_URLS = {
+    "mainnet": [RPC_URLS["mainnet"], RPC_URLS["mainnet_remote"]],
+    "mainnet_remote": [RPC_URLS["mainnet_remote"]],
+    "testnet": [RPC_URLS["testnet"]],
+}
+
+RPC_TIMEOUT = 30.0  # 요청 타임아웃 (초)
+RPC_EWMA_ALPHA = 0.2  # 지연시간/오류율 EWMA 가중치
+RPC_MAX_ERROR_RATE = 0.5  # 이 오류율을 넘으면 비정상 노드로 간주
+RPC_FAILURE_COOLDOWN = 30.0  # 연속 실패 후 라우팅에서 제외하는 시간 (초)
+RPC_FAILURE_THRESHOLD = 3  # cooldown 진입까지의 연속 실패 횟수
+RPC_HEDGE_MIN_DELAY = 0.5  # hedge 요청을 보내기 전 최소 대기 시간 (초)
+RPC_HEDGE_LATENCY_FACTOR = 3.0  # 평균 지연시간의 몇 배를 넘으면 hedge 할지
+RPC_MAX_BLOCK_LAG = 5  # 최고 head 대비 허용하는 블록 지연
+RPC_HEAD_CHECK_INTERVAL = 60.0  # head 블록 일치 여부 재확인 주기 (초)
+RPC_BATCH_SIZE = 50  # 리워드 조회 eth_call을 묶어 보내는 JSON-RPC batch 크기 (1이면 batch 미사용)
+RPC_TOPIC_FILTER_SIZE = 200  # eth_getLogs topic OR 필터 하나에 넣는 지갑 수
+
+# =============================================================================
+# Rate Limits & Retry (RPC + Blockscout 공통)
+# =============================================================================
+
+# 엔드포인트(host[:port])별 token bucket 설정: (초당 요청 수, burst)
+RATE_LIMITS = {
+    "127.0.0.1:9944": (200.0, 400),
+    "mainnet3.creditcoin.network": (25.0, 50),
+    "rpc.cc3-testnet.creditcoin.network": (25.0, 50),
+    "creditcoin.blockscout.com": (10.0, 20),
+    "creditcoin-testnet.blockscout.com": (10.0, 20),
+}
+RATE_LIMIT_DEFAULT = (25.0, 50)  # RATE_LIMITS에 없는 엔드포인트
+
+RETRY_MAX_ATTEMPTS = 5  # 작업 단위당 최대 시도 횟수
+RETRY_BACKOFF_BASE = 0.5  # 지수 backoff 기본 대기 시간 (초)
+RETRY_BACKOFF_CAP = 30.0  # backoff 최대 대기 시간 (초)
+RETRY_BUDGET_MIN = 20  # 항상 허용하는 재시도 횟수
+RETRY_BUDGET_RATIO = 0.2  # 전체 요청 수 대비 추가로 허용하는 재시도 비율
+
+# =============================================================================
+# Snapshot & Diff
+# =============================================================================
+
+SNAPSHOT_DIR = ".snapshots"  # 네트워크별 마지막 스캔 스냅샷 ({network}.snap 또는 {network}.json) 저장 위치
+# 기본 스냅샷 형식: "mapped" (.snap, 고정 길이 레코드 바이너리 - mmap으로 바로 조회) 또는 "json" (compact JSON)
+SNAPSHOT_FORMAT = "mapped"
+DIFF_DEADLINE_WINDOW = 7 * 24 * 3600  # --diff에서 마감 임박으로 보고할 남은 시간 (초)
+
+# =============================================================================
+# Scan Checkpoint (--resume)
+# =============================================================================
+
+CHECKPOINT_DIR = ".checkpoints"  # 진행 중인 스캔의 checkpoint ({network}.jsonl) 위치, 스캔이 끝나면 삭제
+CHECKPOINT_BATCH_SIZE = 200  # 완료한 조회를 이만큼 모아서 한 번에 기록
+CHECKPOINT_INTERVAL = 5.0  # 모인 기록이 적어도 이 시간(초)이 지나면 기록
+
+# =============================================================================
+# Event Store & Analytics
+# =============================================================================
+
+EVENT_STORE_DIR = ".events"  # 네트워크별 RewardsAdded/Claimed 이벤트 저장소 ({network}.json) 위치
+EVENT_START_BLOCK = 0  # 처음 수집할 때의 시작 블록
+EVENT_LOG_BLOCK_RANGE = 50000  # eth_getLogs 요청 하나가 조회하는 블록 수
+# 확정 깊이: 최신 블록에서 이만큼 이내의 블록은 reorg될 수 있다고 보고 블록 해시를 보관해
+# 다음 수집 때 검사합니다 (더 깊은 블록은 확정으로 간주)
+EVENT_CONFIRMATIONS = 64
+ANALYTICS_TOP_CLAIMANTS = 10  # analytics.py에서 보여줄 상위 수령 지갑 수
+
+# =============================================================================
+# Contract Discovery
+# =============================================================================
+
+CONTRACT_REGISTRY_DIR = ".contracts"  # 네트워크별 자동 발견 컨트랙트 registry ({network}.json) 위치
+DISCOVERY_START_BLOCK = 0  # 처음 발견할 때의 시작 블록
+DISCOVERY_BLOCK_RANGE = 10000  # 주소 필터 없는 eth_getLogs 요청 하나가 조회하는 블록 수
+DISCOVERY_WORKERS = 4  # 동시에 조회하는 블록 구간 수
+
+# =============================================================================
+# Campaign Discovery (Blockscout + RPC logs)
+# =============================================================================
+
+# 캠페인 발견 소스: "hybrid" (Blockscout와 RPC 로그를 함께 조회해 합치고 교차 검증), "blockscout", "rpc"
+CAMPAIGN_DISCOVERY_SOURCE = "hybrid"
+CAMPAIGN_LOG_START_BLOCK = 0  # RPC 로그로 캠페인을 찾을 때의 시작 블록
+# hybrid: 필요한 구간을 확보한 뒤 교차 검증을 위해 느린 소스를 더 기다리는 최대 시간 (초)
+# 0이면 기다리지 않고 그때까지 두 소스가 함께 조회한 구간만 교차 검증 (--crosscheck-wait로 변경)
+CAMPAIGN_CROSSCHECK_WAIT = 0.0
+
+# =============================================================================
+# Deadline-aware Refresh (--watch)
+# =============================================================================
+
+# 미수령 리워드의 재조회 간격: (마감까지 남은 시간 이하, 재조회 간격) - 초 단위, 짧은 구간부터
+# 수령 완료 / 마감 지남 / 회수된 캠페인은 다시 조회하지 않음
+REFRESH_INTERVALS = [
+    (3600, 60),  # 마감 1시간 이내: 1분
+    (24 * 3600, 300),  # 마감 1일 이내: 5분
+    (7 * 24 * 3600, 1800),  # 마감 7일 이내: 30분
+]
+REFRESH_DEFAULT_INTERVAL = 6 * 3600  # 마감이 더 멀거나 마감이 없는 미수령 리워드
+REFRESH_NO_REWARD_INTERVAL = 3600  # 리워드가 없는 (지갑, 캠페인) - 나중에 추가될 수 있음
+
+# =============================================================================
+# Query Server (query_server.py)
+# =============================================================================
+
+QUERY_SERVER_PORT = 8787  # HTTP/JSON 조회 포트
+QUERY_REFRESH_INTERVAL = 600  # 백그라운드 재스캔 주기 (초) - 마감 임박 항목은 재조회 시각에 맞춰 더 빨리 스캔
+
 # =============================================================================
 # Blockscout API URLs
 # =============================================================================
@@ -36,6 +152,7 @@ BLOCKSCOUT_API_URLS = {
 # =============================================================================
 
 # Mainnet에 3개의 RedeemableAirdrop 컨트랙트가 존재
+# (이후 배포된 컨트랙트는 --discover-contracts로 발견해 CONTRACT_REGISTRY_DIR에 저장)
 MAINNET_CONTRACTS = [
     "0xe272c3fb6d4ccf5A8bca94465f58b9c09f497Cd6",
     "0x44D61789e4e6d2e06be032bD63fB2E86503B53A1",
@@ -63,6 +180,10 @@ KNOWN_TOKENS = {
     "spacecoin_testnet": "0xfaFAd008f017C326B62FbfddA7fb2335A5c82247",
 }
 
+DEFAULT_TOKEN_DECIMALS = 18  # decimals() 조회가 안 되는 토큰의 소수 자릿수
+AMOUNT_TOTAL_DECIMALS = 18  # 여러 토큰 리워드 합계(정수)의 소수 자릿수
+AMOUNT_DISPLAY_PLACES = 4  # 금액 출력 시 소수점 자릿수
+
 # =============================================================================
 # Known Campaign Names (for legacy lookup and hash matching)
 # =============================================================================
@@ -219,3 +340,23 @@ REDEEMABLE_AIRDROP_ABI = [
         "type": "event",
     },
 ]
+
+# ERC-20 토큰 조회용 (decimals는 토큰마다 한 번만, balanceOf는 --reconcile에서 batch로 조회)
+ERC20_ABI = [
+    # decimals() -> uint8
+    {
+        "inputs": [],
+        "name": "decimals",
+        "outputs": [{"internalType": "uint8", "name": "", "type": "uint8"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    # balanceOf(address account) -> uint256
+    {
+        "inputs": [{"internalType": "address", "name": "account", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
@@ -0,0 +1,363 @@
+"""
+Sharded Scan
+
+(컨트랙트, 캠페인, 지갑) 조회를 지갑 주소 해시로 나누어 여러 프로세스나 여러 머신에서 실행하고,
+결과를 합쳐 단일 프로세스 스캔과 같은 합계의 리포트 하나로 출력합니다.
+
+- coordinator가 캠페인을 한 번만 발견해 샤드 계획(ShardPlan)을 만들고, worker는 자기 샤드의 지갑만 조회합니다.
+- worker마다 AirdropMonitor(연결 풀, 요청 스케줄러, 재시도 예산)가 따로 있습니다.
+- 로컬: main.py --workers N (프로세스 N개)
+- 여러 머신: 계획/결과를 JSON 파일로 주고받습니다 (파일 기반 queue)
+
+    python sharding.py plan --network mainnet --shards 4 --output plan.json
+    python sharding.py worker --plan plan.json --shard 0 --output shard-0.json   # 머신마다 하나씩
+    python sharding.py merge --plan plan.json shard-*.json
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from pathlib import Path
+from typing import NamedTuple
+
+from amounts import TOKEN_DECIMALS
+from campaign_discovery import DISCOVERY_SOURCE_LABELS, DISCOVERY_SOURCES, describe_discovery
+from main import (
+    AirdropMonitor,
+    CampaignInfo,
+    RewardInfo,
+    RewardLookup,
+    ScanReport,
+    TextReport,
+    get_wallets,
+)
+from mapped_snapshot import MappedSnapshot
+from request_scheduler import DeadLetter
+from scan_result import ScanResult, normalize_campaign_hash
+from settings import (
+    CAMPAIGN_DISCOVERY_SOURCE,
+    DEFAULT_NETWORK,
+    DEFAULT_TOKEN_DECIMALS,
+    DEFAULT_WALLETS_FILE,
+    KNOWN_CAMPAIGN_NAMES,
+    RPC_URLS,
+)
+from snapshot import Snapshot, default_snapshot_path
+
+SHARD_FORMAT_VERSION = 1
+
+
+def shard_of(address: str, shard_count: int) -> int:
+    """지갑 주소의 샤드 번호 (프로세스/머신이 달라도 같은 값)"""
+    digest = hashlib.sha256(address.lower().encode()).digest()
+    return int.from_bytes(digest[:8], "big") % shard_count
+
+
+def shard_wallets(wallets: dict[str, str], index: int, shard_count: int) -> dict[str, str]:
+    """index번 샤드에 속한 {지갑 이름: 주소}"""
+    return {name: addr for name, addr in wallets.items() if shard_of(addr, shard_count) == index}
+
+
+class ShardPlan(NamedTuple):
+    """worker가 같은 조건으로 조회하도록 coordinator가 정한 스캔 계획"""
+
+    network: str
+    rpc_urls: list[str] | None
+    contract_addresses: list[str]
+    blockscout_api_url: str
+    latest_block: int | None
+    campaigns: list[dict]  # coordinator가 발견한 캠페인
+    shard_count: int
+    snapshot_path: str | None = None  # worker가 읽을 이전 스냅샷 (파일 모드)
+
+    def save(self, path: str | Path) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"version": SHARD_FORMAT_VERSION, **self._asdict()}, f, indent=2)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ShardPlan":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.pop("version", None) != SHARD_FORMAT_VERSION:
+            raise ValueError(f"Unsupported shard plan format: {path}")
+        return cls(**data)
+
+
+def create_plan(monitor: AirdropMonitor, shard_count: int, latest_block: int | None = None) -> ShardPlan:
+    """캠페인을 발견하고 샤드 계획 생성"""
+    return ShardPlan(
+        network=monitor.network,
+        rpc_urls=monitor.rpc_urls,
+        contract_addresses=monitor.contract_addresses,
+        blockscout_api_url=monitor.blockscout_api_url,
+        latest_block=latest_block,
+        campaigns=monitor.discover_campaigns(latest_block),
+        shard_count=shard_count,
+    )
+
+
+# =============================================================================
+# Worker
+# =============================================================================
+
+
+def scan_shard(
+    plan: ShardPlan, index: int, wallets: dict[str, str], previous: Snapshot | None = None
+) -> dict:
+    """index번 샤드 스캔 (worker 프로세스에서 실행, JSON으로 저장할 수 있는 결과 반환)"""
+    monitor = AirdropMonitor(
+        network=plan.network,
+        rpc_urls=plan.rpc_urls,
+        contract_addresses=plan.contract_addresses,
+        blockscout_api_url=plan.blockscout_api_url,
+    )
+    if previous is None and plan.snapshot_path:
+        previous = Snapshot.load(plan.snapshot_path)
+    result = monitor.scan(
+        shard_wallets(wallets, index, plan.shard_count),
+        latest_block=plan.latest_block,
+        previous=previous,
+        campaigns=plan.campaigns,
+    )
+    return {
+        "version": SHARD_FORMAT_VERSION,
+        "shard": index,
+        "rewards": [reward for _, rewards in result.campaigns_with_rewards for reward in rewards],
+        "known_name_campaigns": result.known_name_campaigns,
+        "known_name_rewards": result.known_name_rewards,
+        "failed": result.failed,
+        "reused_rewards": result.reused_rewards,
+    }
+
+
+# =============================================================================
+# Merge
+# =============================================================================
+
+
+def merge_shards(plan: ShardPlan, wallets: dict[str, str], shards: list[dict]) -> ScanResult:
+    """샤드 결과를 ScanResult 하나로 합치기
+
+    리워드는 단일 프로세스 스캔과 같은 순서(캠페인, 컨트랙트, 지갑)로 다시 추가하므로
+    합계와 리포트 순서가 단일 프로세스 스캔과 같습니다. 같은 샤드가 두 번 들어오면 한 번만 반영합니다.
+
+    Raises:
+        ValueError: 형식이 다르거나 계획에 없는 샤드가 있거나, 빠진 샤드가 있을 때 (합계가 모자라지 않도록)
+    """
+    indices = {shard.get("shard") for shard in shards}
+    invalid = sorted(str(i) for i in indices if not isinstance(i, int) or not 0 <= i < plan.shard_count)
+    if invalid:
+        raise ValueError(f"Shard index out of range 0..{plan.shard_count - 1}: {', '.join(invalid)}")
+    missing = sorted(set(range(plan.shard_count)) - indices)
+    if missing:
+        raise ValueError(f"Missing shard result(s): {', '.join(map(str, missing))}")
+    result = ScanResult(plan.network, wallets, plan.contract_addresses, plan.latest_block)
+    result.campaigns = plan.campaigns
+    contract_order = {addr: i for i, addr in enumerate(plan.contract_addresses)}
+    wallet_order = {name: i for i, name in enumerate(wallets)}
+
+    by_campaign: dict[str, list[dict]] = {}
+    known_campaigns: dict[tuple[str, str], tuple] = {}
+    seen_shards = set()
+    for shard in shards:
+        if shard.get("version") != SHARD_FORMAT_VERSION:
+            raise ValueError(f"Unsupported shard result format: shard {shard.get('shard')}")
+        if shard["shard"] in seen_shards:
+            continue
+        seen_shards.add(shard["shard"])
+        for reward in shard["rewards"]:
+            by_campaign.setdefault(normalize_campaign_hash(reward["campaign_hash"]), []).append(reward)
+        for contract_addr, campaign_name, campaign_info, decimals in shard["known_name_campaigns"]:
+            known_campaigns.setdefault(
+                (contract_addr, campaign_name), (contract_addr, campaign_name, CampaignInfo(*campaign_info), decimals)
+            )
+        result.known_name_rewards.extend(
+            (RewardLookup(*unit), RewardInfo(*reward_info)) for unit, reward_info in shard["known_name_rewards"]
+        )
+        result.failed.extend(
+            DeadLetter(RewardLookup(*unit) if len(unit) == len(RewardLookup._fields) else tuple(unit), error, attempts)
+            for unit, error, attempts in shard["failed"]
+        )
+        result.reused_rewards += shard["reused_rewards"]
+
+    for campaign in plan.campaigns:
+        rewards = by_campaign.pop(normalize_campaign_hash(campaign["campaign_hash"]), [])
+        rewards.sort(key=lambda r: (contract_order.get(r["contract_address"], 0), wallet_order.get(r["wallet_name"], 0)))
+        for reward in rewards:
+            TOKEN_DECIMALS.set(campaign["token"], reward["decimals"])
+            result.add_reward(campaign, reward)
+
+    # 이름 기반 캠페인도 단일 프로세스 스캔 순서 (컨트랙트, KNOWN_CAMPAIGN_NAMES)
+    known_order = {
+        key: i for i, key in enumerate(product(plan.contract_addresses, KNOWN_CAMPAIGN_NAMES))
+    }
+    result.known_name_campaigns = sorted(known_campaigns.values(), key=lambda k: known_order.get(k[:2], 0))
+    for _, _, campaign_info, decimals in result.known_name_campaigns:
+        TOKEN_DECIMALS.set(campaign_info.token, decimals)
+    result.known_name_rewards.sort(key=lambda item: (
+        known_order.get((item[0].contract_address, item[0].campaign), 0),
+        wallet_order.get(item[0].wallet_name, 0),
+    ))
+    return result
+
+
+def report_result(report: ScanReport, result: ScanResult) -> None:
+    """합친 결과를 단일 프로세스 스캔과 같은 순서의 리포트 이벤트로 전달 (캠페인 발견 이후)"""
+    if result.campaigns:
+        report.status(f"\nFound {len(result.campaigns)} campaign(s). Checking for rewards...")
+        for campaign, rewards in result.campaigns_with_rewards:
+            report.campaign_rewards(campaign, rewards)
+        if result.reused_rewards:
+            report.status(f"  ({result.reused_rewards} claimed reward(s) reused from the previous snapshot)")
+        report.discovery_done(result)
+    else:
+        report.status("\nNo campaigns discovered yet.")
+
+    report.section("Checking Known Campaign Names (All Contracts)...")
+    rewards_by_campaign: dict[tuple[str, str], list] = {}
+    for unit, reward_info in result.known_name_rewards:
+        rewards_by_campaign.setdefault((unit.contract_address, unit.campaign), []).append((unit, reward_info))
+    for contract_addr, campaign_name, campaign_info, decimals in result.known_name_campaigns:
+        report.known_name_campaign(contract_addr, campaign_name, campaign_info)
+        for unit, reward_info in rewards_by_campaign.pop((contract_addr, campaign_name), []):
+            report.known_name_reward(unit, reward_info, decimals)
+    if not result.known_name_campaigns:
+        report.status("\nNo active campaigns found with known names.")
+    # 캠페인 정보 조회는 실패했지만 재시도로 복구된 이름 기반 리워드
+    for rewards in rewards_by_campaign.values():
+        for unit, reward_info in rewards:
+            report.recovered_reward(unit, reward_info, DEFAULT_TOKEN_DECIMALS)
+
+    if result.failed:
+        report.failed_lookups(result.failed)
+
+
+def scan_sharded(
+    monitor: AirdropMonitor,
+    wallets: dict[str, str],
+    workers: int,
+    report: ScanReport | None = None,
+    latest_block: int | None = None,
+    previous: Snapshot | None = None,
+) -> ScanResult:
+    """로컬 worker 프로세스 workers개로 나누어 스캔하고 결과를 합치기 (AirdropMonitor.scan 대체)"""
+    report = report or ScanReport()
+    started = time.monotonic()
+    source = monitor.discovery_source
+    report.section(f"Discovering Campaigns via {DISCOVERY_SOURCE_LABELS[source]}...")
+    if source != "rpc":
+        report.status(f"Blockscout API: {monitor.blockscout_api_url}")
+    with monitor.profiler.span("scan.discovery"):
+        plan = create_plan(monitor, workers, latest_block)
+    if source == "hybrid":
+        for line in describe_discovery(monitor.discovery_stats):
+            report.status(line)
+
+    if isinstance(previous, MappedSnapshot) and previous.path is not None:
+        # mmap으로 연 스냅샷은 pickle할 수 없으므로 worker가 같은 파일을 직접 열도록 경로만 전달
+        plan = plan._replace(snapshot_path=str(previous.path))
+        previous = None
+
+    report.status(f"\nScanning {len(wallets)} wallet(s) in {workers} shard(s)...")
+    # worker마다 새 인터프리터 (coordinator의 스레드/연결 상태를 fork하지 않음)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = [executor.submit(scan_shard, plan, index, wallets, previous) for index in range(workers)]
+        shards = [future.result() for future in futures]
+
+    result = merge_shards(plan, wallets, shards)
+    report_result(report, result)
+    result.duration = time.monotonic() - started
+    return result
+
+
+# =============================================================================
+# CLI (여러 머신: 파일 기반 계획/결과)
+# =============================================================================
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Sharded airdrop scan across machines")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    plan = subparsers.add_parser("plan", help="Discover campaigns once and write a shard plan")
+    plan.add_argument("--network", "-n", choices=list(RPC_URLS.keys()), default=DEFAULT_NETWORK)
+    plan.add_argument("--rpc-url", action="append", dest="rpc_urls", help="RPC endpoint URL (repeatable)")
+    plan.add_argument("--shards", type=int, required=True, help="Number of shards")
+    plan.add_argument(
+        "--discovery-source",
+        choices=DISCOVERY_SOURCES,
+        default=CAMPAIGN_DISCOVERY_SOURCE,
+        help=f"Where to discover campaigns (default: {CAMPAIGN_DISCOVERY_SOURCE})",
+    )
+    plan.add_argument(
+        "--snapshot-file",
+        help=f"Previous snapshot the workers reuse claimed rewards from (default: {default_snapshot_path('<network>')} if present)",
+    )
+    plan.add_argument("--output", "-o", required=True, help="Shard plan file to write")
+
+    worker = subparsers.add_parser("worker", help="Scan one shard of the wallets")
+    worker.add_argument("--plan", required=True, help="Shard plan file")
+    worker.add_argument("--shard", type=int, required=True, help="Shard index (0-based)")
+    worker.add_argument("--wallets", "-w", default=DEFAULT_WALLETS_FILE, help="Wallets JSON file")
+    worker.add_argument("--output", "-o", required=True, help="Shard result file to write")
+
+    merge = subparsers.add_parser("merge", help="Merge shard results into one report")
+    merge.add_argument("--plan", required=True, help="Shard plan file")
+    merge.add_argument("--wallets", "-w", default=DEFAULT_WALLETS_FILE, help="Wallets JSON file")
+    merge.add_argument("results", nargs="+", help="Shard result files")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if args.command == "plan":
+        if args.shards < 1:
+            sys.exit("--shards must be at least 1")
+        monitor = AirdropMonitor(network=args.network, rpc_urls=args.rpc_urls)
+        monitor.discovery_source = args.discovery_source
+        latest_block = monitor.scheduler.call(monitor.block_number)
+        plan = create_plan(monitor, args.shards, latest_block)
+        snapshot_path = args.snapshot_file or default_snapshot_path(args.network)
+        if args.snapshot_file or Path(snapshot_path).exists():
+            plan = plan._replace(snapshot_path=str(snapshot_path))
+        plan.save(args.output)
+        print(f"Wrote plan for {len(plan.campaigns)} campaign(s) in {plan.shard_count} shard(s) to {args.output}")
+        return
+
+    plan = ShardPlan.load(args.plan)
+    wallets = get_wallets(argparse.Namespace(address=None, name=None, wallets=args.wallets))
+
+    if args.command == "worker":
+        if not 0 <= args.shard < plan.shard_count:
+            sys.exit(f"--shard must be between 0 and {plan.shard_count - 1}")
+        shard = scan_shard(plan, args.shard, wallets)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(shard, f)
+        print(f"Shard {args.shard}: {len(shard['rewards'])} reward(s), {len(shard['failed'])} failed lookup(s)")
+        return
+
+    shards = []
+    for path in args.results:
+        with open(path, encoding="utf-8") as f:
+            shards.append(json.load(f))
+    try:
+        result = merge_shards(plan, wallets, shards)
+    except ValueError as e:
+        sys.exit(str(e))
+    report = TextReport()
+    report_result(report, result)
+    report.section("Summary")
+    report.summary(AirdropMonitor(network=plan.network, rpc_urls=plan.rpc_urls,
+                                  contract_addresses=plan.contract_addresses,
+                                  blockscout_api_url=plan.blockscout_api_url), result)
+
+
+if __name__ == "__main__":
+    main()
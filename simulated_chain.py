@@ -0,0 +1,534 @@
+"""
+Simulated RedeemableAirdrop Chain
+
+벤치마크용 로컬 대체 환경입니다. 합성 데이터(컨트랙트, 캠페인, 지갑, 로그 수)로 채운
+가짜 JSON-RPC 서버와 가짜 Blockscout `/addresses/{addr}/logs`, `/main-page/blocks` API를 제공합니다.
+REDEEMABLE_AIRDROP_ABI의 조회 함수와 토큰 decimals()/balanceOf()(eth_call), RewardsAdded/Claimed 이벤트(eth_getLogs)를
+지원하며 (블록 timestamp용 eth_getBlockByNumber 포함), 요청별 지연시간과 실패율을 주입할 수 있습니다.
+SimulatedChain.reorg()로 최근 블록을 교체하는 chain reorg를, SimConfig.blockscout_lag로
+인덱싱이 늦은 Blockscout를 재현할 수 있습니다.
+"""
+
+import json
+import multiprocessing
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, NamedTuple
+from urllib.parse import parse_qs, urlsplit
+
+from eth_abi import decode, encode
+from eth_utils import keccak, to_checksum_address
+
+from settings import DEFAULT_TOKEN_DECIMALS, REDEEMABLE_AIRDROP_ABI
+
+ZERO_ADDRESS = "0x" + "00" * 20
+BLOCKSCOUT_PAGE_SIZE = 50
+GENESIS_TIME = 1_700_000_000  # 블록 0의 timestamp
+BLOCK_TIME = 3600  # 블록 간격 (초), 로그 하나가 블록 하나를 차지
+
+
+def _selector(signature: str) -> bytes:
+    return keccak(text=signature)[:4]
+
+
+def _abi_signature(item: dict) -> str:
+    return f"{item['name']}({','.join(i['type'] for i in item['inputs'])})"
+
+
+_ABI = {item["name"]: item for item in REDEEMABLE_AIRDROP_ABI}
+_FUNCTIONS = {
+    _selector(_abi_signature(item)): item
+    for item in REDEEMABLE_AIRDROP_ABI
+    if item["type"] == "function"
+}
+DECIMALS_SELECTOR = _selector("decimals()")
+BALANCE_OF_SELECTOR = _selector("balanceOf(address)")
+REWARDS_ADDED_TOPIC = "0x" + keccak(text=_abi_signature(_ABI["RewardsAdded"])).hex()
+CLAIMED_TOPIC = "0x" + keccak(text=_abi_signature(_ABI["Claimed"])).hex()
+FILLER_TOPIC = "0x" + keccak(text="RewardsUpdated(bytes32,address,uint120)").hex()
+
+_EVENT_SIGNATURES = {
+    REWARDS_ADDED_TOPIC: (
+        "RewardsAdded(bytes32 indexed campaignNameHash, address indexed token, uint64 startDate, uint64 deadline)"
+    ),
+    CLAIMED_TOPIC: (
+        "Claimed(address indexed user, bytes32 indexed campaignNameHash, uint120 totalReward, uint256 fee)"
+    ),
+    FILLER_TOPIC: "RewardsUpdated(bytes32 indexed campaignNameHash, address indexed user, uint120 totalReward)",
+}
+
+
+class SimConfig(NamedTuple):
+    """합성 데이터 규모 및 주입할 지연시간/실패율"""
+
+    contracts: int = 3
+    campaigns: int = 5  # 컨트랙트당 캠페인 수
+    wallets: int = 10
+    reward_probability: float = 0.3  # (캠페인, 지갑)에 리워드가 있을 확률
+    claimed_probability: float = 0.4  # 리워드 중 수령 완료 비율
+    filler_logs: int = 0  # 컨트랙트당 추가 로그 수 (Blockscout 페이지 수 조절용)
+    rpc_latency: float = 0.0  # RPC 요청당 지연 (초)
+    blockscout_latency: float = 0.0  # Blockscout 페이지당 지연 (초)
+    failure_rate: float = 0.0  # HTTP 503을 반환할 확률
+    blockscout_lag: int = 0  # Blockscout 인덱싱이 최신 블록보다 늦은 블록 수
+    seed: int = 1
+
+
+def _address(rnd: random.Random) -> str:
+    return to_checksum_address(bytes(rnd.getrandbits(8) for _ in range(20)))
+
+
+class SimulatedChain:
+    """합성 RedeemableAirdrop 상태와 이벤트 로그"""
+
+    def __init__(self, config: SimConfig):
+        self.config = config
+        rnd = random.Random(config.seed)
+        self.token = _address(rnd)
+        self.contract_addresses = [_address(rnd) for _ in range(config.contracts)]
+        self.wallets = {f"wallet{i}": _address(rnd) for i in range(config.wallets)}
+        self.campaigns: dict[str, dict[bytes, dict]] = {}
+        self.logs: list[dict] = []  # RPC 형식 로그 (블록 순)
+        self.head = 1
+        self.forks: list[int] = []  # reorg()마다 갈라진 첫 블록
+
+        for ci, contract in enumerate(self.contract_addresses):
+            self.campaigns[contract.lower()] = {}
+            for k in range(config.campaigns):
+                self.add_campaign(contract, f"Sim Campaign {ci}-{k}", rnd)
+
+            for _ in range(config.filler_logs):
+                self._add_log(contract, [FILLER_TOPIC, "0x" + "00" * 32, "0x" + "00" * 32], encode(["uint120"], [0]))
+
+    def add_campaign(self, contract: str, name: str, rnd: random.Random | None = None) -> bytes:
+        """캠페인과 RewardsAdded/Claimed 로그를 새 블록에 추가하고 캠페인 해시 반환"""
+        config = self.config
+        rnd = rnd or random.Random(name)
+        campaign_hash = keccak(text=name)
+        rewards = {}
+        for wallet in self.wallets.values():
+            if rnd.random() < config.reward_probability:
+                total = rnd.randrange(10**18, 10**24)
+                rewards[wallet.lower()] = (
+                    total,
+                    total // 10,
+                    rnd.random() < config.claimed_probability,
+                    False,
+                )
+        claimed_total = sum(r[0] for r in rewards.values() if r[2])
+        campaign = self.campaigns[contract.lower()][campaign_hash] = {
+            "name": name,
+            "token": self.token,
+            "start_date": 1_700_000_000,
+            "deadline": 1_900_000_000 + rnd.randrange(0, 10**7),
+            "reclaimed": False,
+            "total_amount": sum(r[0] for r in rewards.values()),
+            "total_claimed": claimed_total,
+            "rewards": rewards,
+        }
+        self._add_log(contract, [
+            REWARDS_ADDED_TOPIC,
+            "0x" + campaign_hash.hex(),
+            "0x" + "00" * 12 + self.token[2:].lower(),
+        ], encode(["uint64", "uint64"], [1_700_000_000, campaign["deadline"]]))
+
+        for wallet, (total, _, claimed, _) in rewards.items():
+            if claimed:
+                self._add_log(contract, [
+                    CLAIMED_TOPIC,
+                    "0x" + "00" * 12 + wallet[2:],
+                    "0x" + campaign_hash.hex(),
+                ], encode(["uint120", "uint256"], [total, total // 100]))
+        return campaign_hash
+
+    def _add_log(self, contract: str, topics: list[str], data: bytes) -> None:
+        self.head += 1
+        self.logs.append({
+            "address": contract.lower(),
+            "topics": topics,
+            "data": "0x" + data.hex(),
+            "blockNumber": hex(self.head),
+            "blockHash": self.block_hash(self.head),
+            "transactionHash": "0x" + keccak(b"tx" + self.head.to_bytes(32, "big")).hex(),
+            "transactionIndex": "0x0",
+            "logIndex": "0x0",
+            "removed": False,
+        })
+
+    def block_hash(self, number: int) -> str:
+        """블록 해시 (해당 블록을 교체한 reorg 횟수가 다르면 달라짐)"""
+        forks = sum(1 for fork_block in self.forks if fork_block <= number)
+        return "0x" + keccak(number.to_bytes(32, "big") + forks.to_bytes(4, "big")).hex()
+
+    def reorg(self, depth: int) -> int:
+        """최근 depth개 블록을 새 블록으로 교체하고 갈라진 첫 블록 반환
+
+        교체된 구간의 Claimed 로그는 사라지고 해당 리워드는 수령 전 상태로 돌아갑니다.
+        """
+        fork_block = max(self.head - depth + 1, 1)
+        self.forks.append(fork_block)
+        kept = []
+        for log in self.logs:
+            block = int(log["blockNumber"], 16)
+            if block >= fork_block:
+                if log["topics"][0] == CLAIMED_TOPIC:
+                    campaign = self.campaigns[log["address"]][bytes.fromhex(log["topics"][2][2:])]
+                    wallet = "0x" + log["topics"][1][-40:]
+                    total, fee, _, verification = campaign["rewards"][wallet]
+                    campaign["rewards"][wallet] = (total, fee, False, verification)
+                    campaign["total_claimed"] -= total
+                    continue
+                log["blockHash"] = self.block_hash(block)
+            kept.append(log)
+        self.logs = kept
+        return fork_block
+
+    def balance_of(self, wallet: str) -> int:
+        """토큰 잔액 (수령한 리워드에서 Claimed 이벤트의 fee를 뺀 합계)"""
+        wallet = wallet.lower()
+        return sum(
+            total - total // 100
+            for campaigns in self.campaigns.values()
+            for campaign in campaigns.values()
+            for reward_wallet, (total, _, claimed, _) in campaign["rewards"].items()
+            if claimed and reward_wallet == wallet
+        )
+
+    # =========================================================================
+    # eth_call
+    # =========================================================================
+
+    def call(self, to: str, data: str) -> bytes:
+        raw = bytes.fromhex(data.removeprefix("0x"))
+        if to.lower() == self.token.lower() and raw[:4] == DECIMALS_SELECTOR:
+            return encode(["uint8"], [DEFAULT_TOKEN_DECIMALS])
+        if to.lower() == self.token.lower() and raw[:4] == BALANCE_OF_SELECTOR:
+            return encode(["uint256"], [self.balance_of(decode(["address"], raw[4:])[0])])
+        item = _FUNCTIONS.get(raw[:4])
+        if item is None:
+            raise ValueError("execution reverted")
+        args = decode([i["type"] for i in item["inputs"]], raw[4:])
+        campaigns = self.campaigns.get(to.lower(), {})
+        name = item["name"]
+        output_types = [o["type"] for o in item["outputs"]]
+
+        if name in ("rewardInfoByHash", "rewardInfo"):
+            campaign_hash = args[0] if name == "rewardInfoByHash" else keccak(text=args[0])
+            campaign = campaigns.get(campaign_hash, {})
+            reward = campaign.get("rewards", {}).get(args[1].lower(), (0, 0, False, False))
+            return encode(output_types, list(reward))
+
+        if name in ("campaignInfoByHash", "campaignInfo"):
+            campaign_hash = args[0] if name == "campaignInfoByHash" else keccak(text=args[0])
+            c = campaigns.get(campaign_hash)
+            if c is None:
+                return encode(output_types, [ZERO_ADDRESS, 0, 0, False, 0, 0])
+            return encode(output_types, [
+                c["token"], c["start_date"], c["deadline"], c["reclaimed"],
+                c["total_amount"], c["total_claimed"],
+            ])
+
+        if name == "tokenCampaigns":
+            hashes = [h for h, c in campaigns.items() if c["token"].lower() == args[0].lower()]
+            return encode(output_types, [hashes])
+
+        if name == "allRewardInfo":
+            token, wallet = args[0].lower(), args[1].lower()
+            columns: list[list] = [[], [], [], [], []]
+            for campaign_hash, c in campaigns.items():
+                if c["token"].lower() != token:
+                    continue
+                reward = c["rewards"].get(wallet, (0, 0, False, False))
+                columns[0].append(campaign_hash)
+                for i, value in enumerate(reward):
+                    columns[i + 1].append(value)
+            return encode(output_types, columns)
+
+        raise ValueError("execution reverted")
+
+    # =========================================================================
+    # eth_getLogs / Blockscout
+    # =========================================================================
+
+    def get_logs(self, flt: dict) -> list[dict]:
+        from_block = _block_param(flt.get("fromBlock", "0x0"), self.head)
+        to_block = _block_param(flt.get("toBlock", "latest"), self.head)
+        addresses = flt.get("address")
+        if isinstance(addresses, str):
+            addresses = [addresses]
+        addresses = {a.lower() for a in addresses} if addresses else None
+        topics = flt.get("topics") or []
+
+        result = []
+        for log in self.logs:
+            block = int(log["blockNumber"], 16)
+            if block < from_block or block > to_block:
+                continue
+            if addresses is not None and log["address"] not in addresses:
+                continue
+            if not _topics_match(log["topics"], topics):
+                continue
+            result.append(log)
+        return result
+
+    def get_block(self, number: int) -> dict | None:
+        """eth_getBlockByNumber 응답 (트랜잭션 제외)"""
+        if number > self.head:
+            return None
+        return {
+            "number": hex(number),
+            "hash": self.block_hash(number),
+            "timestamp": hex(GENESIS_TIME + number * BLOCK_TIME),
+        }
+
+    @property
+    def blockscout_block(self) -> int:
+        """Blockscout가 인덱싱한 마지막 블록"""
+        return max(self.head - self.config.blockscout_lag, 0)
+
+    def blockscout_logs(self, address: str, offset: int) -> dict:
+        """Blockscout v2 형식 로그 페이지 (최신 블록부터, 인덱싱한 블록까지)"""
+        indexed = self.blockscout_block
+        logs = [
+            log for log in reversed(self.logs)
+            if log["address"] == address.lower() and int(log["blockNumber"], 16) <= indexed
+        ]
+        page = logs[offset:offset + BLOCKSCOUT_PAGE_SIZE]
+        items = [_blockscout_item(log) for log in page]
+        next_page_params = None
+        if offset + BLOCKSCOUT_PAGE_SIZE < len(logs):
+            last = page[-1]
+            next_page_params = {
+                "block_number": int(last["blockNumber"], 16),
+                "index": 0,
+                "items_count": offset + BLOCKSCOUT_PAGE_SIZE,
+            }
+        return {"items": items, "next_page_params": next_page_params}
+
+
+def _block_param(value: Any, head: int) -> int:
+    if value in ("latest", "safe", "finalized", "pending", None):
+        return head
+    if value == "earliest":
+        return 0
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+def _topics_match(log_topics: list[str], filter_topics: list) -> bool:
+    for i, wanted in enumerate(filter_topics):
+        if wanted is None:
+            continue
+        if i >= len(log_topics):
+            return False
+        options = wanted if isinstance(wanted, list) else [wanted]
+        if log_topics[i].lower() not in {o.lower() for o in options}:
+            return False
+    return True
+
+
+def _blockscout_item(log: dict) -> dict:
+    topic0 = log["topics"][0]
+    data = bytes.fromhex(log["data"][2:])
+    if topic0 == REWARDS_ADDED_TOPIC:
+        start_date, deadline = decode(["uint64", "uint64"], data)
+        parameters = [
+            {"name": "campaignNameHash", "type": "bytes32", "indexed": True, "value": log["topics"][1]},
+            {"name": "token", "type": "address", "indexed": True,
+             "value": to_checksum_address("0x" + log["topics"][2][-40:])},
+            {"name": "startDate", "type": "uint64", "indexed": False, "value": str(start_date)},
+            {"name": "deadline", "type": "uint64", "indexed": False, "value": str(deadline)},
+        ]
+    elif topic0 == CLAIMED_TOPIC:
+        total_reward, fee = decode(["uint120", "uint256"], data)
+        parameters = [
+            {"name": "user", "type": "address", "indexed": True,
+             "value": to_checksum_address("0x" + log["topics"][1][-40:])},
+            {"name": "campaignNameHash", "type": "bytes32", "indexed": True, "value": log["topics"][2]},
+            {"name": "totalReward", "type": "uint120", "indexed": False, "value": str(total_reward)},
+            {"name": "fee", "type": "uint256", "indexed": False, "value": str(fee)},
+        ]
+    else:
+        parameters = []
+    return {
+        "address": {"hash": to_checksum_address(log["address"])},
+        "block_number": int(log["blockNumber"], 16),
+        "block_hash": log["blockHash"],
+        "transaction_hash": log["transactionHash"],
+        "index": int(log["logIndex"], 16),
+        "topics": log["topics"],
+        "data": log["data"],
+        "decoded": {"method_call": _EVENT_SIGNATURES[topic0], "method_id": topic0[2:10], "parameters": parameters},
+    }
+
+
+# =============================================================================
+# HTTP Server
+# =============================================================================
+
+
+class SimulatedChainServer:
+    """SimulatedChain을 JSON-RPC(POST /)와 Blockscout API(GET /api/v2/...)로 제공"""
+
+    def __init__(self, chain: SimulatedChain, host: str = "127.0.0.1", port: int = 0):
+        self.chain = chain
+        self.request_counts: dict[str, int] = {}
+        self._rnd = random.Random(chain.config.seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def blockscout_api_url(self) -> str:
+        return f"{self.url}/api/v2"
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.request_counts[key] = self.request_counts.get(key, 0) + 1
+
+    def _should_fail(self) -> bool:
+        rate = self.chain.config.failure_rate
+        with self._lock:
+            return rate > 0 and self._rnd.random() < rate
+
+    def _rpc(self, request: dict) -> dict:
+        method = request.get("method")
+        params = request.get("params") or []
+        self._count(f"rpc.{method}")
+        chain = self.chain
+        try:
+            if method == "eth_blockNumber":
+                result: Any = hex(chain.head)
+            elif method == "eth_chainId":
+                result = "0x539"
+            elif method == "net_version":
+                result = "1337"
+            elif method == "web3_clientVersion":
+                result = "SimulatedChain/1.0"
+            elif method == "eth_call":
+                tx = params[0]
+                result = "0x" + chain.call(tx["to"], tx.get("data") or tx.get("input") or "0x").hex()
+            elif method == "eth_getLogs":
+                result = chain.get_logs(params[0])
+            elif method == "eth_getBlockByNumber":
+                result = chain.get_block(_block_param(params[0], chain.head))
+            else:
+                return {"jsonrpc": "2.0", "id": request.get("id"),
+                        "error": {"code": -32601, "message": f"method not found: {method}"}}
+        except ValueError as e:
+            return {"jsonrpc": "2.0", "id": request.get("id"),
+                    "error": {"code": 3, "message": str(e), "data": "0x"}}
+        return {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+
+    def _handler(self):
+        sim = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+            wbufsize = 1 << 16
+
+            def _send(self, status: int, payload: Any = None) -> None:
+                body = json.dumps(payload).encode() if payload is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                sim._count("http")
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                time.sleep(sim.chain.config.rpc_latency)
+                if sim._should_fail():
+                    self._send(503)
+                    return
+                if isinstance(body, list):
+                    sim._count("rpc.batch")
+                    self._send(200, [sim._rpc(r) for r in body])
+                else:
+                    self._send(200, sim._rpc(body))
+
+            def do_GET(self):
+                sim._count("http")
+                parts = urlsplit(self.path)
+                segments = parts.path.strip("/").split("/")
+                if segments == ["api", "v2", "main-page", "blocks"]:
+                    sim._count("blockscout.blocks")
+                    time.sleep(sim.chain.config.blockscout_latency)
+                    self._send(200, [{"height": sim.chain.blockscout_block}])
+                    return
+                if segments[:3] != ["api", "v2", "addresses"] or segments[-1] != "logs":
+                    self._send(404, {"message": "Not found"})
+                    return
+                sim._count("blockscout.logs_page")
+                time.sleep(sim.chain.config.blockscout_latency)
+                if sim._should_fail():
+                    self._send(503)
+                    return
+                query = parse_qs(parts.query)
+                offset = int(query.get("items_count", ["0"])[0])
+                self._send(200, sim.chain.blockscout_logs(segments[3], offset))
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "SimulatedChainServer":
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _serve_in_process(config: SimConfig, conn) -> None:
+    server = SimulatedChainServer(SimulatedChain(config)).start()
+    conn.send(server.url)
+    while True:
+        command = conn.recv()
+        if command == "counts":
+            conn.send(dict(server.request_counts))
+        elif command == "reset":
+            server.request_counts.clear()
+            conn.send(None)
+        else:
+            server.stop()
+            conn.send(None)
+            return
+
+
+class SimulatedChainProcess:
+    """별도 프로세스에서 실행되는 시뮬레이션 서버 (측정 대상 프로세스의 메모리/CPU와 분리)"""
+
+    def __init__(self, config: SimConfig):
+        self.config = config
+        self.chain = SimulatedChain(config)  # 주소/지갑 목록 참조용 (서버 프로세스와 동일 seed)
+        self._conn, child_conn = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_serve_in_process, args=(config, child_conn), daemon=True
+        )
+        self._process.start()
+        self.url = self._conn.recv()
+        self.blockscout_api_url = f"{self.url}/api/v2"
+
+    def request_counts(self) -> dict[str, int]:
+        self._conn.send("counts")
+        return self._conn.recv()
+
+    def reset_counts(self) -> None:
+        self._conn.send("reset")
+        self._conn.recv()
+
+    def stop(self) -> None:
+        self._conn.send("stop")
+        self._conn.recv()
+        self._process.join(timeout=5)
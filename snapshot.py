@@ -0,0 +1,306 @@
+"""
+Scan Snapshots
+
+스캔 결과를 (컨트랙트, 캠페인, 지갑) 인덱스로 저장한 스냅샷입니다.
+파일은 컨트랙트/캠페인/지갑 목록을 한 번만 저장하고 리워드는 인덱스로 참조하는 compact JSON입니다.
+
+- 다음 스캔은 이전 스냅샷에서 수령 완료(claimed)된 항목을 재사용해 RPC 조회를 건너뜁니다.
+  (claimed 상태인 계정은 컨트랙트에서 더 이상 수정할 수 없음)
+- 새 스냅샷을 만들면서 이전 스냅샷과 다른 항목을 함께 기록하므로, diff는 변경된 항목 수에 비례합니다.
+- 파일 이름이 .snap으로 끝나면 memory-mapped 바이너리 형식(mapped_snapshot.py)으로 저장하고 읽습니다.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from scan_result import ScanResult, normalize_campaign_hash
+from settings import SNAPSHOT_DIR, SNAPSHOT_FORMAT
+
+if TYPE_CHECKING:
+    from mapped_snapshot import MappedSnapshot
+
+SNAPSHOT_VERSION = 1
+MAPPED_SNAPSHOT_SUFFIX = ".snap"
+
+
+def default_snapshot_path(network: str) -> Path:
+    """네트워크의 기본 스냅샷 경로 (SNAPSHOT_FORMAT에 따라 .snap 또는 .json)"""
+    suffix = MAPPED_SNAPSHOT_SUFFIX if SNAPSHOT_FORMAT == "mapped" else ".json"
+    return Path(SNAPSHOT_DIR) / f"{network}{suffix}"
+
+
+class RewardState(NamedTuple):
+    """스냅샷에 저장된 리워드 상태 (RewardInfo와 필드 순서 동일)"""
+
+    total_reward: int
+    bonus_reward: int
+    claimed: bool
+    required_additional_verification: bool
+
+
+class CampaignState(NamedTuple):
+    """스냅샷에 저장된 캠페인 상태"""
+
+    token: str
+    deadline: int
+
+
+class Change(NamedTuple):
+    """이전 스냅샷 대비 변경 사항 하나"""
+
+    kind: str  # new_campaign, new_reward, reward_changed, claimed, verification_required, deadline_soon, removed_reward
+    contract_address: str
+    campaign_hash: str  # 0x 없는 소문자 hex
+    wallet_address: str | None = None
+    old: Any = None  # 이전 금액 (최소 단위)
+    new: Any = None  # 새 금액 (DEADLINE_CHANGE_KINDS는 마감 시간)
+
+
+# new가 금액이 아니라 캠페인 마감 시간인 변경 종류
+DEADLINE_CHANGE_KINDS = frozenset({"new_campaign", "deadline_soon"})
+
+
+RewardKey = tuple[str, str, str]  # (컨트랙트, 캠페인 키, 소문자 지갑 주소)
+CampaignKey = tuple[str, str]  # (컨트랙트, 캠페인 키)
+
+
+def reward_key(contract_address: str, campaign_hash: str, wallet_address: str) -> RewardKey:
+    return (contract_address, normalize_campaign_hash(campaign_hash), wallet_address.lower())
+
+
+class Snapshot:
+    """(컨트랙트, 캠페인, 지갑) 인덱스를 가진 스캔 결과 스냅샷"""
+
+    def __init__(self, network: str, latest_block: int | None = None, scanned_at: float | None = None):
+        self.network = network
+        self.latest_block = latest_block
+        self.scanned_at = scanned_at if scanned_at is not None else time.time()
+        self.campaigns: dict[CampaignKey, CampaignState] = {}
+        self.rewards: dict[RewardKey, RewardState] = {}
+        self.wallet_names: dict[str, str] = {}  # 소문자 주소 -> 지갑 이름
+        self.deadlines: dict[str, int] = {}  # 캠페인 키 -> 마감 시간
+        self.unclaimed: dict[str, list[RewardKey]] = {}  # 캠페인 키 -> 미수령 리워드
+        # from_result에서 채움: 이전 스냅샷과 다른 항목
+        self.changed_campaigns: list[CampaignKey] = []
+        self.changed_rewards: list[RewardKey] = []
+        self._matched_rewards = 0
+
+    # =========================================================================
+    # Lookup
+    # =========================================================================
+
+    def final_reward(self, contract_address: str, campaign_hash: str, wallet_address: str) -> RewardState | None:
+        """더 이상 바뀌지 않는(claimed) 리워드 상태 (없으면 None)"""
+        state = self.rewards.get(reward_key(contract_address, campaign_hash, wallet_address))
+        return state if state is not None and state.claimed else None
+
+    # =========================================================================
+    # Build
+    # =========================================================================
+
+    @classmethod
+    def from_result(cls, result: ScanResult, previous: "Snapshot | None" = None) -> "Snapshot":
+        """스캔 결과로 스냅샷 생성 (previous와 다른 항목을 함께 기록)
+
+        재시도 후에도 실패한 리워드 조회는 previous의 값을 그대로 이어받아
+        일시적 오류가 변경 사항(삭제)으로 보고되지 않도록 합니다.
+        """
+        snapshot = cls(result.network, result.latest_block, result.started_at)
+        snapshot.wallet_names = {addr.lower(): name for name, addr in result.wallets.items()}
+
+        for campaign in result.campaigns:
+            key = normalize_campaign_hash(campaign["campaign_hash"])
+            snapshot.deadlines[key] = campaign["deadline"]
+            snapshot._add_campaign(
+                (campaign["contract_address"], key),
+                CampaignState(campaign["token"], campaign["deadline"]),
+                previous,
+            )
+
+        for _, rewards in result.campaigns_with_rewards:
+            for reward in rewards:
+                snapshot._add_reward(
+                    reward_key(reward["contract_address"], reward["campaign_hash"], reward["wallet_address"]),
+                    RewardState(
+                        reward["total_reward"],
+                        reward["bonus_reward"],
+                        reward["claimed"],
+                        reward["required_additional_verification"],
+                    ),
+                    previous,
+                )
+
+        if previous is not None:
+            for letter in result.failed:
+                unit = letter.unit
+                if getattr(unit, "by_name", True):
+                    continue
+                key = reward_key(unit.contract_address, unit.campaign, unit.wallet_address)
+                state = previous.rewards.get(key)
+                if state is not None and key not in snapshot.rewards:
+                    snapshot._add_reward(key, state, previous)
+        return snapshot
+
+    def _add_campaign(self, key: CampaignKey, state: CampaignState, previous: "Snapshot | None") -> None:
+        if key in self.campaigns:
+            return
+        self.campaigns[key] = state
+        if previous is not None and key not in previous.campaigns:
+            self.changed_campaigns.append(key)
+
+    def _add_reward(self, key: RewardKey, state: RewardState, previous: "Snapshot | None") -> None:
+        if key in self.rewards:
+            return
+        self.rewards[key] = state
+        if not state.claimed:
+            self.unclaimed.setdefault(key[1], []).append(key)
+        if previous is None:
+            return
+        old = previous.rewards.get(key)
+        if old is not None:
+            self._matched_rewards += 1
+        if old != state:
+            self.changed_rewards.append(key)
+
+    # =========================================================================
+    # Diff
+    # =========================================================================
+
+    def diff(self, previous: "Snapshot", deadline_window: float, now: float | None = None) -> list[Change]:
+        """previous 대비 변경 사항 (from_result(result, previous)로 만든 스냅샷 기준)
+
+        Args:
+            deadline_window: 미수령 리워드의 마감이 이 시간(초) 안으로 들어오면 deadline_soon으로 보고
+        """
+        now = now if now is not None else time.time()
+        changes = []
+
+        for contract, campaign in self.changed_campaigns:
+            state = self.campaigns[(contract, campaign)]
+            changes.append(Change("new_campaign", contract, campaign, new=state.deadline))
+
+        for key in self.changed_rewards:
+            contract, campaign, wallet = key
+            new = self.rewards[key]
+            old = previous.rewards.get(key)
+            if old is None:
+                changes.append(Change("new_reward", contract, campaign, wallet, new=new.total_reward))
+                continue
+            if (old.total_reward, old.bonus_reward) != (new.total_reward, new.bonus_reward):
+                changes.append(
+                    Change("reward_changed", contract, campaign, wallet, old.total_reward, new.total_reward)
+                )
+            if new.claimed and not old.claimed:
+                changes.append(Change("claimed", contract, campaign, wallet, new=new.total_reward))
+            if new.required_additional_verification and not old.required_additional_verification:
+                changes.append(Change("verification_required", contract, campaign, wallet))
+
+        # 이전 리워드가 모두 새 스냅샷에 있으면 삭제 확인 생략
+        if self._matched_rewards < len(previous.rewards):
+            for key in previous.rewards.keys() - self.rewards.keys():
+                contract, campaign, wallet = key
+                changes.append(
+                    Change("removed_reward", contract, campaign, wallet, old=previous.rewards[key].total_reward)
+                )
+
+        # 지난 스냅샷 이후 마감 임박 구간으로 들어온 미수령 리워드
+        for campaign, deadline in self.deadlines.items():
+            if now < deadline <= now + deadline_window and deadline > previous.scanned_at + deadline_window:
+                for contract, _, wallet in self.unclaimed.get(campaign, ()):
+                    changes.append(Change("deadline_soon", contract, campaign, wallet, new=deadline))
+        return changes
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def to_dict(self) -> dict:
+        """compact JSON 형식 (목록 + 인덱스 참조)"""
+        contracts = sorted({key[0] for key in self.campaigns} | {key[0] for key in self.rewards})
+        contract_index = {addr: i for i, addr in enumerate(contracts)}
+        campaigns = sorted({key[1] for key in self.campaigns} | {key[1] for key in self.rewards})
+        campaign_index = {h: i for i, h in enumerate(campaigns)}
+        wallets = sorted({key[2] for key in self.rewards})
+        wallet_index = {addr: i for i, addr in enumerate(wallets)}
+
+        return {
+            "version": SNAPSHOT_VERSION,
+            "network": self.network,
+            "latest_block": self.latest_block,
+            "scanned_at": self.scanned_at,
+            "contracts": contracts,
+            "campaign_hashes": campaigns,
+            "deadlines": [self.deadlines.get(h, 0) for h in campaigns],
+            "wallets": [[addr, self.wallet_names.get(addr, "")] for addr in wallets],
+            "campaigns": [
+                [contract_index[c], campaign_index[h], state.token]
+                for (c, h), state in self.campaigns.items()
+            ],
+            "rewards": [
+                [
+                    contract_index[c],
+                    campaign_index[h],
+                    wallet_index[w],
+                    state.total_reward,
+                    state.bonus_reward,
+                    int(state.claimed),
+                    int(state.required_additional_verification),
+                ]
+                for (c, h, w), state in self.rewards.items()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Snapshot":
+        snapshot = cls(data["network"], data["latest_block"], data["scanned_at"])
+        contracts = data["contracts"]
+        campaigns = data["campaign_hashes"]
+        wallets = [addr for addr, _ in data["wallets"]]
+        snapshot.wallet_names = {addr: name for addr, name in data["wallets"]}
+        snapshot.deadlines = dict(zip(campaigns, data["deadlines"]))
+        for ci, hi, token in data["campaigns"]:
+            snapshot.campaigns[(contracts[ci], campaigns[hi])] = CampaignState(
+                token, snapshot.deadlines[campaigns[hi]]
+            )
+        for ci, hi, wi, total, bonus, claimed, verification in data["rewards"]:
+            key = (contracts[ci], campaigns[hi], wallets[wi])
+            snapshot.rewards[key] = RewardState(total, bonus, bool(claimed), bool(verification))
+            if not claimed:
+                snapshot.unclaimed.setdefault(key[1], []).append(key)
+        return snapshot
+
+    def save(self, path: str | Path) -> None:
+        """스냅샷 저장 (임시 파일에 쓴 뒤 교체, .snap이면 memory-mapped 형식)"""
+        path = Path(path)
+        if path.suffix == MAPPED_SNAPSHOT_SUFFIX:
+            from mapped_snapshot import write_mapped_snapshot
+
+            write_mapped_snapshot(self, path)
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Snapshot | MappedSnapshot | None":
+        """저장된 스냅샷 로드 (없거나 형식이 다르면 None)
+
+        .snap 파일은 파싱하지 않고 mmap으로 열어 같은 조회 인터페이스의 MappedSnapshot을 반환합니다.
+        """
+        if Path(path).suffix == MAPPED_SNAPSHOT_SUFFIX:
+            from mapped_snapshot import MappedSnapshot
+
+            return MappedSnapshot.open(path)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if data.get("version") != SNAPSHOT_VERSION:
+            return None
+        return cls.from_dict(data)
@@ -0,0 +1,150 @@
+"""
+abi_codec 테스트
+
+손으로 작성한 ABI codec의 인코딩/디코딩 결과를 eth_abi, eth_utils와 비교합니다.
+"""
+
+import random
+
+import pytest
+from eth_abi import decode, encode
+from eth_utils import keccak
+from eth_utils import to_checksum_address as eth_checksum_address
+
+from abi_codec import (
+    EVENTS,
+    FUNCTIONS,
+    AbiDecodeError,
+    decode_columns,
+    decode_log,
+    decode_logs_batch,
+    decode_output,
+    decode_output_batch,
+    encode_call,
+    encode_topic,
+    log_matches,
+    to_checksum_address,
+)
+
+RECORDS = 20
+
+
+@pytest.fixture
+def rnd():
+    return random.Random(1)
+
+
+def _address(rnd: random.Random) -> str:
+    return "0x" + rnd.randbytes(20).hex()
+
+
+def _reward_info(rnd: random.Random) -> tuple:
+    max_amount = 2**120 - 1  # rewardInfoByHash 금액 타입 (uint120) 최대값까지
+    return (rnd.choice([0, max_amount, rnd.randrange(max_amount)]), rnd.randrange(max_amount),
+            rnd.random() < 0.5, rnd.random() < 0.5)
+
+
+def _claimed_log(rnd: random.Random, user: str, campaign_hash: bytes) -> tuple[dict, tuple]:
+    total, fee = rnd.randrange(2**120), rnd.randrange(2**256)
+    log = {
+        "topics": [EVENTS["Claimed"].topic0, encode_topic("address", user), "0x" + campaign_hash.hex()],
+        "data": "0x" + encode(["uint120", "uint256"], [total, fee]).hex(),
+    }
+    return log, (total, fee)
+
+
+def test_checksum_address_matches_eip55(rnd):
+    for _ in range(50):
+        address = _address(rnd)
+        expected = eth_checksum_address(address)
+        assert to_checksum_address(address) == expected
+        assert to_checksum_address(address.upper().replace("0X", "0x")) == expected
+        assert to_checksum_address(bytes.fromhex(address[2:])) == expected
+    for invalid in ("0x1234", "0x" + "zz" * 20, b"\x00" * 19):
+        with pytest.raises(ValueError):
+            to_checksum_address(invalid)
+
+
+def test_encode_call_matches_eth_abi(rnd):
+    fn = FUNCTIONS["rewardInfoByHash"]
+    campaign_hash, wallet = rnd.randbytes(32), _address(rnd)
+    data = encode_call(fn, campaign_hash, wallet)
+    assert data[:10] == "0x" + keccak(text="rewardInfoByHash(bytes32,address)")[:4].hex()
+    assert decode(["bytes32", "address"], bytes.fromhex(data[10:])) == (campaign_hash, wallet)
+
+
+def test_reward_info_round_trip(rnd):
+    fn = FUNCTIONS["rewardInfoByHash"]
+    rewards = [_reward_info(rnd) for _ in range(RECORDS)]
+    results = ["0x" + encode(list(fn.output_types), list(reward)).hex() for reward in rewards]
+
+    for result, reward in zip(results, rewards):
+        assert decode_output(fn, result) == reward
+    assert list(zip(*decode_output_batch(fn, results))) == rewards
+    assert decode_output_batch(fn, []) == ([], [], [], [])
+
+
+def test_campaign_info_and_dynamic_output_round_trip(rnd):
+    fn = FUNCTIONS["campaignInfoByHash"]
+    info = (_address(rnd), rnd.randrange(2**64), rnd.randrange(2**64), True, rnd.randrange(2**256), 0)
+    decoded = decode_output(fn, encode(list(fn.output_types), list(info)))
+    assert decoded == (eth_checksum_address(info[0]), *info[1:])
+
+    fn = FUNCTIONS["tokenCampaigns"]
+    hashes = [rnd.randbytes(32) for _ in range(3)]
+    data = encode(list(fn.output_types), [hashes])
+    assert decode_output(fn, data) == decode(list(fn.output_types), data) == (tuple(hashes),)
+
+
+def test_claimed_logs_round_trip(rnd):
+    event = EVENTS["Claimed"]
+    assert event.topic0 == "0x" + keccak(text="Claimed(address,bytes32,uint120,uint256)").hex()
+    users = [_address(rnd) for _ in range(3)]  # 같은 주소 반복 (checksum 캐시 경로)
+    expected = []
+    logs = []
+    for _ in range(RECORDS):
+        user, campaign_hash = rnd.choice(users), rnd.randbytes(32)
+        log, (total, fee) = _claimed_log(rnd, user, campaign_hash)
+        logs.append(log)
+        expected.append({
+            "user": eth_checksum_address(user),
+            "campaignNameHash": campaign_hash,
+            "totalReward": total,
+            "fee": fee,
+        })
+
+    assert [decode_log(event, log) for log in logs] == expected
+    columns = decode_logs_batch(event, logs)
+    assert [dict(zip(columns, values)) for values in zip(*columns.values())] == expected
+
+
+def test_layout_mismatch_errors(rnd):
+    fn = FUNCTIONS["rewardInfoByHash"]
+    result = "0x" + encode(list(fn.output_types), list(_reward_info(rnd))).hex()
+
+    # 컨트랙트가 없는 주소의 빈 응답, 잘린 응답
+    with pytest.raises(AbiDecodeError):
+        decode_output(fn, "0x")
+    with pytest.raises(AbiDecodeError):
+        decode_output(fn, result[:-2])
+    with pytest.raises(AbiDecodeError, match="expected 256 hex digits"):
+        decode_output_batch(fn, [result, result[:-64]])
+    with pytest.raises(AbiDecodeError, match="not a multiple"):
+        decode_columns(fn.output_types, bytes(32 * 5))
+    with pytest.raises(AbiDecodeError, match="fixed layout"):
+        decode_columns(("uint256", "string"), bytes(64))
+
+    event = EVENTS["Claimed"]
+    log, _ = _claimed_log(rnd, _address(rnd), rnd.randbytes(32))
+    assert log_matches(event, log["topics"], log["data"])
+    wrong_topic = {**log, "topics": [EVENTS["RewardsAdded"].topic0, *log["topics"][1:]]}
+    missing_topic = {**log, "topics": log["topics"][:2]}
+    short_data = {**log, "data": log["data"][:-64]}
+    for bad in (wrong_topic, missing_topic, short_data):
+        assert not log_matches(event, bad["topics"], bad["data"])
+        with pytest.raises(AbiDecodeError, match="does not match"):
+            decode_logs_batch(event, [log, bad])
+    with pytest.raises(AbiDecodeError, match="expected 3 topics"):
+        decode_log(event, missing_topic)
+    with pytest.raises(AbiDecodeError):
+        decode_log(event, short_data)
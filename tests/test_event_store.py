@@ -0,0 +1,94 @@
+"""
+이벤트 저장소 reorg 처리 테스트
+
+in-process simulated_chain.SimulatedChainServer에서 수집한 뒤 SimulatedChain.reorg()로 최근 블록을 교체하고,
+다시 수집했을 때 갈라진 블록 이후만 되돌려 새로 수집한 저장소와 같아지는지 확인합니다.
+"""
+
+import pytest
+
+import main
+from event_store import EventStore
+from main import AirdropMonitor
+from request_scheduler import endpoint_key
+from simulated_chain import SimConfig, SimulatedChain, SimulatedChainServer
+
+CONFIRMATIONS = 10  # 시뮬레이션 체인의 head(수십 블록)보다 작게 해 확정 구간이 생기도록 함
+
+
+@pytest.fixture
+def server():
+    server = SimulatedChainServer(SimulatedChain(SimConfig())).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(autouse=True)
+def confirmations(monkeypatch):
+    monkeypatch.setattr(main, "EVENT_CONFIRMATIONS", CONFIRMATIONS)
+
+
+def _monitor(server: SimulatedChainServer) -> AirdropMonitor:
+    monitor = AirdropMonitor(
+        network="testnet",
+        rpc_urls=[server.url],
+        contract_addresses=server.chain.contract_addresses,
+        blockscout_api_url=server.blockscout_api_url,
+    )
+    monitor.scheduler.rate_limits[endpoint_key(server.url)] = (1e9, 1_000_000)
+    return monitor
+
+
+def _rows(store: EventStore) -> dict[str, set[tuple]]:
+    """이벤트별 행 집합 (수집 순서와 무관하게 비교)"""
+    return {event: set(zip(*columns.values())) for event, columns in store.columns.items()}
+
+
+def _block(row: tuple) -> int:
+    return row[-3]  # block_number, log_index, tx_hash 순
+
+
+def test_no_reorg_checks_newest_hash_only(server):
+    monitor = _monitor(server)
+    store = EventStore("testnet")
+    head = server.chain.head
+    monitor.ingest_events(store, head)
+    assert store.confirmed_block == head - CONFIRMATIONS
+    assert store.block_hashes and min(store.block_hashes) > store.confirmed_block
+
+    server.request_counts.clear()
+    assert monitor.check_reorg(store) is None
+    assert server.request_counts == {"http": 1, "rpc.batch": 1, "rpc.eth_getBlockByNumber": 1}
+
+
+def test_reorg_rolls_back_from_fork_and_matches_fresh_ingest(server):
+    chain = server.chain
+    monitor = _monitor(server)
+    store = EventStore("testnet")
+    monitor.ingest_events(store, chain.head)
+    before = _rows(store)
+
+    fork_block = chain.reorg(depth=5)
+    assert fork_block > store.confirmed_block
+    chain.add_campaign(chain.contract_addresses[0], "After Reorg")
+
+    result = monitor.ingest_events(store, chain.head)
+    assert result.reorg_block == fork_block and result.removed > 0
+    after = _rows(store)
+    for event, rows in before.items():
+        removed = rows - after[event]
+        assert all(_block(row) >= fork_block for row in removed)
+        # 갈라진 블록 이전 이벤트는 그대로 유지
+        assert {row for row in rows if _block(row) < fork_block} <= after[event]
+    assert result.removed == sum(
+        1 for rows in before.values() for row in rows if _block(row) >= fork_block
+    )
+    assert store.confirmed_block == chain.head - CONFIRMATIONS
+    assert min(store.block_hashes) > store.confirmed_block
+
+    fresh = EventStore("testnet")
+    monitor.ingest_events(fresh, chain.head)
+    assert after == _rows(fresh)
+    assert store.last_block == fresh.last_block
+    assert store.block_times == fresh.block_times
+    assert store.block_hashes == fresh.block_hashes
@@ -0,0 +1,108 @@
+"""
+RpcPool failover / hedging / head 일치 확인 테스트
+
+simulated_chain.SimulatedChainProcess로 느린 노드, 항상 실패하는 노드, head가 뒤처진 노드를 띄워
+RpcPool의 라우팅 동작을 확인합니다.
+"""
+
+import time
+
+import pytest
+
+from rpc_pool import RpcPool
+from settings import RPC_HEDGE_MIN_DELAY
+from simulated_chain import SimConfig, SimulatedChainProcess
+
+SLOW_LATENCY = RPC_HEDGE_MIN_DELAY * 4  # hedge 대기 시간보다 충분히 느린 응답 (초)
+LAG_FILLER_LOGS = 10  # 컨트랙트당 추가 로그 수만큼 head가 앞선 노드
+
+
+@pytest.fixture(scope="module")
+def healthy():
+    sim = SimulatedChainProcess(SimConfig())
+    yield sim
+    sim.stop()
+
+
+@pytest.fixture(scope="module")
+def slow():
+    sim = SimulatedChainProcess(SimConfig(rpc_latency=SLOW_LATENCY))
+    yield sim
+    sim.stop()
+
+
+@pytest.fixture(scope="module")
+def failing():
+    sim = SimulatedChainProcess(SimConfig(failure_rate=1.0))
+    yield sim
+    sim.stop()
+
+
+@pytest.fixture(scope="module")
+def ahead():
+    sim = SimulatedChainProcess(SimConfig(filler_logs=LAG_FILLER_LOGS))
+    yield sim
+    sim.stop()
+
+
+def _http_requests(sim: SimulatedChainProcess) -> int:
+    return sim.request_counts().get("http", 0)
+
+
+def test_slow_endpoint_triggers_hedge(slow, healthy):
+    pool = RpcPool([slow.url, healthy.url], head_check_interval=3600)
+    pool.check_head_agreement()
+    slow_stats, fast_stats = pool.endpoints
+    assert slow_stats.latency >= SLOW_LATENCY > fast_stats.latency
+    # 측정된 지연시간으로는 빠른 노드가 먼저 선택됨
+    assert pool.ranked_endpoints()[0] is fast_stats
+
+    # 아직 측정되지 않은 노드처럼 만들어 느린 노드가 primary가 되도록 함
+    slow_stats.latency = None
+    assert pool.ranked_endpoints()[0] is slow_stats
+
+    start = time.perf_counter()
+    assert pool.block_number() == healthy.chain.head
+    elapsed = time.perf_counter() - start
+
+    assert pool.hedged_requests == 1
+    assert RPC_HEDGE_MIN_DELAY <= elapsed < SLOW_LATENCY
+
+
+def test_failing_endpoint_is_ejected(failing, healthy):
+    pool = RpcPool([failing.url, healthy.url], head_check_interval=3600)
+    for _ in range(5):
+        assert pool.block_number() == healthy.chain.head  # 실패한 노드 대신 다음 노드로 failover
+
+    failing_stats, healthy_stats = pool.endpoints
+    assert failing_stats.errors >= 3
+    assert not failing_stats.is_healthy(time.monotonic())
+    assert pool.ranked_endpoints() == [healthy_stats, failing_stats]
+
+    # cooldown 중에는 실패한 노드로 요청을 보내지 않음
+    failing.reset_counts()
+    for _ in range(3):
+        assert pool.block_number() == healthy.chain.head
+    assert _http_requests(failing) == 0
+
+
+def test_lagging_head_is_excluded(healthy, ahead):
+    lag = ahead.chain.head - healthy.chain.head
+    assert lag == LAG_FILLER_LOGS * SimConfig().contracts
+
+    pool = RpcPool([healthy.url, ahead.url], max_block_lag=lag - 1, head_check_interval=3600)
+    heads = pool.check_head_agreement()
+    assert heads == {healthy.url: healthy.chain.head, ahead.url: ahead.chain.head}
+
+    behind_stats, ahead_stats = pool.endpoints
+    assert behind_stats.lagging and not ahead_stats.lagging
+    assert pool.ranked_endpoints() == [ahead_stats, behind_stats]
+
+    healthy.reset_counts()
+    assert pool.block_number() == ahead.chain.head
+    assert _http_requests(healthy) == 0
+
+    # 허용 범위 안의 지연은 제외하지 않음
+    pool.max_block_lag = lag
+    pool.check_head_agreement()
+    assert not behind_stats.lagging
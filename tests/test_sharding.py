@@ -0,0 +1,86 @@
+"""
+샤드 스캔 테스트
+
+simulated_chain.SimulatedChainProcess를 상대로 scan_sharded/merge_shards가 단일 프로세스 스캔과 같은 합계를 내는지 확인합니다.
+"""
+
+import json
+
+import pytest
+
+from main import AirdropMonitor
+from request_scheduler import endpoint_key
+from sharding import create_plan, merge_shards, scan_shard, scan_sharded
+from simulated_chain import SimConfig, SimulatedChainProcess
+from snapshot import MAPPED_SNAPSHOT_SUFFIX, Snapshot
+
+
+@pytest.fixture(scope="module")
+def sim():
+    sim = SimulatedChainProcess(SimConfig())
+    yield sim
+    sim.stop()
+
+
+def _monitor(sim: SimulatedChainProcess) -> AirdropMonitor:
+    monitor = AirdropMonitor(
+        network="testnet",
+        rpc_urls=[sim.url],
+        contract_addresses=sim.chain.contract_addresses,
+        blockscout_api_url=sim.blockscout_api_url,
+    )
+    for url in (sim.url, sim.blockscout_api_url):
+        monitor.scheduler.rate_limits[endpoint_key(url)] = (1e9, 1_000_000)
+    return monitor
+
+
+def _totals(result) -> dict:
+    """전체/지갑별 합계 (비교용)"""
+    def values(totals):
+        return tuple(getattr(totals, field) for field in ("total_reward", "bonus_reward", "claimed", "unclaimed"))
+
+    return {
+        "total": values(result.totals),
+        "wallets": {name: values(totals) for name, totals in result.wallet_totals.items()},
+        "rewards": result.reward_count,
+    }
+
+
+def test_scan_sharded_with_mapped_previous_snapshot(sim, tmp_path):
+    wallets = sim.chain.wallets
+    monitor = _monitor(sim)
+    latest_block = monitor.block_number()
+    single = monitor.scan(wallets, latest_block=latest_block)
+    assert single.reward_count > 0
+
+    path = tmp_path / f"testnet{MAPPED_SNAPSHOT_SUFFIX}"
+    Snapshot.from_result(single).save(path)
+    previous = Snapshot.load(path)
+    assert type(previous).__name__ == "MappedSnapshot"
+
+    sharded = scan_sharded(_monitor(sim), wallets, 2, latest_block=latest_block, previous=previous)
+    assert _totals(sharded) == _totals(single)
+    # worker가 .snap 파일을 직접 열어 수령 완료 리워드를 재사용
+    assert sharded.reused_rewards == sum(state.claimed for state in previous.rewards.values())
+    assert not sharded.failed
+
+
+def test_merge_shards_matches_single_scan(sim):
+    wallets = sim.chain.wallets
+    monitor = _monitor(sim)
+    latest_block = monitor.block_number()
+    single = monitor.scan(wallets, latest_block=latest_block)
+
+    plan = create_plan(_monitor(sim), 3, latest_block)
+    # 여러 머신에서처럼 결과를 JSON 파일 형식으로 주고받음
+    shards = [json.loads(json.dumps(scan_shard(plan, index, wallets))) for index in range(plan.shard_count)]
+    merged = merge_shards(plan, wallets, shards + shards[:1])  # 같은 샤드가 두 번 들어와도 한 번만 반영
+    assert _totals(merged) == _totals(single)
+    assert [campaign["campaign_hash"] for campaign, _ in merged.campaigns_with_rewards] == [
+        campaign["campaign_hash"] for campaign, _ in single.campaigns_with_rewards
+    ]
+
+    with pytest.raises(ValueError, match="Missing shard result"):
+        merge_shards(plan, wallets, shards[1:])
+    with pytest.raises(ValueError, match="out of range"):
+        merge_shards(plan, wallets, shards + [{**shards[0], "shard": plan.shard_count}])